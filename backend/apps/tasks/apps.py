@@ -5,3 +5,54 @@ class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tasks"
     verbose_name = "Управление задачами"
+
+    def ready(self):
+        from apps.users.infrastructure.signals import user_updated
+        from django.conf import settings
+        from django.core import checks
+        from django.db.models.signals import post_delete, post_save, pre_delete
+
+        from .infrastructure.cache import (
+            check_cache_backend,
+            forget_missing_task,
+            invalidate_on_user_change,
+        )
+        from .infrastructure.models import TaskModel
+        from .infrastructure.signals import (
+            collect_commented_tasks,
+            recount_commented_tasks,
+        )
+
+        # Пользователи встроены в представления задач
+        post_save.connect(
+            invalidate_on_user_change,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="tasks_cache_user_post_save",
+        )
+        post_delete.connect(
+            invalidate_on_user_change,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="tasks_cache_user_post_delete",
+        )
+        # Репозиторий пользователей изменяет поля UPDATE без post_save
+        user_updated.connect(
+            invalidate_on_user_change,
+            dispatch_uid="tasks_cache_user_updated",
+        )
+        # Комментарии удаляются каскадом вместе с автором
+        pre_delete.connect(
+            collect_commented_tasks,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="tasks_comment_counters_user_pre_delete",
+        )
+        post_delete.connect(
+            recount_commented_tasks,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="tasks_comment_counters_user_post_delete",
+        )
+        post_save.connect(
+            forget_missing_task,
+            sender=TaskModel,
+            dispatch_uid="tasks_negative_cache_post_save",
+        )
+        checks.register(check_cache_backend, checks.Tags.caches)
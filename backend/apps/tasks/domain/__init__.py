@@ -3,12 +3,30 @@ Domain слой для управления задачами.
 Содержит бизнес-логику и интерфейсы, независимые от внешних фреймворков.
 """
 
-from .entities import Task, TaskComment, TaskStatus
+from .entities import (
+    BulkItemResult,
+    BulkUpdateResult,
+    CursorPageRequest,
+    Page,
+    PageCursor,
+    PageRequest,
+    Task,
+    TaskComment,
+    TaskFilter,
+    TaskStatus,
+)
 from .interfaces import CommentRepositoryInterface, TaskRepositoryInterface
 
 __all__ = [
+    "BulkItemResult",
+    "BulkUpdateResult",
+    "CursorPageRequest",
+    "Page",
+    "PageCursor",
+    "PageRequest",
     "Task",
     "TaskComment",
+    "TaskFilter",
     "TaskStatus",
     "TaskRepositoryInterface",
     "CommentRepositoryInterface",
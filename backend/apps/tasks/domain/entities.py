@@ -6,11 +6,13 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import FrozenSet, Generic, List, Optional, Tuple, TypeVar
 
 from apps.users.domain.entities import User
 from django.utils import timezone
 
+T = TypeVar("T")
+
 
 class TaskStatus(Enum):
     """Статусы задач."""
@@ -48,6 +50,9 @@ class Task:
     assigned_to: Optional[User]
     created_by: User
     comments: List[TaskComment]
+    # Общее число комментариев, если comments содержит только последние
+    comment_count: Optional[int] = None
+    last_comment_at: Optional[datetime] = None
 
     def __post_init__(self):
         """Инициализация после создания объекта."""
@@ -70,3 +75,125 @@ class Task:
         """Назначает задачу пользователю."""
         self.assigned_to = user
         self.updated_at = timezone.now()
+
+
+@dataclass(frozen=True)
+class TaskRow:
+    """Колонки строки задачи без связанных объектов (результат UPDATE)."""
+
+    id: int
+    title: str
+    description: str
+    status: TaskStatus
+    created_at: datetime
+    updated_at: datetime
+    created_by_id: int
+    assigned_to_id: Optional[int]
+    comment_count: int
+    last_comment_at: Optional[datetime]
+
+
+# Поля задачи, которые можно запросить выборочно (порядок представления).
+# Незапрошенные поля частично загруженной задачи равны None.
+TASK_FIELDS: Tuple[str, ...] = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "assigned_to",
+    "created_by",
+    "comment_count",
+    "last_comment_at",
+    "comments",
+)
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Запрос страницы результатов."""
+
+    limit: int
+    offset: int = 0
+    # Последняя страница: offset вычисляется по общему количеству
+    last: bool = False
+    comments_limit: int = 0
+    # Загружаемые поля задачи (None - все)
+    fields: Optional[FrozenSet[str]] = None
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Позиция в выборке, упорядоченной по (-created_at, -id)."""
+
+    created_at: datetime
+    id: int
+
+
+@dataclass(frozen=True)
+class CursorPageRequest:
+    """Запрос страницы после заданной позиции (keyset пагинация)."""
+
+    limit: int
+    after: Optional[PageCursor] = None
+    comments_limit: int = 0
+    fields: Optional[FrozenSet[str]] = None
+
+
+@dataclass
+class Page(Generic[T]):
+    """Страница результатов с общим количеством элементов."""
+
+    items: List[T]
+    total: Optional[int] = None
+    next_cursor: Optional[PageCursor] = None
+
+
+@dataclass
+class BulkItemResult(Generic[T]):
+    """Результат пакетной операции для одного элемента."""
+
+    index: int
+    item: Optional[T] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """Условия отбора задач для пакетных операций."""
+
+    ids: Optional[List[int]] = None
+    status: Optional[TaskStatus] = None
+    assigned_to_id: Optional[int] = None
+    created_by_id: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        """Не задано ни одного условия."""
+        return (
+            self.ids is None
+            and self.status is None
+            and self.assigned_to_id is None
+            and self.created_by_id is None
+        )
+
+
+@dataclass
+class BulkUpdateResult:
+    """Результат пакетного изменения задач."""
+
+    updated: int
+    ids: Optional[List[int]] = None
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    """
+    Версия задачи или списка задач для условных запросов.
+
+    key меняется при любом изменении представления, last_modified -
+    время последнего изменения (None для пустого списка).
+    """
+
+    key: str
+    last_modified: Optional[datetime] = None
@@ -4,24 +4,61 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence
 
-from apps.users.domain.entities import UserId
+from apps.users.domain.entities import User, UserId
 
-from .entities import Task, TaskComment
+from .entities import (
+    BulkUpdateResult,
+    CursorPageRequest,
+    Page,
+    PageRequest,
+    ResourceVersion,
+    Task,
+    TaskComment,
+    TaskFilter,
+    TaskRow,
+    TaskStatus,
+)
 
 
 class TaskRepositoryInterface(ABC):
     """Интерфейс репозитория для работы с задачами."""
 
     @abstractmethod
-    def get_by_id(self, task_id: int) -> Optional[Task]:
-        """Получить задачу по ID."""
+    def get_by_id(
+        self, task_id: int, fields: Optional[FrozenSet[str]] = None
+    ) -> Optional[Task]:
+        """
+        Получить задачу по ID.
+
+        fields - загружаемые поля из TASK_FIELDS (None - все).
+        """
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Task]:
-        """Получить все задачи."""
+    def get_all(
+        self,
+        comments_limit: Optional[int] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> List[Task]:
+        """
+        Получить все задачи.
+
+        comments_limit - сколько последних комментариев загрузить
+        для каждой задачи (None - значение по умолчанию репозитория),
+        fields - загружаемые поля из TASK_FIELDS (None - все).
+        """
+        pass
+
+    @abstractmethod
+    def get_page(self, page_request: PageRequest) -> Page[Task]:
+        """Получить страницу задач."""
+        pass
+
+    @abstractmethod
+    def get_cursor_page(self, page_request: CursorPageRequest) -> Page[Task]:
+        """Получить страницу задач после позиции курсора."""
         pass
 
     @abstractmethod
@@ -40,8 +77,59 @@ class TaskRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def save(self, task: Task) -> Task:
-        """Сохранить задачу."""
+    def save(self, task: Task, fields: Optional[Sequence[str]] = None) -> Task:
+        """Сохранить задачу (только указанные поля, если они заданы)."""
+        pass
+
+    @abstractmethod
+    def bulk_create(self, tasks: List[Task], batch_size: int) -> List[Task]:
+        """Создать задачи пакетными INSERT в одной транзакции."""
+        pass
+
+    @abstractmethod
+    def update_status(self, task_id: int, status: TaskStatus) -> Optional[TaskRow]:
+        """
+        Изменить статус задачи одним UPDATE.
+
+        Возвращает строку задачи после изменения или None, если задачи нет.
+        """
+        pass
+
+    @abstractmethod
+    def update_assignee(
+        self, task_id: int, user_id: Optional[int]
+    ) -> Optional[TaskRow]:
+        """
+        Назначить задачу одним UPDATE.
+
+        Возвращает строку задачи после изменения или None, если задачи нет.
+        """
+        pass
+
+    @abstractmethod
+    def bulk_update(
+        self,
+        task_filter: TaskFilter,
+        batch_size: int,
+        status: Optional[TaskStatus] = None,
+        assigned_to_id: Optional[int] = None,
+        return_ids: bool = False,
+    ) -> BulkUpdateResult:
+        """
+        Изменить статус и/или исполнителя всех задач, подходящих под фильтр.
+
+        assigned_to_id == 0 снимает назначение, None оставляет без изменений.
+        """
+        pass
+
+    @abstractmethod
+    def get_version(self, task_id: int) -> Optional[ResourceVersion]:
+        """Версия задачи без загрузки связанных объектов (None - нет задачи)."""
+        pass
+
+    @abstractmethod
+    def get_list_version(self) -> ResourceVersion:
+        """Версия списка задач одним агрегирующим запросом."""
         pass
 
     @abstractmethod
@@ -63,6 +151,11 @@ class UserRepositoryInterface(ABC):
         """Получить всех пользователей."""
         pass
 
+    @abstractmethod
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """Получить пользователей по списку ID одним запросом."""
+        pass
+
 
 class CommentRepositoryInterface(ABC):
     """Интерфейс репозитория для работы с комментариями."""
@@ -72,6 +165,13 @@ class CommentRepositoryInterface(ABC):
         """Получить комментарии к задаче."""
         pass
 
+    @abstractmethod
+    def get_page_by_task_id(
+        self, task_id: int, page_request: CursorPageRequest
+    ) -> Page[TaskComment]:
+        """Получить страницу комментариев к задаче, начиная с новых."""
+        pass
+
     @abstractmethod
     def save(self, comment: TaskComment) -> TaskComment:
         """Сохранить комментарий."""
@@ -81,3 +181,43 @@ class CommentRepositoryInterface(ABC):
     def delete(self, comment_id: int) -> bool:
         """Удалить комментарий."""
         pass
+
+
+class TaskCacheInterface(ABC):
+    """Интерфейс инвалидации кэша чтения задач."""
+
+    @abstractmethod
+    def invalidate_task(self, task_id: int) -> None:
+        """Задача изменилась: сбросить ее представление и страницы списка."""
+        pass
+
+    @abstractmethod
+    def invalidate_list(self) -> None:
+        """Набор задач изменился: сбросить страницы списка."""
+        pass
+
+    @abstractmethod
+    def invalidate_all(self) -> None:
+        """Сбросить все представления задач."""
+        pass
+
+    @abstractmethod
+    def list_version(self, load: Callable[[], ResourceVersion]) -> ResourceVersion:
+        """Версия списка задач: load() или ее сохраненный результат."""
+        pass
+
+
+class NullTaskCache(TaskCacheInterface):
+    """Кэш, который ничего не хранит (кэширование отключено)."""
+
+    def invalidate_task(self, task_id: int) -> None:
+        pass
+
+    def invalidate_list(self) -> None:
+        pass
+
+    def invalidate_all(self) -> None:
+        pass
+
+    def list_version(self, load: Callable[[], ResourceVersion]) -> ResourceVersion:
+        return load()
@@ -0,0 +1,156 @@
+"""
+Быстрая сериализация доменных объектов в dict.
+
+Дает тот же результат, что DomainTaskSerializer и DomainCommentSerializer,
+но без создания полей и вложенных сериализаторов DRF для каждого объекта.
+Сериализаторы DRF остаются описанием схемы ответа в OpenAPI.
+"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional
+
+from apps.tasks.domain.entities import TASK_FIELDS, Task, TaskComment
+from apps.users.domain.entities import User
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601
+from rest_framework.fields import DateTimeField
+from rest_framework.settings import api_settings
+
+
+def _datetime_formatter() -> Callable[[Optional[datetime]], Any]:
+    """Форматирование datetime так же, как DateTimeField DRF."""
+    output_format = api_settings.DATETIME_FORMAT
+    if output_format is None or output_format.lower() != ISO_8601:
+        return DateTimeField().to_representation
+
+    field_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def format_datetime(value: Optional[datetime]) -> Optional[str]:
+        if not value:
+            return None
+        if field_timezone is not None:
+            if timezone.is_aware(value):
+                value = value.astimezone(field_timezone)
+            else:
+                value = timezone.make_aware(value, field_timezone)
+        elif timezone.is_aware(value):
+            value = timezone.make_naive(value, dt_timezone.utc)
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+def _str_or_none(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class DomainPayloadSerializer:
+    """
+    Сериализатор доменных Task, TaskComment и User в dict.
+
+    Часовой пояс и формат дат определяются один раз на экземпляр,
+    представление пользователя строится один раз на ID. fields ограничивает
+    поля задачи (порядок - как в TASK_FIELDS). С normalize=True ссылки
+    на пользователей заменяются их ID, а сами пользователи собираются
+    в included() - каждый один раз.
+    """
+
+    def __init__(
+        self, fields: Optional[AbstractSet[str]] = None, normalize: bool = False
+    ):
+        self.format_datetime = _datetime_formatter()
+        self._users: Dict[int, Dict[str, Any]] = {}
+        self.fields = (
+            None if fields is None else [name for name in TASK_FIELDS if name in fields]
+        )
+        self.normalize = normalize
+
+    def user(self, user: Optional[User]) -> Any:
+        if user is None:
+            return None
+        data = self._users.get(user.id)
+        if data is None:
+            data = {
+                "id": None if user.id is None else int(user.id),
+                "username": _str_or_none(user.username),
+                "first_name": _str_or_none(user.first_name),
+                "last_name": _str_or_none(user.last_name),
+                "email": _str_or_none(user.email),
+            }
+            self._users[user.id] = data
+        return data["id"] if self.normalize else data
+
+    def included(self) -> Optional[Dict[str, Any]]:
+        """Пользователи, на которые ссылается ответ (только для normalize)."""
+        if not self.normalize:
+            return None
+        # Ключи - строки, как у объектов JSON, в любом формате ответа
+        return {"users": {str(data["id"]): data for data in self._users.values()}}
+
+    def comment(self, comment: TaskComment) -> Dict[str, Any]:
+        return {
+            "id": None if comment.id is None else int(comment.id),
+            "content": _str_or_none(comment.content),
+            "created_at": self.format_datetime(comment.created_at),
+            "author": self.user(comment.author),
+        }
+
+    def comments(self, comments: Iterable[TaskComment]) -> List[Dict[str, Any]]:
+        return [self.comment(comment) for comment in comments]
+
+    def task(self, task: Task) -> Dict[str, Any]:
+        status = task.status
+        comments = task.comments
+        comment_count = task.comment_count
+        data = {
+            "id": None if task.id is None else int(task.id),
+            "title": _str_or_none(task.title),
+            "description": _str_or_none(task.description),
+            "status": status.value
+            if hasattr(status, "value")
+            else _str_or_none(status),
+            "created_at": self.format_datetime(task.created_at),
+            "updated_at": self.format_datetime(task.updated_at),
+            "assigned_to": self.user(task.assigned_to) if task.assigned_to else None,
+            "created_by": self.user(task.created_by) if task.created_by else None,
+            "comment_count": (
+                comment_count if comment_count is not None else len(comments)
+            ),
+            "last_comment_at": self.format_datetime(task.last_comment_at),
+            "comments": self.comments(comments) if comments else [],
+        }
+        if self.fields is None:
+            return data
+        return {name: data[name] for name in self.fields}
+
+    def tasks(self, tasks: Iterable[Task]) -> List[Dict[str, Any]]:
+        return [self.task(task) for task in tasks]
+
+
+def serialize_task(
+    task: Task, fields: Optional[AbstractSet[str]] = None
+) -> Dict[str, Any]:
+    """Представление задачи, совпадающее с DomainTaskSerializer(task).data."""
+    return DomainPayloadSerializer(fields).task(task)
+
+
+def serialize_tasks(
+    tasks: Iterable[Task], fields: Optional[AbstractSet[str]] = None
+) -> List[Dict[str, Any]]:
+    """Представление списка задач с общим кэшем пользователей."""
+    return DomainPayloadSerializer(fields).tasks(tasks)
+
+
+def serialize_comment(comment: TaskComment) -> Dict[str, Any]:
+    """Представление комментария, совпадающее с DomainCommentSerializer."""
+    return DomainPayloadSerializer().comment(comment)
+
+
+def serialize_comments(comments: Iterable[TaskComment]) -> List[Dict[str, Any]]:
+    """Представление списка комментариев."""
+    return DomainPayloadSerializer().comments(comments)
@@ -0,0 +1,176 @@
+"""
+Пагинация для API управления задачами.
+Границы страницы передаются в репозиторий, а не применяются к готовому списку.
+"""
+
+import base64
+import binascii
+import math
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+from apps.tasks.domain.entities import CursorPageRequest, Page, PageCursor, PageRequest
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def encode_cursor(cursor: PageCursor) -> str:
+    """Закодировать позицию курсора в непрозрачную строку."""
+    raw = f"{cursor.created_at.isoformat()}|{cursor.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(value: str) -> PageCursor:
+    """Раскодировать непрозрачную строку курсора."""
+    try:
+        raw = base64.urlsafe_b64decode(value.encode()).decode()
+        created_at, cursor_id = raw.rsplit("|", 1)
+        return PageCursor(
+            created_at=datetime.fromisoformat(created_at), id=int(cursor_id)
+        )
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Неверный курсор: {value}")
+
+
+class DomainPageNumberPagination(PageNumberPagination):
+    """Постраничная пагинация по номеру страницы на уровне репозитория."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_page_request(self, request) -> Optional[PageRequest]:
+        """Построить запрос страницы или None, если пагинация отключена."""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        page_number = request.query_params.get(self.page_query_param) or 1
+        self.request = request
+        self.page_size = page_size
+        if page_number in self.last_page_strings:
+            # Номер последней страницы известен только после COUNT в репозитории
+            self.page_number = None
+            return PageRequest(limit=page_size, last=True)
+        try:
+            page_number = int(page_number)
+            if page_number < 1:
+                raise ValueError
+        except (TypeError, ValueError):
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message="Неверный номер страницы."
+                )
+            )
+
+        self.page_number = page_number
+        return PageRequest(limit=page_size, offset=(page_number - 1) * page_size)
+
+    def check_page(self, page: Page) -> None:
+        """Проверить, что запрошенная страница существует."""
+        self.total = page.total
+        if self.page_number is None:
+            self.page_number = max(math.ceil(page.total / self.page_size), 1)
+        if not page.items and self.page_number > 1:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=self.page_number, message="Страница пуста."
+                )
+            )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.total),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_next_link(self):
+        if self.page_number * self.page_size >= self.total:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+
+class DomainCursorPagination(BasePagination):
+    """
+    Keyset пагинация по (-created_at, -id) на уровне репозитория.
+
+    Включается параметром cursor (пустое значение - первая страница).
+    Не выполняет COUNT, поэтому стоимость любой страницы одинакова.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE or 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    invalid_cursor_message = "Неверный курсор."
+
+    def is_requested(self, request) -> bool:
+        """Запрошен ли курсорный режим."""
+        return self.cursor_query_param in request.query_params
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def get_page_request(self, request) -> CursorPageRequest:
+        """Построить запрос страницы из параметров курсора."""
+        self.request = request
+        value = request.query_params.get(self.cursor_query_param)
+
+        after = None
+        if value:
+            try:
+                after = decode_cursor(value)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+
+        return CursorPageRequest(limit=self.get_page_size(request), after=after)
+
+    def check_page(self, page: Page) -> None:
+        """Запомнить позицию следующей страницы."""
+        self.next_cursor = page.next_cursor
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, encode_cursor(self.next_cursor)
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
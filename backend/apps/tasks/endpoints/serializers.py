@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 
 
@@ -80,6 +81,58 @@ class TaskAssignSerializer(serializers.Serializer):
     )
 
 
+class TaskBulkFilterSerializer(serializers.Serializer):
+    """Условия отбора задач для пакетного изменения."""
+
+    status = serializers.ChoiceField(
+        choices=["pending", "in_progress", "completed", "cancelled"],
+        required=False,
+        help_text="Текущий статус задач",
+    )
+    assigned_to = serializers.IntegerField(
+        required=False, help_text="ID текущего исполнителя задач"
+    )
+    created_by = serializers.IntegerField(required=False, help_text="ID автора задач")
+
+
+class TaskBulkUpdateSerializer(serializers.Serializer):
+    """Сериализатор для пакетного изменения статуса и исполнителя задач."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=settings.TASKS_BULK_MAX_ITEMS,
+        help_text="Список ID задач",
+    )
+    filter = TaskBulkFilterSerializer(
+        required=False, help_text="Условия отбора задач (вместо ids)"
+    )
+    status = serializers.ChoiceField(
+        choices=["pending", "in_progress", "completed", "cancelled"],
+        required=False,
+        help_text="Новый статус задач",
+    )
+    assigned_to = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        help_text="ID нового исполнителя (null - снять назначение)",
+    )
+    return_ids = serializers.BooleanField(
+        required=False, default=False, help_text="Вернуть ID измененных задач"
+    )
+
+    def validate(self, attrs):
+        """Проверка условий отбора и изменений."""
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Укажите либо ids, либо filter.")
+        if "filter" in attrs and not attrs["filter"]:
+            raise serializers.ValidationError("Фильтр не может быть пустым.")
+        if "status" not in attrs and "assigned_to" not in attrs:
+            raise serializers.ValidationError("Укажите status и/или assigned_to.")
+        return attrs
+
+
 class TaskCommentCreateSerializer(serializers.Serializer):
     """Сериализатор для создания комментариев."""
 
@@ -115,6 +168,8 @@ class DomainTaskSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField(read_only=True)
     assigned_to = serializers.SerializerMethodField()
     created_by = serializers.SerializerMethodField()
+    comment_count = serializers.SerializerMethodField()
+    last_comment_at = serializers.DateTimeField(read_only=True, allow_null=True)
     comments = serializers.SerializerMethodField()
 
     def get_status(self, obj):
@@ -135,6 +190,12 @@ class DomainTaskSerializer(serializers.Serializer):
             return None
         return DomainUserSerializer(obj.created_by).data
 
+    def get_comment_count(self, obj):
+        """Получить общее число комментариев к задаче."""
+        if obj.comment_count is not None:
+            return obj.comment_count
+        return len(obj.comments)
+
     def get_comments(self, obj):
         """Получить комментарии к задаче."""
         if not obj.comments:
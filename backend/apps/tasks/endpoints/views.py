@@ -2,15 +2,36 @@
 API представления для управления задачами.
 """
 
-from apps.tasks.domain.entities import TaskStatus
+import hashlib
+from dataclasses import replace
+from typing import Callable, FrozenSet, Optional
+from urllib.parse import urlencode
+
+from apps.tasks.domain.entities import (
+    TASK_FIELDS,
+    ResourceVersion,
+    TaskFilter,
+    TaskStatus,
+)
+from apps.tasks.endpoints.fast_serializers import (
+    DomainPayloadSerializer,
+    serialize_comment,
+    serialize_task,
+)
+from apps.tasks.endpoints.pagination import (
+    DomainCursorPagination,
+    DomainPageNumberPagination,
+)
 from apps.tasks.endpoints.serializers import (
     DomainCommentSerializer,
     DomainTaskSerializer,
     TaskAssignSerializer,
+    TaskBulkUpdateSerializer,
     TaskCommentCreateSerializer,
     TaskCreateSerializer,
     TaskUpdateSerializer,
 )
+from apps.tasks.infrastructure.cache import get_task_cache
 from apps.tasks.infrastructure.models import TaskModel
 from apps.tasks.infrastructure.repositories import (
     DjangoCommentRepository,
@@ -18,7 +39,11 @@ from apps.tasks.infrastructure.repositories import (
 )
 from apps.tasks.services.comment_service import CommentService
 from apps.tasks.services.task_services import TaskService
-from apps.users.infrastructure.repositories import DjangoUserRepository
+from apps.users.infrastructure.cache import get_user_repository
+from config.cache import get_negative_cache
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -28,15 +53,68 @@ from drf_spectacular.utils import (
 )
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 
+def _sorted_query(request) -> str:
+    """Параметры запроса в каноническом порядке."""
+    return urlencode(sorted(request.query_params.lists()), doseq=True)
+
+
+FIELDS_PARAMETERS = [
+    OpenApiParameter(
+        name="fields",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Поля задачи через запятую (id возвращается всегда); "
+        "из БД загружаются только нужные колонки и связи",
+    ),
+    OpenApiParameter(
+        name="exclude",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Поля задачи через запятую, которые не нужно возвращать",
+    ),
+]
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="Получить список задач",
-        description="Возвращает пагинированный список всех задач в системе.",
+        description="Возвращает пагинированный список всех задач в системе. "
+        "Параметр cursor включает keyset пагинацию без подсчета общего "
+        "количества (пустое значение - первая страница).",
         tags=["Задачи"],
+        parameters=[
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Курсор страницы из поля next предыдущего ответа",
+            ),
+            OpenApiParameter(
+                name="comments",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Сколько последних комментариев встроить в каждую "
+                "задачу (по умолчанию 0, максимум 10)",
+            ),
+            *FIELDS_PARAMETERS,
+            OpenApiParameter(
+                name="normalize",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Пользователи в виде ID, данные пользователей - "
+                "один раз в included.users",
+            ),
+        ],
         responses={
             200: DomainTaskSerializer(many=True),
             401: OpenApiResponse(description="Не авторизован"),
@@ -56,8 +134,11 @@ from rest_framework.response import Response
     ),
     retrieve=extend_schema(
         summary="Получить задачу по ID",
-        description="Возвращает детальную информацию о задаче, включая комментарии.",
+        description="Возвращает детальную информацию о задаче, общее число "
+        "комментариев и последние из них. Все комментарии доступны постранично "
+        "через /comments/.",
         tags=["Задачи"],
+        parameters=FIELDS_PARAMETERS,
         responses={
             200: DomainTaskSerializer,
             404: OpenApiResponse(description="Задача не найдена"),
@@ -110,48 +191,258 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     queryset = TaskModel.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = DomainPageNumberPagination
+    cursor_pagination_class = DomainCursorPagination
+    comments_query_param = "comments"
+    max_list_comments = 10
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    normalize_query_param = "normalize"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Инициализация сервисов
-        task_repo = DjangoTaskRepository()
-        user_repo = DjangoUserRepository()
+        task_repo = DjangoTaskRepository(
+            comments_limit=settings.TASKS_DETAIL_COMMENTS_LIMIT,
+            missing=get_negative_cache("tasks:"),
+        )
+        user_repo = get_user_repository()
         comment_repo = DjangoCommentRepository()
-        self.task_service = TaskService(task_repo, user_repo)
-        self.comment_service = CommentService(comment_repo, task_repo, user_repo)
+        # Кэш чтения задач, сбрасываемый сервисами при записи
+        self.read_cache = get_task_cache()
+        self.task_service = TaskService(task_repo, user_repo, self.read_cache)
+        self.comment_service = CommentService(
+            comment_repo, task_repo, user_repo, self.read_cache
+        )
 
     def get_queryset(self):
         """Оптимизированный queryset с предзагрузкой связанных объектов."""
-        return TaskModel.objects.select_related(
-            "assigned_to", "created_by"
-        ).prefetch_related("comments__author")
+        return TaskModel.objects.select_related("assigned_to", "created_by")
+
+    def get_comments_limit(self, request) -> int:
+        """Сколько последних комментариев встроить в элементы списка."""
+        try:
+            comments_limit = int(request.query_params[self.comments_query_param])
+        except (KeyError, ValueError):
+            return 0
+        return max(0, min(comments_limit, self.max_list_comments))
+
+    def _parse_field_names(self, request, param: str) -> FrozenSet[str]:
+        """Имена полей задачи из параметра запроса через запятую."""
+        value = request.query_params.get(param, "")
+        names = frozenset(name.strip() for name in value.split(",") if name.strip())
+        unknown = names.difference(TASK_FIELDS)
+        if unknown:
+            raise ValidationError(
+                {param: f"Неизвестные поля: {', '.join(sorted(unknown))}"}
+            )
+        return names
+
+    def get_fields(self, request) -> Optional[FrozenSet[str]]:
+        """
+        Запрошенные поля задачи (?fields=, ?exclude=) или None для всех.
+
+        id возвращается всегда. Набор передается в репозиторий, который
+        загружает только нужные колонки, связи и комментарии.
+        """
+        if (
+            self.fields_query_param not in request.query_params
+            and self.exclude_query_param not in request.query_params
+        ):
+            return None
+
+        fields = self._parse_field_names(request, self.fields_query_param)
+        if not fields:
+            fields = frozenset(TASK_FIELDS)
+        fields = fields - self._parse_field_names(request, self.exclude_query_param)
+        fields |= {"id"}
+        return None if fields == frozenset(TASK_FIELDS) else fields
+
+    def get_payload_serializer(
+        self, request, fields: Optional[FrozenSet[str]] = None
+    ) -> DomainPayloadSerializer:
+        """
+        Сериализатор ответа списка.
+
+        ?normalize=true заменяет пользователей их ID и добавляет в ответ
+        included.users, где каждый пользователь встречается один раз.
+        """
+        normalize = request.query_params.get(self.normalize_query_param, "")
+        return DomainPayloadSerializer(
+            fields, normalize=normalize.lower() in ("1", "true")
+        )
+
+    def _with_included(
+        self, response: Response, payload: DomainPayloadSerializer
+    ) -> Response:
+        """Добавить в ответ пользователей нормализованного представления."""
+        included = payload.included()
+        if included is not None:
+            response.data["included"] = included
+        return response
+
+    def get_etag(self, request, version: ResourceVersion) -> str:
+        """
+        Сильный ETag ответа.
+
+        Кроме версии данных учитывает формат ответа и параметры запроса
+        (страница, курсор, fields, normalize), от которых зависит тело.
+        """
+        raw = f"{version.key}|{request.accepted_media_type}|{_sorted_query(request)}"
+        return '"%s"' % hashlib.sha1(raw.encode()).hexdigest()
+
+    def get_list_cache_key(self, request) -> Optional[str]:
+        """Ключ страницы списка: ссылки next/previous зависят от URL."""
+        if self.read_cache is None:
+            return None
+        url = request.build_absolute_uri(request.path)
+        return self.read_cache.list_key(f"{url}?{_sorted_query(request)}")
+
+    def get_task_cache_key(self, request, task_id: int) -> Optional[str]:
+        """Ключ задачи: представление зависит от fields/exclude."""
+        if self.read_cache is None:
+            return None
+        return self.read_cache.task_key(task_id, _sorted_query(request))
+
+    def cached_response(
+        self, key: Optional[str], build_response: Callable[[], Response]
+    ) -> Response:
+        """
+        Ответ из кэша чтения или построенный и сохраненный в нем.
+
+        Кэшируются сериализованные данные успешного ответа, поэтому
+        из кэша можно отдать ответ в любом формате. Промах загружается
+        один раз для всех одновременных запросов (см. TaskReadCache).
+        """
+        if key is None:
+            return build_response()
+
+        # Одновременные промахи по ключу загружает только один запрос
+        built = None
+
+        def load():
+            nonlocal built
+            built = build_response()
+            if built.status_code == status.HTTP_200_OK:
+                return built.data
+            return None
+
+        data = self.read_cache.get_or_load(key, load)
+        if built is not None:
+            return built
+        if data is not None:
+            return Response(data)
+        # Загрузивший запрос получил ответ, который не кэшируется (404)
+        return build_response()
+
+    def conditional_response(
+        self,
+        request,
+        version: Optional[ResourceVersion],
+        build_response: Callable[[], Response],
+    ):
+        """
+        Условный GET: 304 по If-None-Match/If-Modified-Since до загрузки задач.
+
+        Версия получается дешевым запросом, доменные объекты и тело ответа
+        строятся только если клиентская копия устарела.
+        """
+        if version is None:
+            return build_response()
+
+        etag = self.get_etag(request, version)
+        last_modified = None
+        if version.last_modified is not None:
+            last_modified = int(version.last_modified.timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = build_response()
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_vary_headers(response, ("Accept",))
+        return response
 
     def list(self, request, *args, **kwargs):
         """Получение списка задач через сервисный слой."""
-        # Используем сервис для получения всех задач
-        tasks = self.task_service.get_all_tasks()
+        return self.conditional_response(
+            request,
+            self.task_service.get_tasks_version(),
+            lambda: self.cached_response(
+                self.get_list_cache_key(request),
+                lambda: self._list_response(request),
+            ),
+        )
+
+    def _list_response(self, request) -> Response:
+        """Страница задач из репозитория."""
+        # Элементы списка содержат comment_count и не более N последних комментариев
+        comments_limit = self.get_comments_limit(request)
+        fields = self.get_fields(request)
+        payload = self.get_payload_serializer(request, fields)
+
+        # Keyset пагинация для клиентов, обходящих весь список
+        cursor_paginator = self.cursor_pagination_class()
+        if cursor_paginator.is_requested(request):
+            page_request = cursor_paginator.get_page_request(request)
+            page = self.task_service.get_tasks_cursor_page(
+                replace(page_request, comments_limit=comments_limit, fields=fields)
+            )
+            cursor_paginator.check_page(page)
+            return self._with_included(
+                cursor_paginator.get_paginated_response(payload.tasks(page.items)),
+                payload,
+            )
 
-        # Используем стандартную пагинацию Django REST Framework
-        page = self.paginate_queryset(tasks)
-        if page is not None:
-            serializer = DomainTaskSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        # Границы страницы передаются в репозиторий и применяются в SQL
+        page_request = self.paginator.get_page_request(request)
+        if page_request is not None:
+            page = self.task_service.get_tasks_page(
+                replace(page_request, comments_limit=comments_limit, fields=fields)
+            )
+            self.paginator.check_page(page)
+            return self._with_included(
+                self.get_paginated_response(payload.tasks(page.items)), payload
+            )
 
-        serializer = DomainTaskSerializer(tasks, many=True)
-        return Response(serializer.data)
+        # Пагинация отключена в настройках
+        tasks = self.task_service.get_all_tasks(
+            comments_limit=comments_limit, fields=fields
+        )
+        data = payload.tasks(tasks)
+        if payload.normalize:
+            return self._with_included(Response({"results": data}), payload)
+        return Response(data)
 
     def retrieve(self, request, *args, **kwargs):
         """Получение задачи через сервисный слой."""
         task_id = int(kwargs["pk"])
-        task = self.task_service.get_task_by_id(task_id)
+        return self.conditional_response(
+            request,
+            self.task_service.get_task_version(task_id),
+            lambda: self.cached_response(
+                self.get_task_cache_key(request, task_id),
+                lambda: self._retrieve_response(request, task_id),
+            ),
+        )
+
+    def _retrieve_response(self, request, task_id: int) -> Response:
+        """Задача из репозитория."""
+        fields = self.get_fields(request)
+        task = self.task_service.get_task_by_id(task_id, fields=fields)
 
         if not task:
             return Response(
                 {"error": "Задача не найдена"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = DomainTaskSerializer(task)
-        return Response(serializer.data)
+        return Response(serialize_task(task, fields))
 
     def update(self, request, *args, **kwargs):
         """Обновление задачи через сервисный слой."""
@@ -178,8 +469,7 @@ class TaskViewSet(viewsets.ModelViewSet):
                 assigned_to_id=assigned_to_id,
             )
             if updated_task:
-                serializer = DomainTaskSerializer(updated_task)
-                return Response(serializer.data)
+                return Response(serialize_task(updated_task))
             else:
                 return Response(
                     {"error": "Задача не найдена"}, status=status.HTTP_404_NOT_FOUND
@@ -213,15 +503,146 @@ class TaskViewSet(viewsets.ModelViewSet):
                 assigned_to_id=serializer.validated_data.get("assigned_to"),
             )
 
-            serializer = DomainTaskSerializer(task)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            return Response(serialize_task(task), status=status.HTTP_201_CREATED)
 
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(
+        summary="Пакетное создание задач",
+        description="Создает список задач одним запросом. Каждый элемент "
+        "валидируется отдельно, корректные задачи сохраняются пакетными INSERT "
+        "в одной транзакции. Ответ содержит результат для каждого элемента.",
+        tags=["Задачи"],
+        request=TaskCreateSerializer(many=True),
+        responses={
+            201: OpenApiResponse(description="Все задачи созданы"),
+            207: OpenApiResponse(description="Часть задач не создана"),
+            400: OpenApiResponse(description="Ни одна задача не создана"),
+            401: OpenApiResponse(description="Не авторизован"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Пакетное создание задач."""
+        items = request.data
+        if not isinstance(items, list):
+            return Response(
+                {"error": "Ожидается список задач"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > settings.TASKS_BULK_MAX_ITEMS:
+            return Response(
+                {
+                    "error": "Слишком много задач в одном запросе "
+                    f"(максимум {settings.TASKS_BULK_MAX_ITEMS})"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Валидируем каждый элемент отдельно, чтобы вернуть ошибки по индексам
+        results = [None] * len(items)
+        valid_indexes = []
+        valid_items = []
+        for index, item in enumerate(items):
+            serializer = TaskCreateSerializer(data=item)
+            if serializer.is_valid():
+                valid_indexes.append(index)
+                valid_items.append(serializer.validated_data)
+            else:
+                results[index] = {"index": index, "errors": serializer.errors}
+
+        try:
+            created = self.task_service.create_tasks(
+                valid_items,
+                created_by_id=request.user.id,
+                batch_size=settings.TASKS_BULK_BATCH_SIZE,
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        for result in created:
+            index = valid_indexes[result.index]
+            if result.error:
+                results[index] = {
+                    "index": index,
+                    "errors": {"assigned_to": [result.error]},
+                }
+            else:
+                results[index] = {"index": index, "id": result.item.id}
+
+        created_count = len(valid_items) - sum(1 for r in created if r.error)
+        failed_count = len(items) - created_count
+        if not failed_count:
+            response_status = status.HTTP_201_CREATED
+        elif created_count:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response(
+            {"created": created_count, "failed": failed_count, "results": results},
+            status=response_status,
+        )
+
+    @extend_schema(
+        summary="Пакетное изменение статуса и исполнителя",
+        description="Изменяет статус и/или исполнителя задач из списка ids или "
+        "подходящих под filter. Изменения применяются порциями UPDATE без "
+        "загрузки задач. Ответ содержит количество измененных задач и, при "
+        "return_ids, их ID.",
+        tags=["Задачи"],
+        request=TaskBulkUpdateSerializer,
+        responses={
+            200: OpenApiResponse(description="Задачи изменены"),
+            400: OpenApiResponse(description="Неверные данные"),
+            401: OpenApiResponse(description="Не авторизован"),
+        },
+    )
+    @bulk.mapping.patch
+    def bulk_update(self, request):
+        """Пакетное изменение статуса и исполнителя задач."""
+        serializer = TaskBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        if "ids" in data:
+            task_filter = TaskFilter(ids=data["ids"])
+        else:
+            filter_data = data["filter"]
+            task_filter = TaskFilter(
+                status=TaskStatus(filter_data["status"])
+                if "status" in filter_data
+                else None,
+                assigned_to_id=filter_data.get("assigned_to"),
+                created_by_id=filter_data.get("created_by"),
+            )
+
+        # 0 в сервисе означает снятие назначения
+        assigned_to_id = None
+        if "assigned_to" in data:
+            assigned_to_id = data["assigned_to"] or 0
+
+        try:
+            result = self.task_service.bulk_update_tasks(
+                task_filter,
+                status=TaskStatus(data["status"]) if "status" in data else None,
+                assigned_to_id=assigned_to_id,
+                batch_size=settings.TASKS_BULK_BATCH_SIZE,
+                return_ids=data["return_ids"],
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response_data = {"updated": result.updated}
+        if result.ids is not None:
+            response_data["ids"] = result.ids
+        return Response(response_data)
+
     @extend_schema(
         summary="Назначить задачу пользователю",
-        description="Назначает задачу конкретному пользователю по его ID.",
+        description="Назначает задачу конкретному пользователю по его ID. "
+        "Ответ содержит comment_count без списка комментариев.",
         tags=["Задачи"],
         request=TaskAssignSerializer,
         responses={
@@ -263,8 +684,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             updated_task = self.task_service.assign_task(int(pk), user_id_int)
 
             if updated_task:
-                serializer = DomainTaskSerializer(updated_task)
-                return Response(serializer.data)
+                return Response(serialize_task(updated_task))
             else:
                 return Response(
                     {"error": "Задача не найдена"}, status=status.HTTP_404_NOT_FOUND
@@ -275,7 +695,8 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         summary="Отметить задачу как выполненную",
-        description="Изменяет статус задачи на 'completed'.",
+        description="Изменяет статус задачи на 'completed'. "
+        "Ответ содержит comment_count без списка комментариев.",
         tags=["Задачи"],
         responses={
             200: DomainTaskSerializer,
@@ -302,8 +723,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             )
 
             if updated_task:
-                serializer = DomainTaskSerializer(updated_task)
-                return Response(serializer.data)
+                return Response(serialize_task(updated_task))
             else:
                 return Response(
                     {"error": "Задача не найдена"}, status=status.HTTP_404_NOT_FOUND
@@ -314,7 +734,8 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         summary="Работа с комментариями к задаче",
-        description="GET: Получает все комментарии к задаче. "
+        description="GET: Получает комментарии к задаче постранично, начиная "
+        "с новых (параметры cursor и page_size). "
         "POST: Создает новый комментарий.",
         tags=["Комментарии"],
         request={"application/json": TaskCommentCreateSerializer},
@@ -331,18 +752,40 @@ class TaskViewSet(viewsets.ModelViewSet):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.PATH,
                 description="ID задачи",
-            )
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Курсор страницы из поля next предыдущего ответа",
+            ),
+            OpenApiParameter(
+                name="normalize",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Пользователи в виде ID, данные пользователей - "
+                "один раз в included.users",
+            ),
         ],
     )
     @action(detail=True, methods=["get", "post"])
     def comments(self, request, pk=None):
         """Получение и создание комментариев к задаче."""
         if request.method == "GET":
-            # Используем сервис для получения комментариев
-            domain_comments = self.comment_service.get_task_comments(int(pk))
+            # Keyset пагинация по индексу (task_id, created_at)
+            paginator = self.cursor_pagination_class()
+            page = self.comment_service.get_task_comments_page(
+                int(pk), paginator.get_page_request(request)
+            )
+            paginator.check_page(page)
 
-            serializer = DomainCommentSerializer(domain_comments, many=True)
-            return Response(serializer.data)
+            payload = self.get_payload_serializer(request)
+            return self._with_included(
+                paginator.get_paginated_response(payload.comments(page.items)),
+                payload,
+            )
 
         elif request.method == "POST":
             serializer = TaskCommentCreateSerializer(data=request.data)
@@ -355,8 +798,10 @@ class TaskViewSet(viewsets.ModelViewSet):
                         author_id=request.user.id,
                     )
 
-                    serializer = DomainCommentSerializer(domain_comment)
-                    return Response(serializer.data, status=status.HTTP_201_CREATED)
+                    return Response(
+                        serialize_comment(domain_comment),
+                        status=status.HTTP_201_CREATED,
+                    )
 
                 except ValueError as e:
                     return Response(
@@ -4,14 +4,49 @@
 
 from django.contrib import admin
 
+from .cache import get_task_cache
 from .models import TaskCommentModel, TaskModel
+from .repositories import DjangoCommentRepository
+
+
+class TaskCacheAdminMixin:
+    """Сброс кэша чтения задач при изменениях через админку."""
+
+    def get_task_id(self, obj) -> int:
+        return obj.pk
+
+    def invalidate_task(self, obj) -> None:
+        cache = get_task_cache()
+        if cache is not None:
+            cache.invalidate_task(self.get_task_id(obj))
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self.invalidate_task(obj)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self.invalidate_task(obj)
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        cache = get_task_cache()
+        if cache is not None:
+            cache.invalidate_all()
 
 
 @admin.register(TaskModel)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(TaskCacheAdminMixin, admin.ModelAdmin):
     """Административный интерфейс для задач."""
 
-    list_display = ["title", "status", "assigned_to", "created_by", "created_at"]
+    list_display = [
+        "title",
+        "status",
+        "assigned_to",
+        "created_by",
+        "comment_count",
+        "created_at",
+    ]
 
     list_filter = ["status", "created_at", "assigned_to", "created_by"]
 
@@ -21,23 +56,78 @@ class TaskAdmin(admin.ModelAdmin):
 
     date_hierarchy = "created_at"
 
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = ["created_at", "updated_at", "comment_count", "last_comment_at"]
 
     fieldsets = (
         ("Основная информация", {"fields": ("title", "description", "status")}),
         ("Назначение", {"fields": ("assigned_to", "created_by")}),
+        ("Комментарии", {"fields": ("comment_count", "last_comment_at")}),
         ("Временные рамки", {"fields": ("created_at", "updated_at")}),
     )
 
+    # Счетчики поддерживает репозиторий комментариев
+    counter_fields = ("comment_count", "last_comment_at")
+
     def get_queryset(self, request):
         """Оптимизация запросов."""
         return super().get_queryset(request).select_related("assigned_to", "created_by")
 
+    def save_model(self, request, obj, form, change):
+        """
+        Сохранить задачу без счетчиков комментариев.
+
+        Значения в форме прочитаны при ее открытии, и полное сохранение
+        затерло бы комментарии, добавленные за это время.
+        """
+        if not change:
+            super().save_model(request, obj, form, change)
+            return
+        obj.save(
+            update_fields=[
+                field.name
+                for field in obj._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        )
+        self.invalidate_task(obj)
+
 
 @admin.register(TaskCommentModel)
-class TaskCommentAdmin(admin.ModelAdmin):
+class TaskCommentAdmin(TaskCacheAdminMixin, admin.ModelAdmin):
     """Административный интерфейс для комментариев."""
 
+    def get_task_id(self, obj) -> int:
+        return obj.task_id
+
+    def recount(self, task_ids) -> None:
+        """Пересчитать счетчики комментариев задач, измененных в обход репозитория."""
+        DjangoCommentRepository().recount(task_ids)
+
+    def save_model(self, request, obj, form, change):
+        # Комментарий можно перенести в другую задачу
+        old_task_id = (
+            TaskCommentModel.objects.filter(pk=obj.pk)
+            .values_list("task_id", flat=True)
+            .first()
+            if change
+            else None
+        )
+        super().save_model(request, obj, form, change)
+        if old_task_id != obj.task_id:
+            self.recount({old_task_id, obj.task_id} - {None})
+            cache = get_task_cache()
+            if old_task_id is not None and cache is not None:
+                cache.invalidate_task(old_task_id)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self.recount([obj.task_id])
+
+    def delete_queryset(self, request, queryset):
+        task_ids = set(queryset.values_list("task_id", flat=True))
+        super().delete_queryset(request, queryset)
+        self.recount(task_ids)
+
     list_display = ["task", "author", "content_preview", "created_at"]
 
     list_filter = ["created_at", "author"]
@@ -0,0 +1,266 @@
+"""
+Кэш чтения задач.
+
+Сериализованные задача и страницы списка хранятся в кэше Django под ключами,
+включающими счетчики версий. Запись увеличивает счетчик (O(1)), и старые
+записи больше не читаются, а вытесняются кэшем по таймауту.
+
+Промах по популярному ключу загружается один раз: одновременные запросы
+в процессе объединяются (SingleFlight), а между процессами загрузку
+выполняет владелец короткой блокировки в общем кэше.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from apps.tasks.domain.entities import ResourceVersion
+from apps.tasks.domain.interfaces import TaskCacheInterface
+from config.cache import get_negative_cache
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import CheckMessage, Error
+
+
+class _Call:
+    """Выполняемая загрузка и ее результат."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Объединение одновременных загрузок одного ключа в пределах процесса.
+
+    Первый вызов do() выполняет функцию, остальные с тем же ключом ждут
+    и получают ее результат или исключение.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class TaskReadCache(TaskCacheInterface):
+    """
+    Версионированный кэш представлений задач.
+
+    Ключ задачи зависит от версии задачи, ключ страницы списка - от версии
+    списка, оба - от общего поколения, которое сбрасывает все сразу
+    (пакетные изменения, изменения пользователей). Версии читаются до
+    загрузки данных, поэтому запись, выполненная во время загрузки,
+    не оставит в кэше устаревшее значение.
+    """
+
+    key_prefix = "tasks:"
+    # Общая для всех экземпляров в процессе
+    flight = SingleFlight()
+    # Блокировка загрузки в общем кэше: срок жизни, ожидание и шаг опроса
+    lock_timeout = 10
+    lock_wait = 2.0
+    lock_poll = 0.05
+
+    def __init__(self, cache_alias: str = "default", timeout: Optional[int] = 300):
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _version_key(self, name: str) -> str:
+        return f"{self.key_prefix}version:{name}"
+
+    def _versions(self, *names: str) -> Dict[str, int]:
+        """Текущие версии, отсутствующие создаются."""
+        keys = [self._version_key(name) for name in names]
+        versions = self.cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Начальное значение от времени: вытесненный счетчик
+                # не совпадет со старыми версиями
+                self.cache.add(key, time.time_ns(), timeout=None)
+                versions[key] = self.cache.get(key)
+        return {name: versions[key] for name, key in zip(names, keys)}
+
+    def _bump(self, name: str) -> None:
+        key = self._version_key(name)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, time.time_ns(), timeout=None)
+
+    def _key(self, versions: Dict[str, int], variant: str) -> str:
+        raw = ":".join(f"{name}={version}" for name, version in versions.items())
+        digest = hashlib.sha1(variant.encode()).hexdigest()
+        return f"{self.key_prefix}{raw}:{digest}"
+
+    def task_key(self, task_id: int, variant: str = "") -> str:
+        """Ключ представления задачи (variant - параметры запроса)."""
+        return self._key(self._versions("all", f"task:{task_id}"), variant)
+
+    def list_key(self, variant: str = "") -> str:
+        """Ключ страницы списка задач (variant - URL страницы)."""
+        return self._key(self._versions("all", "list"), variant)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(key)
+
+    def set(self, key: str, data: Any) -> None:
+        self.cache.set(key, data, timeout=self.timeout)
+
+    def get_or_load(self, key: str, load: Callable[[], Optional[Any]]) -> Any:
+        """
+        Значение из кэша или результат load(), загруженный один раз.
+
+        load() возвращает данные для кэша или None, если результат
+        кэшировать нельзя (например, задача не найдена).
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+        return self.flight.do(key, lambda: self._load_locked(key, load))
+
+    def _load_locked(self, key: str, load: Callable[[], Optional[Any]]) -> Any:
+        """Загрузка под блокировкой в общем кэше."""
+        lock_key = f"{key}:lock"
+        if not self.cache.add(lock_key, 1, timeout=self.lock_timeout):
+            # Ключ загружает другой процесс - ждем его результат
+            data = self._wait_for(key, lock_key)
+            if data is not None:
+                return data
+            return self._load_and_set(key, load)
+
+        try:
+            # Значение могло появиться, пока блокировку держал другой процесс
+            data = self.get(key)
+            if data is not None:
+                return data
+            return self._load_and_set(key, load)
+        finally:
+            self.cache.delete(lock_key)
+
+    def _wait_for(self, key: str, lock_key: str) -> Optional[Any]:
+        """Дождаться значения, пока владелец блокировки его загружает."""
+        deadline = time.monotonic() + self.lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(self.lock_poll)
+            found = self.cache.get_many([key, lock_key])
+            if key in found:
+                return found[key]
+            if lock_key not in found:
+                # Владелец завершил загрузку, не сохранив результат
+                return None
+        return None
+
+    def _load_and_set(self, key: str, load: Callable[[], Optional[Any]]) -> Any:
+        data = load()
+        if data is not None:
+            self.set(key, data)
+        return data
+
+    def invalidate_task(self, task_id: int) -> None:
+        self._bump(f"task:{task_id}")
+        self._bump("list")
+
+    def invalidate_list(self) -> None:
+        self._bump("list")
+
+    def invalidate_all(self) -> None:
+        self._bump("all")
+
+    def list_version(self, load: Callable[[], ResourceVersion]) -> ResourceVersion:
+        """
+        Версия списка, вычисленная load() один раз для текущих счетчиков.
+
+        Версия строится по данным (агрегат по таблице) и одинакова во всех
+        процессах, а агрегат выполняется только после записи.
+        """
+        return self.get_or_load(
+            self._key(self._versions("all", "list"), "version"), load
+        )
+
+
+def check_cache_backend(app_configs=None, **kwargs) -> List[CheckMessage]:
+    """
+    Проверка запуска: кэш чтения задач не хранится в памяти процесса.
+
+    С LocMemCache у каждого воркера свои счетчики версий, и запись
+    в одном воркере не сбрасывает представления в остальных.
+    """
+    if not settings.TASKS_CACHE_ENABLED:
+        return []
+    backend = settings.CACHES.get(settings.TASKS_CACHE_ALIAS, {}).get("BACKEND")
+    if backend != "django.core.cache.backends.locmem.LocMemCache":
+        return []
+    return [
+        Error(
+            "Кэш чтения задач хранится в LocMemCache, отдельном " "у каждого процесса.",
+            hint="Задайте общий бэкенд (CACHE_BACKEND) или отключите "
+            "TASKS_CACHE_ENABLED.",
+            id="tasks.E001",
+        )
+    ]
+
+
+def get_task_cache() -> Optional[TaskReadCache]:
+    """Кэш чтения задач, если он включен в настройках."""
+    if not settings.TASKS_CACHE_ENABLED:
+        return None
+    return TaskReadCache(
+        cache_alias=settings.TASKS_CACHE_ALIAS, timeout=settings.TASKS_CACHE_TIMEOUT
+    )
+
+
+def invalidate_on_user_change(sender, instance, update_fields=None, **kwargs):
+    """
+    Обработчик post_save/post_delete модели пользователя.
+
+    Пользователи встроены в задачи и комментарии, поэтому их изменение
+    сбрасывает все представления. Обновление last_login при входе
+    на представление не влияет и пропускается.
+    """
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    cache = get_task_cache()
+    if cache is not None:
+        cache.invalidate_all()
+
+
+def forget_missing_task(sender, instance, created=False, **kwargs):
+    """
+    Обработчик post_save модели задачи.
+
+    Созданная задача удаляется из кэша отсутствующих, включая создание
+    в обход репозитория (админка, фикстуры).
+    """
+    if created:
+        get_negative_cache("tasks:").discard([instance.pk])
@@ -58,10 +58,25 @@ class TaskModel(models.Model):
         help_text="Пользователь, создавший задачу",
     )
 
+    # Денормализованные данные о комментариях, поддерживаются репозиторием
+    comment_count = models.PositiveIntegerField(
+        "Комментариев", default=0, help_text="Количество комментариев к задаче"
+    )
+
+    last_comment_at = models.DateTimeField(
+        "Последний комментарий",
+        null=True,
+        blank=True,
+        help_text="Дата и время последнего комментария",
+    )
+
     class Meta:
         verbose_name = "Задача"
         verbose_name_plural = "Задачи"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="task_created_at_id_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -97,6 +112,12 @@ class TaskCommentModel(models.Model):
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["task", "-created_at", "-id"],
+                name="comment_task_created_at_idx",
+            ),
+        ]
 
     def __str__(self):
         return f'Комментарий к "{self.task.title}" от {self.author.username}'
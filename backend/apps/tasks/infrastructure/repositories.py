@@ -3,62 +3,160 @@
 Реализация интерфейсов репозиториев из domain слоя.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from apps.tasks.domain.entities import Task, TaskComment, TaskStatus
+from apps.tasks.domain.entities import (
+    BulkUpdateResult,
+    CursorPageRequest,
+    Page,
+    PageCursor,
+    PageRequest,
+    ResourceVersion,
+    Task,
+    TaskComment,
+    TaskFilter,
+    TaskRow,
+    TaskStatus,
+)
 from apps.tasks.domain.interfaces import (
     CommentRepositoryInterface,
     TaskRepositoryInterface,
 )
-from apps.users.domain.entities import User
-from django.db import models
+from apps.users.infrastructure.identity_map import UserIdentityMap
+from config.cache import NegativeCache
+from django.db import connections, models, transaction
+from django.db.models import sql
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 
 from .models import TaskCommentModel, TaskModel
 
 
+def _isoformat(value: Optional[datetime]) -> str:
+    """Момент времени с микросекундами для ключа версии."""
+    return value.isoformat() if value is not None else ""
+
+
+def _can_return_from_update(connection) -> bool:
+    """Поддерживает ли БД UPDATE ... RETURNING (PostgreSQL, SQLite 3.35+)."""
+    # В SQLite RETURNING появился для всех DML сразу, как и для INSERT
+    return connection.vendor in ("postgresql", "sqlite") and (
+        connection.features.can_return_columns_from_insert
+    )
+
+
+def _from_db_value(connection, field: models.Field, value: Any) -> Any:
+    """Значение колонки из курсора с конвертерами бэкенда и поля."""
+    expression = field.get_col(field.model._meta.db_table)
+    converters = connection.ops.get_db_converters(expression) + field.get_db_converters(
+        connection
+    )
+    for converter in converters:
+        value = converter(value, expression, connection)
+    return value
+
+
+def _keyset_page(
+    queryset: models.QuerySet, page_request: CursorPageRequest
+) -> Tuple[List[models.Model], Optional[PageCursor]]:
+    """Строки после курсора по (-created_at, -id) и позиция следующей страницы."""
+    queryset = queryset.order_by("-created_at", "-id")
+
+    cursor = page_request.after
+    if cursor is not None:
+        queryset = queryset.filter(
+            models.Q(created_at__lt=cursor.created_at)
+            | models.Q(created_at=cursor.created_at, id__lt=cursor.id)
+        )
+
+    # Лишняя строка показывает, есть ли следующая страница
+    rows = list(queryset[: page_request.limit + 1])
+    next_cursor = None
+    if len(rows) > page_request.limit:
+        rows = rows[: page_request.limit]
+        last = rows[-1]
+        next_cursor = PageCursor(created_at=last.created_at, id=last.id)
+    return rows, next_cursor
+
+
 class DjangoTaskRepository(TaskRepositoryInterface):
     """Репозиторий для работы с задачами через Django ORM."""
 
-    def _to_domain(self, task_model: TaskModel) -> Task:
-        # Преобразуем комментарии с полными данными пользователей
-        comments = []
-        for comment in task_model.comments.all():
-            author = User(
-                id=comment.author.id,
-                username=comment.author.username,
-                first_name=comment.author.first_name,
-                last_name=comment.author.last_name,
-                email=comment.author.email,
-            )
-            comments.append(
-                TaskComment(
-                    id=comment.id,
-                    content=comment.content,
-                    author=author,
-                    task_id=task_model.id,
-                    created_at=comment.created_at,
-                )
+    # Поля доменной модели, хранящиеся в колонках с другим именем
+    FIELD_COLUMNS = {
+        "assigned_to": "assigned_to_id",
+        "created_by": "created_by_id",
+    }
+
+    # Поля доменной модели, хранящиеся в одноименных колонках
+    SPARSE_COLUMNS = (
+        "title",
+        "description",
+        "status",
+        "updated_at",
+        "comment_count",
+        "last_comment_at",
+    )
+
+    # Колонки пользователя, нужные доменной модели User
+    USER_COLUMNS = ("id", "username", "first_name", "last_name", "email")
+
+    def __init__(
+        self,
+        comments_limit: Optional[int] = None,
+        missing: Optional[NegativeCache] = None,
+    ):
+        # Сколько последних комментариев загружать с задачей (None - все)
+        self.comments_limit = comments_limit
+        # Недавно не найденные ID задач (по умолчанию отключен)
+        self.missing = missing or NegativeCache("tasks:", ttl=0)
+
+    def _to_domain(
+        self,
+        task_model: TaskModel,
+        users: Optional[UserIdentityMap] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Task:
+        """
+        Преобразование Django модели в доменную модель.
+
+        Для выборки с fields незагруженные поля задачи равны None,
+        обращения к отложенным колонкам не выполняются.
+        """
+        # Один экземпляр User на пользователя в пределах выборки
+        if users is None:
+            users = UserIdentityMap()
+
+        # Преобразуем загруженные комментарии с полными данными пользователей
+        comments = [
+            TaskComment(
+                id=comment.id,
+                content=comment.content,
+                author=users.get(comment.author),
+                task_id=task_model.id,
+                created_at=comment.created_at,
             )
+            for comment in getattr(task_model, "latest_comments", [])
+        ]
 
-        # Создаем объект создателя задачи
-        created_by = User(
-            id=task_model.created_by.id,
-            username=task_model.created_by.username,
-            first_name=task_model.created_by.first_name,
-            last_name=task_model.created_by.last_name,
-            email=task_model.created_by.email,
-        )
+        if fields is not None:
+            return self._to_partial_domain(task_model, users, fields, comments)
 
         # Создаем объект назначенного пользователя, если есть
         assigned_to = None
         if task_model.assigned_to:
-            assigned_to = User(
-                id=task_model.assigned_to.id,
-                username=task_model.assigned_to.username,
-                first_name=task_model.assigned_to.first_name,
-                last_name=task_model.assigned_to.last_name,
-                email=task_model.assigned_to.email,
-            )
+            assigned_to = users.get(task_model.assigned_to)
 
         return Task(
             id=task_model.id,
@@ -67,87 +165,439 @@ class DjangoTaskRepository(TaskRepositoryInterface):
             status=TaskStatus(task_model.status),
             created_at=task_model.created_at,
             updated_at=task_model.updated_at,
-            created_by=created_by,
+            created_by=users.get(task_model.created_by),
             assigned_to=assigned_to,
             comments=comments,
+            comment_count=task_model.comment_count,
+            last_comment_at=task_model.last_comment_at,
         )
 
-    def _to_django_model(self, task: Task) -> TaskModel:
-        """Преобразование доменной модели в Django модель."""
-        if task.id:
-            task_model = TaskModel.objects.get(id=task.id)
-        else:
-            task_model = TaskModel()
+    def _to_partial_domain(
+        self,
+        task_model: TaskModel,
+        users: UserIdentityMap,
+        fields: FrozenSet[str],
+        comments: List[TaskComment],
+    ) -> Task:
+        """Преобразование модели, загруженной с only(), в частичную задачу."""
 
-        task_model.title = task.title
-        task_model.description = task.description
-        task_model.status = task.status.value
+        def value(name: str) -> Any:
+            return getattr(task_model, name) if name in fields else None
+
+        assigned_to = None
+        if "assigned_to" in fields and task_model.assigned_to_id is not None:
+            assigned_to = users.get(task_model.assigned_to)
+        created_by = None
+        if "created_by" in fields:
+            created_by = users.get(task_model.created_by)
 
-        if task.assigned_to:
-            task_model.assigned_to_id = task.assigned_to.id
+        return Task(
+            id=task_model.id,
+            title=value("title"),
+            description=value("description"),
+            status=TaskStatus(task_model.status) if "status" in fields else None,
+            # Ключ сортировки загружается всегда
+            created_at=task_model.created_at,
+            updated_at=value("updated_at"),
+            created_by=created_by,
+            assigned_to=assigned_to,
+            comments=comments,
+            comment_count=value("comment_count"),
+            last_comment_at=value("last_comment_at"),
+        )
+
+    def _to_domain_list(
+        self, task_models, fields: Optional[FrozenSet[str]] = None
+    ) -> List[Task]:
+        """Преобразование выборки задач с общей картой пользователей."""
+        users = UserIdentityMap()
+        return [
+            self._to_domain(task_model, users, fields) for task_model in task_models
+        ]
+
+    def _to_columns(
+        self, task: Task, fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """Преобразование доменной модели в значения колонок TaskModel."""
+        columns = {
+            "title": task.title,
+            "description": task.description,
+            "status": task.status.value,
+            "assigned_to_id": task.assigned_to.id if task.assigned_to else None,
+            "created_by_id": task.created_by.id,
+        }
+        if fields is None:
+            return columns
+
+        names = {self.FIELD_COLUMNS.get(field, field) for field in fields}
+        return {name: value for name, value in columns.items() if name in names}
+
+    def _queryset(
+        self,
+        comments_limit: Optional[int] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> models.QuerySet:
+        """
+        Queryset задач с пользователями, числом и последними комментариями.
+
+        comments_limit=None берет ограничение репозитория, 0 - без комментариев.
+        Число комментариев хранится в строке задачи и не требует JOIN.
+        С fields загружаются только нужные колонки, JOIN пользователей
+        и комментарии - только если они запрошены.
+        """
+        if fields is None:
+            queryset = TaskModel.objects.select_related("assigned_to", "created_by")
         else:
-            task_model.assigned_to_id = None
+            queryset = self._sparse_queryset(fields)
+            if "comments" not in fields:
+                return queryset
 
-        task_model.created_by_id = task.created_by.id
+        if comments_limit is None:
+            comments_limit = self.comments_limit
+        if comments_limit == 0:
+            return queryset
 
-        return task_model
+        comments = TaskCommentModel.objects.select_related("author").order_by(
+            "-created_at", "-id"
+        )
+        if comments_limit is not None:
+            # Срез в Prefetch выполняется оконной функцией для всех задач сразу
+            comments = comments[:comments_limit]
+        return queryset.prefetch_related(
+            models.Prefetch("comments", queryset=comments, to_attr="latest_comments")
+        )
 
-    def get_by_id(self, task_id: int) -> Optional[Task]:
+    def _sparse_queryset(self, fields: FrozenSet[str]) -> models.QuerySet:
+        """Queryset задач с колонками только для запрошенных полей."""
+        # id и ключ сортировки нужны для страниц и курсора
+        columns = {"id", "created_at"}
+        columns.update(field for field in fields if field in self.SPARSE_COLUMNS)
+
+        related = [field for field in self.FIELD_COLUMNS if field in fields]
+        for field in related:
+            columns.update(f"{field}__{name}" for name in self.USER_COLUMNS)
+            # Колонка внешнего ключа нужна для проверки исполнителя без JOIN
+            columns.add(field)
+
+        queryset = TaskModel.objects.only(*sorted(columns))
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset
+
+    def get_by_id(
+        self, task_id: int, fields: Optional[FrozenSet[str]] = None
+    ) -> Optional[Task]:
         """Получить задачу по ID."""
+        if self.missing.contains(task_id):
+            return None
         try:
-            task_model = (
-                TaskModel.objects.select_related("assigned_to", "created_by")
-                .prefetch_related("comments__author")
-                .get(id=task_id)
-            )
-            return self._to_domain(task_model)
+            task_model = self._queryset(fields=fields).get(id=task_id)
+            return self._to_domain(task_model, fields=fields)
         except TaskModel.DoesNotExist:
+            self.missing.add([task_id])
             return None
 
-    def get_all(self) -> List[Task]:
+    def get_all(
+        self,
+        comments_limit: Optional[int] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> List[Task]:
         """Получить все задачи."""
-        task_models = (
-            TaskModel.objects.select_related("assigned_to", "created_by")
-            .prefetch_related("comments__author")
-            .all()
+        task_models = self._queryset(comments_limit, fields).all()
+        return self._to_domain_list(task_models, fields)
+
+    def get_page(self, page_request: PageRequest) -> Page[Task]:
+        """Получить страницу задач (LIMIT/OFFSET на стороне БД)."""
+        queryset = self._queryset(
+            page_request.comments_limit, page_request.fields
+        ).order_by("-created_at", "-id")
+        total = TaskModel.objects.count()
+        start = page_request.offset
+        if page_request.last:
+            start = max(total - 1, 0) // page_request.limit * page_request.limit
+
+        # Связанные объекты загружаются только для задач текущей страницы
+        end = start + page_request.limit
+        task_models = queryset[start:end]
+
+        return Page(
+            items=self._to_domain_list(task_models, page_request.fields),
+            total=total,
+        )
+
+    def get_cursor_page(self, page_request: CursorPageRequest) -> Page[Task]:
+        """Получить страницу задач после курсора (keyset, без COUNT)."""
+        task_models, next_cursor = _keyset_page(
+            self._queryset(page_request.comments_limit, page_request.fields),
+            page_request,
+        )
+        return Page(
+            items=self._to_domain_list(task_models, page_request.fields),
+            next_cursor=next_cursor,
         )
-        return [self._to_domain(task_model) for task_model in task_models]
 
     def get_by_user(self, user_id: int) -> List[Task]:
         """Получить задачи пользователя (созданные или назначенные)."""
         task_models = (
-            TaskModel.objects.select_related("assigned_to", "created_by")
-            .prefetch_related("comments__author")
+            self._queryset()
             .filter(models.Q(assigned_to_id=user_id) | models.Q(created_by_id=user_id))
             .distinct()
         )
-        return [self._to_domain(task_model) for task_model in task_models]
+        return self._to_domain_list(task_models)
 
     def get_assigned_to_user(self, user_id: int) -> List[Task]:
         """Получить задачи, назначенные пользователю."""
-        task_models = (
-            TaskModel.objects.select_related("assigned_to", "created_by")
-            .prefetch_related("comments__author")
-            .filter(assigned_to_id=user_id)
-        )
-        return [self._to_domain(task_model) for task_model in task_models]
+        task_models = self._queryset().filter(assigned_to_id=user_id)
+        return self._to_domain_list(task_models)
 
     def get_created_by_user(self, user_id: int) -> List[Task]:
         """Получить задачи, созданные пользователем."""
-        task_models = (
-            TaskModel.objects.select_related("assigned_to", "created_by")
-            .prefetch_related("comments__author")
-            .filter(created_by_id=user_id)
+        task_models = self._queryset().filter(created_by_id=user_id)
+        return self._to_domain_list(task_models)
+
+    def save(self, task: Task, fields: Optional[Sequence[str]] = None) -> Task:
+        """
+        Сохранить задачу одним INSERT или UPDATE.
+
+        Связанные пользователи и комментарии берутся из переданной
+        доменной модели, повторная загрузка из БД не выполняется.
+        """
+        if task.id is None:
+            task_model = TaskModel.objects.create(**self._to_columns(task))
+            task.id = task_model.id
+            task.created_at = task_model.created_at
+            task.updated_at = task_model.updated_at
+            return task
+
+        # update() не обновляет auto_now поля, поэтому updated_at задаем явно
+        columns = self._to_columns(task, fields)
+        columns["updated_at"] = timezone.now()
+        TaskModel.objects.filter(id=task.id).update(**columns)
+
+        task.updated_at = columns["updated_at"]
+        return task
+
+    def bulk_create(self, tasks: List[Task], batch_size: int) -> List[Task]:
+        """Создать задачи пакетными INSERT в одной транзакции."""
+        task_models = [TaskModel(**self._to_columns(task)) for task in tasks]
+        with transaction.atomic():
+            TaskModel.objects.bulk_create(task_models, batch_size=batch_size)
+
+        for task, task_model in zip(tasks, task_models):
+            task.id = task_model.id
+            task.created_at = task_model.created_at
+            task.updated_at = task_model.updated_at
+        # bulk_create не отправляет post_save, забываем созданные ID сами
+        self.missing.discard([task.id for task in tasks])
+        return tasks
+
+    # Колонки, которые UPDATE возвращает для построения ответа
+    ROW_FIELDS = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "assigned_to",
+        "comment_count",
+        "last_comment_at",
+    )
+
+    def _update_returning(
+        self, task_id: int, columns: Dict[str, Any]
+    ) -> Optional[TaskRow]:
+        """
+        UPDATE ... WHERE id=? RETURNING одним запросом.
+
+        Если БД не поддерживает RETURNING в UPDATE, строка читается
+        отдельным запросом в той же транзакции.
+        """
+        if self.missing.contains(task_id):
+            return None
+        queryset = TaskModel.objects.filter(id=task_id)
+        columns = {**columns, "updated_at": timezone.now()}
+        fields = [TaskModel._meta.get_field(name) for name in self.ROW_FIELDS]
+        connection = connections[queryset.db]
+
+        if _can_return_from_update(connection):
+            # SQL и параметры строит компилятор ORM, как в QuerySet.update()
+            query = queryset.query.chain(sql.UpdateQuery)
+            query.add_update_values(columns)
+            update_sql, params = query.get_compiler(queryset.db).as_sql()
+            returning = ", ".join(
+                connection.ops.quote_name(field.column) for field in fields
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"{update_sql} RETURNING {returning}", params)
+                row = cursor.fetchone()
+            if row is not None:
+                row = [
+                    _from_db_value(connection, field, value)
+                    for field, value in zip(fields, row)
+                ]
+        else:
+            with transaction.atomic(using=queryset.db):
+                row = None
+                if queryset.update(**columns):
+                    row = queryset.values_list(
+                        *(field.attname for field in fields)
+                    ).first()
+
+        if row is None:
+            self.missing.add([task_id])
+            return None
+        values = dict(zip(self.ROW_FIELDS, row))
+        return TaskRow(
+            id=values["id"],
+            title=values["title"],
+            description=values["description"],
+            status=TaskStatus(values["status"]),
+            created_at=values["created_at"],
+            updated_at=values["updated_at"],
+            created_by_id=values["created_by"],
+            assigned_to_id=values["assigned_to"],
+            comment_count=values["comment_count"],
+            last_comment_at=values["last_comment_at"],
+        )
+
+    def update_status(self, task_id: int, status: TaskStatus) -> Optional[TaskRow]:
+        """Изменить статус задачи одним UPDATE."""
+        return self._update_returning(task_id, {"status": status.value})
+
+    def update_assignee(
+        self, task_id: int, user_id: Optional[int]
+    ) -> Optional[TaskRow]:
+        """Назначить задачу одним UPDATE."""
+        return self._update_returning(task_id, {"assigned_to_id": user_id})
+
+    def _filter_queryset(self, task_filter: TaskFilter) -> models.QuerySet:
+        """
+        Queryset задач по условиям фильтра, кроме ids.
+
+        Список ids делится на порции в _iter_id_chunks, чтобы каждый запрос
+        передавал только ID своей порции.
+        """
+        queryset = TaskModel.objects.all()
+        if task_filter.status is not None:
+            queryset = queryset.filter(status=task_filter.status.value)
+        if task_filter.assigned_to_id is not None:
+            queryset = queryset.filter(assigned_to_id=task_filter.assigned_to_id)
+        if task_filter.created_by_id is not None:
+            queryset = queryset.filter(created_by_id=task_filter.created_by_id)
+        return queryset
+
+    def _iter_id_chunks(
+        self, task_filter: TaskFilter, queryset: models.QuerySet, batch_size: int
+    ) -> Iterator[List[int]]:
+        """Перебрать ID подходящих задач порциями по возрастанию ID."""
+        if task_filter.ids is not None:
+            # ID известны: порции режутся без выборки, условия фильтра
+            # проверяет сам UPDATE
+            ids = sorted(set(task_filter.ids))
+            for start in range(0, len(ids), batch_size):
+                yield ids[start : start + batch_size]
+            return
+
+        last_id = 0
+        while True:
+            chunk = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1]
+
+    def bulk_update(
+        self,
+        task_filter: TaskFilter,
+        batch_size: int,
+        status: Optional[TaskStatus] = None,
+        assigned_to_id: Optional[int] = None,
+        return_ids: bool = False,
+    ) -> BulkUpdateResult:
+        """
+        Изменить задачи по фильтру порциями UPDATE ... WHERE id IN (...).
+
+        Каждая порция обновляется в своей транзакции, поэтому блокировки
+        держатся недолго. Условия фильтра повторяются в UPDATE, чтобы не
+        изменить задачу, которая перестала им соответствовать после выборки ID.
+        Порции идут по возрастанию ID, и ids возвращаются в том же порядке.
+        """
+        columns: Dict[str, Any] = {}
+        if status is not None:
+            columns["status"] = status.value
+        if assigned_to_id is not None:
+            columns["assigned_to_id"] = assigned_to_id or None
+
+        queryset = self._filter_queryset(task_filter)
+        result = BulkUpdateResult(updated=0, ids=[] if return_ids else None)
+        if not columns:
+            return result
+
+        for chunk in self._iter_id_chunks(task_filter, queryset, batch_size):
+            updated_at = timezone.now()
+            with transaction.atomic():
+                updated = queryset.filter(id__in=chunk).update(
+                    updated_at=updated_at, **columns
+                )
+            result.updated += updated
+
+            if return_ids:
+                if updated < len(chunk):
+                    # Часть задач не существует, не подходит под фильтр
+                    # или изменилась между выборкой и UPDATE
+                    chunk = list(
+                        TaskModel.objects.filter(id__in=chunk, updated_at=updated_at)
+                        .order_by("id")
+                        .values_list("id", flat=True)
+                    )
+                result.ids.extend(chunk)
+
+        return result
+
+    def get_version(self, task_id: int) -> Optional[ResourceVersion]:
+        """Версия задачи по колонкам строки, без JOIN и комментариев."""
+        if self.missing.contains(task_id):
+            return None
+        row = (
+            TaskModel.objects.filter(id=task_id)
+            .values_list("updated_at", "comment_count", "last_comment_at")
+            .first()
         )
-        return [self._to_domain(task_model) for task_model in task_models]
+        if row is None:
+            self.missing.add([task_id])
+            return None
 
-    def save(self, task: Task) -> Task:
-        """Сохранить задачу."""
-        task_model = self._to_django_model(task)
-        task_model.save()
+        updated_at, comment_count, last_comment_at = row
+        # Комментарии меняют comment_count и last_comment_at, но не updated_at
+        return ResourceVersion(
+            key=f"{task_id}:{_isoformat(updated_at)}:{comment_count}:"
+            f"{_isoformat(last_comment_at)}",
+            last_modified=max(filter(None, (updated_at, last_comment_at))),
+        )
 
-        # Возвращаем доменную модель с актуальными данными из БД
-        return self._to_domain(task_model)
+    def get_list_version(self) -> ResourceVersion:
+        """Версия всех задач: число, последние изменения и число комментариев."""
+        stats = TaskModel.objects.aggregate(
+            count=models.Count("id"),
+            updated_at=models.Max("updated_at"),
+            last_comment_at=models.Max("last_comment_at"),
+            comment_count=models.Sum("comment_count"),
+        )
+        # Удаление задачи меняет count, удаление комментария - comment_count
+        return ResourceVersion(
+            key=f"{stats['count']}:{_isoformat(stats['updated_at'])}:"
+            f"{stats['comment_count'] or 0}:{_isoformat(stats['last_comment_at'])}",
+            last_modified=max(
+                filter(None, (stats["updated_at"], stats["last_comment_at"])),
+                default=None,
+            ),
+        )
 
     def delete(self, task_id: int) -> bool:
         """Удалить задачу."""
@@ -161,20 +611,19 @@ class DjangoTaskRepository(TaskRepositoryInterface):
 class DjangoCommentRepository(CommentRepositoryInterface):
     """Репозиторий для работы с комментариями через Django ORM."""
 
-    def _to_domain(self, comment_model: TaskCommentModel) -> TaskComment:
+    def _to_domain(
+        self,
+        comment_model: TaskCommentModel,
+        users: Optional[UserIdentityMap] = None,
+    ) -> TaskComment:
         """Преобразование Django модели в доменную модель."""
-        author = User(
-            id=comment_model.author.id,
-            username=comment_model.author.username,
-            first_name=comment_model.author.first_name,
-            last_name=comment_model.author.last_name,
-            email=comment_model.author.email,
-        )
+        if users is None:
+            users = UserIdentityMap()
 
         return TaskComment(
             id=comment_model.id,
             content=comment_model.content,
-            author=author,
+            author=users.get(comment_model.author),
             task_id=comment_model.task_id,
             created_at=comment_model.created_at,
         )
@@ -197,23 +646,95 @@ class DjangoCommentRepository(CommentRepositoryInterface):
         comment_models = TaskCommentModel.objects.select_related("author").filter(
             task_id=task_id
         )
-        return [self._to_domain(comment_model) for comment_model in comment_models]
+        users = UserIdentityMap()
+        return [
+            self._to_domain(comment_model, users) for comment_model in comment_models
+        ]
+
+    def get_page_by_task_id(
+        self, task_id: int, page_request: CursorPageRequest
+    ) -> Page[TaskComment]:
+        """Получить страницу комментариев к задаче (keyset по индексу задачи)."""
+        comment_models, next_cursor = _keyset_page(
+            TaskCommentModel.objects.select_related("author").filter(task_id=task_id),
+            page_request,
+        )
+        users = UserIdentityMap()
+        return Page(
+            items=[
+                self._to_domain(comment_model, users)
+                for comment_model in comment_models
+            ],
+            next_cursor=next_cursor,
+        )
 
     def save(self, comment: TaskComment) -> TaskComment:
-        """Сохранить комментарий."""
+        """Сохранить комментарий и обновить счетчики задачи."""
         comment_model = self._to_django_model(comment)
-        comment_model.save()
-
-        # Обновляем ID в доменной модели, если это новый комментарий
-        if not comment.id:
-            comment.id = comment_model.id
+        if comment.id:
+            comment_model.save()
+            return comment
+
+        with transaction.atomic():
+            comment_model.save()
+            created_at = models.Value(comment_model.created_at)
+            TaskModel.objects.filter(id=comment.task_id).update(
+                comment_count=models.F("comment_count") + 1,
+                # Комментарий, зафиксированный позже более нового,
+                # не сдвигает время назад
+                last_comment_at=Greatest(
+                    Coalesce(models.F("last_comment_at"), created_at), created_at
+                ),
+            )
 
+        # Обновляем ID в доменной модели
+        comment.id = comment_model.id
+        comment.created_at = comment_model.created_at
         return comment
 
     def delete(self, comment_id: int) -> bool:
-        """Удалить комментарий."""
-        try:
-            TaskCommentModel.objects.get(id=comment_id).delete()
-            return True
-        except TaskCommentModel.DoesNotExist:
-            return False
+        """Удалить комментарий и обновить счетчики задачи."""
+        with transaction.atomic():
+            task_id = (
+                TaskCommentModel.objects.filter(id=comment_id)
+                .values_list("task_id", flat=True)
+                .first()
+            )
+            if task_id is None:
+                return False
+
+            TaskCommentModel.objects.filter(id=comment_id).delete()
+            latest = (
+                TaskCommentModel.objects.filter(task_id=task_id)
+                .order_by("-created_at")
+                .values("created_at")[:1]
+            )
+            TaskModel.objects.filter(id=task_id).update(
+                # Разошедшийся счетчик не уходит ниже нуля (CHECK колонки)
+                comment_count=Greatest(models.F("comment_count") - 1, 0),
+                last_comment_at=models.Subquery(latest),
+            )
+        return True
+
+    def recount(self, task_ids: Iterable[int]) -> int:
+        """
+        Пересчитать comment_count и last_comment_at задач по комментариям.
+
+        Для изменений в обход save/delete (админка, ручные правки).
+        """
+        comments = (
+            TaskCommentModel.objects.filter(task=models.OuterRef("pk"))
+            .order_by()
+            .values("task")
+        )
+        return TaskModel.objects.filter(id__in=task_ids).update(
+            comment_count=Coalesce(
+                models.Subquery(
+                    comments.annotate(count=models.Count("id")).values("count")
+                ),
+                0,
+            ),
+            last_comment_at=models.Subquery(
+                comments.annotate(latest=models.Max("created_at")).values("latest")
+            ),
+        )
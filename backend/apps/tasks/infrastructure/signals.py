@@ -0,0 +1,26 @@
+"""
+Обработчики сигналов пользователей для счетчиков комментариев.
+
+Удаление пользователя каскадно удаляет его комментарии в обход
+репозитория, поэтому счетчики затронутых задач пересчитываются.
+"""
+
+from .models import TaskCommentModel
+from .repositories import DjangoCommentRepository
+
+
+def collect_commented_tasks(sender, instance, **kwargs):
+    """Обработчик pre_delete: запомнить задачи с комментариями пользователя."""
+    instance._commented_task_ids = set(
+        TaskCommentModel.objects.filter(author_id=instance.pk)
+        .order_by()
+        .values_list("task_id", flat=True)
+        .distinct()
+    )
+
+
+def recount_commented_tasks(sender, instance, **kwargs):
+    """Обработчик post_delete: пересчитать счетчики оставшихся задач."""
+    task_ids = getattr(instance, "_commented_task_ids", None)
+    if task_ids:
+        DjangoCommentRepository().recount(task_ids)
@@ -0,0 +1,50 @@
+"""
+Пересчет денормализованных данных о комментариях задач.
+"""
+
+from apps.tasks.infrastructure.cache import get_task_cache
+from apps.tasks.infrastructure.models import TaskModel
+from apps.tasks.infrastructure.repositories import DjangoCommentRepository
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = (
+        "Пересчитывает comment_count и last_comment_at задач по таблице "
+        "комментариев. Задачи обрабатываются порциями по ID."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Количество задач, пересчитываемых одним UPDATE",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        repository = DjangoCommentRepository()
+        total = 0
+        last_id = 0
+        while True:
+            chunk = list(
+                TaskModel.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not chunk:
+                break
+
+            with transaction.atomic():
+                total += repository.recount(chunk)
+            last_id = chunk[-1]
+
+        # Счетчики входят в представления задач
+        cache = get_task_cache()
+        if cache is not None:
+            cache.invalidate_all()
+
+        self.stdout.write(self.style.SUCCESS(f"Пересчитано задач: {total}"))
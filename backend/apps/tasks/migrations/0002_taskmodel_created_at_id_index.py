@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="task_created_at_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0002_taskmodel_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="taskcommentmodel",
+            index=models.Index(
+                fields=["task", "-created_at", "-id"],
+                name="comment_task_created_at_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:57
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_stats(apps, schema_editor):
+    """Заполнить comment_count и last_comment_at для существующих задач."""
+    TaskModel = apps.get_model("tasks", "TaskModel")
+    TaskCommentModel = apps.get_model("tasks", "TaskCommentModel")
+
+    comments = (
+        TaskCommentModel.objects.filter(task=OuterRef("pk")).order_by().values("task")
+    )
+    TaskModel.objects.update(
+        comment_count=Coalesce(
+            Subquery(comments.annotate(count=Count("id")).values("count")), 0
+        ),
+        last_comment_at=Subquery(
+            comments.annotate(latest=Max("created_at")).values("latest")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0003_taskcommentmodel_task_created_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskmodel",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Количество комментариев к задаче",
+                verbose_name="Комментариев",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="last_comment_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Дата и время последнего комментария",
+                null=True,
+                verbose_name="Последний комментарий",
+            ),
+        ),
+        migrations.RunPython(backfill_comment_stats, migrations.RunPython.noop),
+    ]
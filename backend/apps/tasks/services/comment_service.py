@@ -3,11 +3,13 @@
 Содержит сервисы для управления комментариями.
 """
 
-from typing import List
+from typing import List, Optional
 
-from apps.tasks.domain.entities import TaskComment
+from apps.tasks.domain.entities import CursorPageRequest, Page, TaskComment
 from apps.tasks.domain.interfaces import (
     CommentRepositoryInterface,
+    NullTaskCache,
+    TaskCacheInterface,
     TaskRepositoryInterface,
     UserRepositoryInterface,
 )
@@ -22,15 +24,24 @@ class CommentService:
         comment_repo: CommentRepositoryInterface,
         task_repo: TaskRepositoryInterface,
         user_repo: UserRepositoryInterface,
+        cache: Optional[TaskCacheInterface] = None,
     ):
         self.comment_repo = comment_repo
         self.task_repo = task_repo
         self.user_repo = user_repo
+        # Комментарии встроены в задачу, а их число - в элементы списка
+        self.cache = cache or NullTaskCache()
 
     def get_task_comments(self, task_id: int) -> List[TaskComment]:
         """Получить комментарии к задаче."""
         return self.comment_repo.get_by_task_id(task_id)
 
+    def get_task_comments_page(
+        self, task_id: int, page_request: CursorPageRequest
+    ) -> Page[TaskComment]:
+        """Получить страницу комментариев к задаче."""
+        return self.comment_repo.get_page_by_task_id(task_id, page_request)
+
     def create_comment(self, task_id: int, content: str, author_id: int) -> TaskComment:
         """Создать комментарий к задаче."""
         # Проверяем существование задачи
@@ -52,8 +63,14 @@ class CommentService:
             created_at=timezone.now(),
         )
 
-        return self.comment_repo.save(comment)
+        comment = self.comment_repo.save(comment)
+        self.cache.invalidate_task(task_id)
+        return comment
 
     def delete_comment(self, comment_id: int) -> bool:
         """Удалить комментарий."""
-        return self.comment_repo.delete(comment_id)
+        deleted = self.comment_repo.delete(comment_id)
+        # Задача комментария неизвестна, сбрасываем все представления
+        if deleted:
+            self.cache.invalidate_all()
+        return deleted
@@ -3,10 +3,23 @@
 Содержит сервисы для управления задачами
 """
 
-from typing import List, Optional
+from typing import Any, FrozenSet, List, Mapping, Optional, Sequence
 
-from apps.tasks.domain.entities import Task, TaskStatus
+from apps.tasks.domain.entities import (
+    BulkItemResult,
+    BulkUpdateResult,
+    CursorPageRequest,
+    Page,
+    PageRequest,
+    ResourceVersion,
+    Task,
+    TaskFilter,
+    TaskRow,
+    TaskStatus,
+)
 from apps.tasks.domain.interfaces import (
+    NullTaskCache,
+    TaskCacheInterface,
     TaskRepositoryInterface,
     UserRepositoryInterface,
 )
@@ -17,18 +30,48 @@ class TaskService:
     """Сервис для управления задачами."""
 
     def __init__(
-        self, task_repo: TaskRepositoryInterface, user_repo: UserRepositoryInterface
+        self,
+        task_repo: TaskRepositoryInterface,
+        user_repo: UserRepositoryInterface,
+        cache: Optional[TaskCacheInterface] = None,
     ):
         self.task_repo = task_repo
         self.user_repo = user_repo
+        # Каждая запись сбрасывает закэшированные представления задач
+        self.cache = cache or NullTaskCache()
 
-    def get_task_by_id(self, task_id: int) -> Optional[Task]:
-        """Получить задачу по ID."""
-        return self.task_repo.get_by_id(task_id)
+    def get_task_by_id(
+        self, task_id: int, fields: Optional[FrozenSet[str]] = None
+    ) -> Optional[Task]:
+        """Получить задачу по ID (fields - только указанные поля)."""
+        if fields is None:
+            return self.task_repo.get_by_id(task_id)
+        return self.task_repo.get_by_id(task_id, fields=fields)
 
-    def get_all_tasks(self) -> List[Task]:
+    def get_all_tasks(
+        self,
+        comments_limit: Optional[int] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> List[Task]:
         """Получить все задачи."""
-        return self.task_repo.get_all()
+        return self.task_repo.get_all(comments_limit=comments_limit, fields=fields)
+
+    def get_task_version(self, task_id: int) -> Optional[ResourceVersion]:
+        """Версия задачи для условного GET."""
+        return self.task_repo.get_version(task_id)
+
+    def get_tasks_version(self) -> ResourceVersion:
+        """Версия списка задач для условного GET."""
+        # Кэш чтения повторяет агрегат по таблице только после записи
+        return self.cache.list_version(self.task_repo.get_list_version)
+
+    def get_tasks_page(self, page_request: PageRequest) -> Page[Task]:
+        """Получить страницу задач."""
+        return self.task_repo.get_page(page_request)
+
+    def get_tasks_cursor_page(self, page_request: CursorPageRequest) -> Page[Task]:
+        """Получить страницу задач по курсору."""
+        return self.task_repo.get_cursor_page(page_request)
 
     def get_user_tasks(self, user_id: int) -> List[Task]:
         """Получить все задачи пользователя (созданные и назначенные)."""
@@ -54,15 +97,20 @@ class TaskService:
         assigned_to_id: Optional[int] = None,
     ) -> Task:
         """Создать новую задачу."""
-        # Получаем пользователя-создателя
-        created_by = self.user_repo.get_by_id(created_by_id)
+        # Создатель и исполнитель загружаются одним запросом
+        user_ids = {created_by_id}
+        if assigned_to_id:
+            user_ids.add(assigned_to_id)
+        users = self.user_repo.get_many(user_ids)
+
+        created_by = users.get(created_by_id)
         if not created_by:
             raise ValueError(f"Пользователь с ID {created_by_id} не найден")
 
         # Получаем назначенного пользователя, если указан
         assigned_to = None
         if assigned_to_id:
-            assigned_to = self.user_repo.get_by_id(assigned_to_id)
+            assigned_to = users.get(assigned_to_id)
             if not assigned_to:
                 raise ValueError(
                     f"Назначенный пользователь с ID {assigned_to_id} не найден"
@@ -82,7 +130,69 @@ class TaskService:
             comments=[],
         )
 
-        return self.task_repo.save(task)
+        task = self.task_repo.save(task)
+        self.cache.invalidate_list()
+        return task
+
+    def create_tasks(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        created_by_id: int,
+        batch_size: int = 500,
+    ) -> List[BulkItemResult[Task]]:
+        """
+        Создать задачи пакетно.
+
+        Все упомянутые пользователи загружаются одним запросом, задачи
+        сохраняются пакетными INSERT. Элементы с несуществующим исполнителем
+        не создаются и возвращаются с ошибкой.
+        """
+        user_ids = {created_by_id}
+        user_ids.update(
+            item["assigned_to"] for item in items if item.get("assigned_to")
+        )
+        users = self.user_repo.get_many(user_ids)
+
+        created_by = users.get(created_by_id)
+        if not created_by:
+            raise ValueError(f"Пользователь с ID {created_by_id} не найден")
+
+        now = timezone.now()
+        tasks = []
+        results: List[BulkItemResult[Task]] = []
+        for index, item in enumerate(items):
+            assigned_to = None
+            assigned_to_id = item.get("assigned_to")
+            if assigned_to_id:
+                assigned_to = users.get(assigned_to_id)
+                if not assigned_to:
+                    results.append(
+                        BulkItemResult(
+                            index=index,
+                            error=f"Назначенный пользователь с ID {assigned_to_id} "
+                            "не найден",
+                        )
+                    )
+                    continue
+
+            task = Task(
+                id=None,
+                title=item["title"],
+                description=item.get("description", ""),
+                status=TaskStatus.PENDING,
+                created_at=now,
+                updated_at=now,
+                assigned_to=assigned_to,
+                created_by=created_by,
+                comments=[],
+            )
+            tasks.append(task)
+            results.append(BulkItemResult(index=index, item=task))
+
+        if tasks:
+            self.task_repo.bulk_create(tasks, batch_size=batch_size)
+            self.cache.invalidate_list()
+        return results
 
     def update_task(
         self,
@@ -97,10 +207,13 @@ class TaskService:
             return None
 
         # Обновляем поля, если они переданы
+        changed_fields = []
         if title is not None:
             task.title = title
+            changed_fields.append("title")
         if description is not None:
             task.description = description
+            changed_fields.append("description")
 
         # Обновляем назначенного пользователя
         if assigned_to_id is not None:
@@ -113,35 +226,100 @@ class TaskService:
                         f"Назначенный пользователь с ID {assigned_to_id} не найден"
                     )
                 task.assigned_to = assigned_to
+            changed_fields.append("assigned_to")
 
         task.updated_at = timezone.now()
-        return self.task_repo.save(task)
+        task = self.task_repo.save(task, fields=changed_fields)
+        self.cache.invalidate_task(task_id)
+        return task
 
     def update_task_status(self, task_id: int, status: TaskStatus) -> Optional[Task]:
-        """Обновить статус задачи."""
-        task = self.task_repo.get_by_id(task_id)
-        if not task:
-            return None
+        """
+        Обновить статус задачи одним UPDATE.
 
-        task.update_status(status)
-        return self.task_repo.save(task)
+        Меняется только колонка статуса, поэтому одновременные изменения
+        других полей задачи не перезаписываются.
+        """
+        row = self.task_repo.update_status(task_id, status)
+        if row is None:
+            return None
+        self.cache.invalidate_task(task_id)
+        return self._task_from_row(row)
 
     def assign_task(self, task_id: int, user_id: Optional[int]) -> Optional[Task]:
-        """Назначить задачу пользователю."""
-        task = self.task_repo.get_by_id(task_id)
-        if not task:
+        """Назначить задачу пользователю одним UPDATE."""
+        if user_id and not self.user_repo.get_by_id(user_id):
+            raise ValueError(f"Пользователь с ID {user_id} не найден")
+
+        row = self.task_repo.update_assignee(task_id, user_id or None)
+        if row is None:
             return None
+        self.cache.invalidate_task(task_id)
+        return self._task_from_row(row)
 
-        assigned_to = None
-        if user_id:
-            assigned_to = self.user_repo.get_by_id(user_id)
-            if not assigned_to:
-                raise ValueError(f"Пользователь с ID {user_id} не найден")
+    def _task_from_row(self, row: TaskRow) -> Task:
+        """
+        Задача из строки, возвращенной UPDATE, без комментариев.
 
-        task.assigned_to = assigned_to
-        task.updated_at = timezone.now()
-        return self.task_repo.save(task)
+        Пользователи загружаются через репозиторий (с кэшем), число
+        комментариев берется из строки.
+        """
+        users = self.user_repo.get_many(
+            {row.created_by_id, row.assigned_to_id} - {None}
+        )
+        return Task(
+            id=row.id,
+            title=row.title,
+            description=row.description,
+            status=row.status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            assigned_to=users.get(row.assigned_to_id),
+            created_by=users.get(row.created_by_id),
+            comments=[],
+            comment_count=row.comment_count,
+            last_comment_at=row.last_comment_at,
+        )
+
+    def bulk_update_tasks(
+        self,
+        task_filter: TaskFilter,
+        status: Optional[TaskStatus] = None,
+        assigned_to_id: Optional[int] = None,
+        batch_size: int = 500,
+        return_ids: bool = False,
+    ) -> BulkUpdateResult:
+        """
+        Изменить статус и/или исполнителя задач по фильтру или списку ID.
+
+        assigned_to_id == 0 снимает назначение.
+        """
+        if task_filter.is_empty():
+            raise ValueError("Не указаны условия отбора задач")
+        if status is None and assigned_to_id is None:
+            raise ValueError("Не указаны изменения")
+
+        if assigned_to_id:
+            if not self.user_repo.get_by_id(assigned_to_id):
+                raise ValueError(
+                    f"Назначенный пользователь с ID {assigned_to_id} не найден"
+                )
+
+        result = self.task_repo.bulk_update(
+            task_filter,
+            batch_size=batch_size,
+            status=status,
+            assigned_to_id=assigned_to_id,
+            return_ids=return_ids,
+        )
+        # Измененные задачи заранее неизвестны, сбрасываем все представления
+        if result.updated:
+            self.cache.invalidate_all()
+        return result
 
     def delete_task(self, task_id: int) -> bool:
         """Удалить задачу."""
-        return self.task_repo.delete(task_id)
+        deleted = self.task_repo.delete(task_id)
+        if deleted:
+            self.cache.invalidate_task(task_id)
+        return deleted
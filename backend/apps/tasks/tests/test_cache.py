@@ -0,0 +1,259 @@
+"""
+Тесты для кэша чтения задач.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from apps.tasks.domain.entities import ResourceVersion
+from apps.tasks.infrastructure.cache import (
+    SingleFlight,
+    TaskReadCache,
+    check_cache_backend,
+    invalidate_on_user_change,
+)
+from config.cache import NegativeCache
+from django.core.cache import caches
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tasks-cache-tests",
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Кэш в памяти процесса вместо DummyCache тестовых настроек."""
+    settings.CACHES = LOCMEM_CACHES
+    settings.TASKS_CACHE_ENABLED = True
+    yield
+    caches["default"].clear()
+
+
+class TestTaskReadCache:
+    """Тесты для TaskReadCache."""
+
+    def setup_method(self):
+        """Настройка для каждого теста."""
+        self.cache = TaskReadCache(cache_alias="default", timeout=60)
+
+    def test_get_after_set(self):
+        """Тест чтения сохраненного значения по тому же ключу."""
+        key = self.cache.task_key(1, "fields=title")
+        self.cache.set(key, {"id": 1})
+
+        assert self.cache.get(self.cache.task_key(1, "fields=title")) == {"id": 1}
+        assert self.cache.get(self.cache.task_key(1, "")) is None
+
+    def test_invalidate_task(self):
+        """Тест сброса задачи и страниц списка, но не других задач."""
+        task_key = self.cache.task_key(1)
+        other_key = self.cache.task_key(2)
+        list_key = self.cache.list_key("/tasks/")
+
+        self.cache.invalidate_task(1)
+
+        assert self.cache.task_key(1) != task_key
+        assert self.cache.task_key(2) == other_key
+        assert self.cache.list_key("/tasks/") != list_key
+
+    def test_invalidate_list(self):
+        """Тест сброса только страниц списка."""
+        task_key = self.cache.task_key(1)
+        list_key = self.cache.list_key("/tasks/")
+
+        self.cache.invalidate_list()
+
+        assert self.cache.task_key(1) == task_key
+        assert self.cache.list_key("/tasks/") != list_key
+
+    def test_invalidate_all(self):
+        """Тест сброса всех представлений общим поколением."""
+        task_key = self.cache.task_key(1)
+        list_key = self.cache.list_key("/tasks/")
+
+        self.cache.invalidate_all()
+
+        assert self.cache.task_key(1) != task_key
+        assert self.cache.list_key("/tasks/") != list_key
+
+    def test_evicted_version_does_not_reuse_keys(self):
+        """Тест, что вытесненный счетчик версии не возвращает старые ключи."""
+        key = self.cache.task_key(1)
+        self.cache.invalidate_task(1)
+        caches["default"].delete(self.cache._version_key("task:1"))
+
+        assert self.cache.task_key(1) != key
+
+    @pytest.mark.parametrize(
+        "update_fields, invalidated",
+        [(None, True), (["email"], True), (["last_login"], False)],
+    )
+    def test_user_change(self, update_fields, invalidated):
+        """Тест сброса при изменении пользователя, кроме входа в систему."""
+        key = self.cache.task_key(1)
+
+        invalidate_on_user_change(None, None, update_fields=update_fields)
+
+        assert (self.cache.task_key(1) != key) is invalidated
+
+    def test_list_version_loaded_once_per_write(self):
+        """Тест повторного вычисления версии списка только после записи."""
+        load = Mock(side_effect=lambda: ResourceVersion(key=str(load.call_count)))
+
+        assert self.cache.list_version(load).key == "1"
+        assert self.cache.list_version(load).key == "1"
+        self.cache.invalidate_list()
+
+        assert self.cache.list_version(load).key == "2"
+        assert load.call_count == 2
+
+
+class TestNegativeCache:
+    """Тесты для кэша отсутствующих объектов."""
+
+    def test_add_and_discard(self):
+        """Тест запоминания и сброса отсутствующих ID."""
+        missing = NegativeCache("tasks:", ttl=60)
+
+        missing.add([1, 2])
+
+        assert missing.contains(1)
+        assert not missing.contains(3)
+        assert missing.missing([1, 2, 3]) == {1, 2}
+
+        missing.discard([1])
+
+        assert missing.missing([1, 2, 3]) == {2}
+
+    def test_prefixes_are_independent(self):
+        """Тест разделения задач и пользователей с одинаковыми ID."""
+        NegativeCache("tasks:", ttl=60).add([1])
+
+        assert not NegativeCache("users:", ttl=60).contains(1)
+
+    def test_disabled(self):
+        """Тест отключенного кэша (TTL 0)."""
+        missing = NegativeCache("tasks:", ttl=0)
+
+        missing.add([1])
+
+        assert not missing.contains(1)
+        assert missing.missing([1]) == set()
+
+
+class TestSingleFlight:
+    """Тесты объединения одновременных загрузок."""
+
+    def test_concurrent_calls_share_one_load(self):
+        """Тест одной загрузки для одновременных вызовов с одним ключом."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"id": 1}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", load)))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", load)))
+            for _ in range(5)
+        ]
+        for thread in followers:
+            thread.start()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert results == [{"id": 1}] * 6
+
+    def test_error_propagates_and_key_is_released(self):
+        """Тест передачи исключения и повторной загрузки после ошибки."""
+        flight = SingleFlight()
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", Mock(side_effect=RuntimeError))
+
+        assert flight.do("k", lambda: 42) == 42
+
+
+class TestTaskReadCacheLoad:
+    """Тесты загрузки промахов кэша под блокировкой."""
+
+    def setup_method(self):
+        """Настройка для каждого теста."""
+        self.cache = TaskReadCache(cache_alias="default", timeout=60)
+        self.cache.lock_wait = 2.0
+        self.cache.lock_poll = 0.01
+
+    def test_miss_loads_and_stores(self):
+        """Тест загрузки и сохранения при промахе."""
+        load = Mock(return_value={"id": 1})
+
+        assert self.cache.get_or_load("key", load) == {"id": 1}
+        assert self.cache.get_or_load("key", load) == {"id": 1}
+        load.assert_called_once_with()
+        assert caches["default"].get("key:lock") is None
+
+    def test_not_cached_result(self):
+        """Тест, что None не сохраняется в кэш."""
+        load = Mock(return_value=None)
+
+        assert self.cache.get_or_load("key", load) is None
+        assert self.cache.get_or_load("key", load) is None
+        assert load.call_count == 2
+
+    def test_waits_for_lock_owner(self):
+        """Тест ожидания результата другого процесса вместо загрузки."""
+        caches["default"].add("key:lock", 1)
+        timer = threading.Timer(0.05, lambda: caches["default"].set("key", "loaded"))
+        timer.start()
+        load = Mock(return_value="own")
+
+        assert self.cache.get_or_load("key", load) == "loaded"
+        timer.join()
+        load.assert_not_called()
+
+    def test_loads_when_lock_owner_gives_up(self):
+        """Тест загрузки, если владелец блокировки не сохранил результат."""
+        caches["default"].add("key:lock", 1)
+        timer = threading.Timer(0.05, lambda: caches["default"].delete("key:lock"))
+        timer.start()
+        load = Mock(return_value="own")
+
+        assert self.cache.get_or_load("key", load) == "own"
+        timer.join()
+        load.assert_called_once_with()
+
+
+class TestCheckCacheBackend:
+    """Тесты проверки бэкенда кэша чтения задач."""
+
+    def test_locmem_rejected(self):
+        """Тест ошибки запуска с кэшем в памяти процесса."""
+        assert [error.id for error in check_cache_backend()] == ["tasks.E001"]
+
+    def test_shared_backend_accepted(self, settings):
+        """Тест общего бэкенда и отключенного кэша."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": "/tmp/tasks-cache-tests",
+            }
+        }
+        assert check_cache_backend() == []
+
+        settings.CACHES = LOCMEM_CACHES
+        settings.TASKS_CACHE_ENABLED = False
+        assert check_cache_backend() == []
@@ -0,0 +1,43 @@
+"""
+Тесты для management команд.
+"""
+
+from io import StringIO
+
+import pytest
+from apps.tasks.infrastructure.models import TaskCommentModel, TaskModel
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestRecountTaskComments:
+    """Тесты для команды recount_task_comments."""
+
+    def setup_method(self):
+        """Настройка для каждого теста."""
+        self.user = User.objects.create_user(username="testuser", password="pass")
+
+    def test_recount_repairs_counters(self):
+        """Тест восстановления счетчиков комментариев."""
+        task = TaskModel.objects.create(title="Task", created_by=self.user)
+        empty_task = TaskModel.objects.create(
+            title="Empty", created_by=self.user, comment_count=5
+        )
+        comments = [
+            TaskCommentModel.objects.create(
+                task=task, content=f"Comment {i}", author=self.user
+            )
+            for i in range(3)
+        ]
+
+        out = StringIO()
+        call_command("recount_task_comments", batch_size=1, stdout=out)
+
+        task.refresh_from_db()
+        empty_task.refresh_from_db()
+        assert task.comment_count == 3
+        assert task.last_comment_at == comments[-1].created_at
+        assert empty_task.comment_count == 0
+        assert empty_task.last_comment_at is None
+        assert "2" in out.getvalue()
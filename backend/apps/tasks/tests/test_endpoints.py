@@ -2,10 +2,25 @@
 E2E тесты для API endpoints.
 """
 
+from io import StringIO
+from unittest.mock import patch
+
+import msgpack
 from apps.tasks.infrastructure.models import TaskCommentModel, TaskModel
+from apps.tasks.infrastructure.repositories import (
+    DjangoCommentRepository,
+    DjangoTaskRepository,
+)
+from apps.users.infrastructure.cache import get_user_repository
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
@@ -74,6 +89,149 @@ class TaskViewSetE2ETest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("title", response.data)
 
+    def test_bulk_create_tasks_success(self):
+        """Тест пакетного создания задач."""
+        url = reverse("task-bulk")
+        data = [
+            {"title": f"Bulk Task {i}", "assigned_to": self.user2.id} for i in range(10)
+        ]
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 10)
+        self.assertEqual(response.data["failed"], 0)
+        self.assertEqual(
+            [r["index"] for r in response.data["results"]], list(range(10))
+        )
+        self.assertEqual(
+            TaskModel.objects.filter(
+                title__startswith="Bulk Task",
+                created_by=self.user1,
+                assigned_to=self.user2,
+            ).count(),
+            10,
+        )
+
+    def test_bulk_create_tasks_query_count(self):
+        """Тест, что число запросов не зависит от количества задач."""
+        url = reverse("task-bulk")
+        # Прогрев кэша пользователей, если он включен
+        self.client.post(url, [{"title": "Task"}], format="json")
+
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(url, [{"title": "Task"}] * 2, format="json")
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(url, [{"title": "Task"}] * 50, format="json")
+
+        self.assertEqual(len(large), len(small))
+
+    def test_bulk_create_tasks_partial(self):
+        """Тест пакетного создания с ошибками в отдельных элементах."""
+        url = reverse("task-bulk")
+        data = [
+            {"title": "Valid Task"},
+            {"description": "No title"},
+            {"title": "Unknown Assignee", "assigned_to": 9999},
+        ]
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["failed"], 2)
+        results = response.data["results"]
+        self.assertIn("id", results[0])
+        self.assertIn("title", results[1]["errors"])
+        self.assertIn("assigned_to", results[2]["errors"])
+        self.assertFalse(TaskModel.objects.filter(title="Unknown Assignee").exists())
+
+    def test_bulk_create_tasks_not_a_list(self):
+        """Тест пакетного создания с неверным форматом запроса."""
+        url = reverse("task-bulk")
+
+        response = self.client.post(url, {"title": "Task"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.data)
+
+    def test_bulk_update_tasks_by_filter(self):
+        """Тест пакетного изменения задач по фильтру."""
+        TaskModel.objects.bulk_create(
+            [
+                TaskModel(
+                    title=f"Task {i}", status="in_progress", created_by=self.user1
+                )
+                for i in range(3)
+            ]
+        )
+        url = reverse("task-bulk")
+        data = {
+            "filter": {"status": "in_progress"},
+            "status": "completed",
+            "assigned_to": self.user2.id,
+            "return_ids": True,
+        }
+
+        response = self.client.patch(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], 3)
+        self.assertEqual(
+            response.data["ids"],
+            list(
+                TaskModel.objects.filter(status="completed")
+                .order_by("id")
+                .values_list("id", flat=True)
+            ),
+        )
+        self.assertEqual(
+            TaskModel.objects.filter(
+                status="completed", assigned_to=self.user2
+            ).count(),
+            3,
+        )
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, "pending")
+
+    def test_bulk_update_tasks_by_ids_unassign(self):
+        """Тест пакетного снятия назначения по списку ID."""
+        TaskModel.objects.filter(id=self.task.id).update(assigned_to=self.user2)
+        url = reverse("task-bulk")
+
+        response = self.client.patch(
+            url, {"ids": [self.task.id], "assigned_to": None}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 1})
+        self.task.refresh_from_db()
+        self.assertIsNone(self.task.assigned_to)
+
+    def test_bulk_update_tasks_invalid(self):
+        """Тест пакетного изменения без условий отбора или без изменений."""
+        url = reverse("task-bulk")
+
+        for data in (
+            {"status": "completed"},
+            {"ids": [self.task.id]},
+            {"filter": {}, "status": "completed"},
+            {
+                "ids": [self.task.id],
+                "filter": {"status": "pending"},
+                "status": "completed",
+            },
+            {
+                "ids": list(range(1, settings.TASKS_BULK_MAX_ITEMS + 2)),
+                "status": "completed",
+            },
+        ):
+            response = self.client.patch(url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, "pending")
+
     def test_list_tasks_success(self):
         """Тест получения списка задач."""
         # Создаем дополнительную задачу
@@ -106,6 +264,193 @@ class TaskViewSetE2ETest(APITestCase):
         self.assertIn("assigned_to", task_data)
         self.assertIn("created_by", task_data)
 
+    def test_list_tasks_sparse_fields(self):
+        """Тест выборочных полей в списке задач."""
+        TaskCommentModel.objects.create(
+            task=self.task, content="Comment", author=self.user1
+        )
+        url = reverse("task-list")
+
+        response = self.client.get(
+            url,
+            {"fields": "title,status,assigned_to", "comments": 5, "page_size": 10},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tasks = response.data["results"]
+        self.assertEqual(list(tasks[0]), ["id", "title", "status", "assigned_to"])
+        self.assertIsNone(tasks[0]["assigned_to"])
+
+    def test_retrieve_task_exclude_fields(self):
+        """Тест исключения полей из задачи."""
+        url = reverse("task-detail", kwargs={"pk": self.task.id})
+
+        response = self.client.get(url, {"exclude": "comments,description"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("comments", response.data)
+        self.assertNotIn("description", response.data)
+        self.assertEqual(response.data["title"], "Test Task")
+        self.assertEqual(response.data["created_by"]["id"], self.user1.id)
+
+    def test_retrieve_task_sparse_fields_query(self):
+        """Тест, что незапрошенные связи и комментарии не загружаются."""
+        url = reverse("task-detail", kwargs={"pk": self.task.id})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, {"fields": "title"})
+
+        self.assertEqual(response.data, {"id": self.task.id, "title": "Test Task"})
+        task_queries = [
+            query["sql"] for query in captured if "tasks_task" in query["sql"]
+        ]
+        # Версия для условного GET и сама задача, обе без JOIN
+        self.assertEqual(len(task_queries), 2)
+        for sql in task_queries:
+            self.assertNotIn("JOIN", sql)
+
+    def test_list_tasks_unknown_field(self):
+        """Тест неизвестного поля в параметре fields."""
+        url = reverse("task-list")
+
+        response = self.client.get(url, {"fields": "title,secret"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", response.data)
+
+    def test_list_tasks_normalized(self):
+        """Тест нормализованного списка задач с included.users."""
+        TaskModel.objects.create(
+            title="Task 2", created_by=self.user2, assigned_to=self.user1
+        )
+        TaskCommentModel.objects.create(
+            task=self.task, content="Comment", author=self.user2
+        )
+        url = reverse("task-list")
+
+        response = self.client.get(
+            url, {"normalize": "true", "comments": 1, "page_size": 10}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tasks = {task["title"]: task for task in response.data["results"]}
+        self.assertEqual(tasks["Task 2"]["created_by"], self.user2.id)
+        self.assertEqual(tasks["Task 2"]["assigned_to"], self.user1.id)
+        self.assertEqual(tasks["Test Task"]["comments"][0]["author"], self.user2.id)
+        users = response.data["included"]["users"]
+        self.assertEqual(set(users), {str(self.user1.id), str(self.user2.id)})
+        self.assertEqual(users[str(self.user2.id)]["username"], "testuser2")
+
+    def test_list_tasks_not_normalized_by_default(self):
+        """Тест, что без normalize пользователи встроены в задачи."""
+        url = reverse("task-list")
+
+        response = self.client.get(url, {"page_size": 10})
+
+        self.assertNotIn("included", response.data)
+        self.assertEqual(
+            response.data["results"][0]["created_by"]["username"], "testuser1"
+        )
+
+    def test_retrieve_task_not_modified(self):
+        """Тест условного GET задачи по ETag."""
+        url = reverse("task-detail", kwargs={"pk": self.task.id})
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        # Только запрос версии, без загрузки задачи и сериализации
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        TaskCommentModel.objects.create(
+            task=self.task, content="Comment", author=self.user1
+        )
+        call_command("recount_task_comments", stdout=StringIO())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_task_if_modified_since(self):
+        """Тест условного GET задачи по Last-Modified."""
+        url = reverse("task-detail", kwargs={"pk": self.task.id})
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_tasks_etag(self):
+        """Тест ETag списка: зависит от данных, параметров и формата."""
+        url = reverse("task-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotEqual(self.client.get(url, {"fields": "title"})["ETag"], etag)
+        self.assertNotEqual(
+            self.client.get(url, HTTP_ACCEPT="application/msgpack")["ETag"], etag
+        )
+
+        self.client.patch(
+            reverse("task-detail", kwargs={"pk": self.task.id}),
+            {"title": "Renamed"},
+            format="json",
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_missing_task_without_etag(self):
+        """Тест, что ответ 404 не содержит ETag."""
+        url = reverse("task-detail", kwargs={"pk": 9999})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("ETag", response)
+
+    def test_list_tasks_msgpack(self):
+        """Тест списка задач в формате MessagePack."""
+        url = reverse("task-list")
+
+        json_response = self.client.get(url)
+        response = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(
+            msgpack.unpackb(response.content, raw=False), json_response.json()
+        )
+        self.assertLess(len(response.content), len(json_response.content))
+
+    def test_create_task_msgpack(self):
+        """Тест создания задачи с телом запроса в формате MessagePack."""
+        url = reverse("task-list")
+        data = {"title": "Binary Task", "assigned_to": self.user2.id}
+
+        response = self.client.post(
+            url,
+            msgpack.packb(data),
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = msgpack.unpackb(response.content, raw=False)
+        self.assertEqual(task["title"], "Binary Task")
+        self.assertEqual(task["assigned_to"]["id"], self.user2.id)
+
+    def test_create_task_invalid_msgpack(self):
+        """Тест некорректного тела запроса в формате MessagePack."""
+        url = reverse("task-list")
+
+        response = self.client.post(url, b"\xc1", content_type="application/msgpack")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_retrieve_task_success(self):
         """Тест получения конкретной задачи."""
         url = reverse("task-detail", kwargs={"pk": self.task.id})
@@ -120,6 +465,61 @@ class TaskViewSetE2ETest(APITestCase):
         self.assertIsNone(response.data["assigned_to"])
         self.assertIsInstance(response.data["comments"], list)
 
+    def test_retrieve_task_latest_comments_only(self):
+        """Тест, что в задачу встраиваются только последние комментарии."""
+        for i in range(5):
+            TaskCommentModel.objects.create(
+                task=self.task, content=f"Comment {i}", author=self.user1
+            )
+        call_command("recount_task_comments", stdout=StringIO())
+        url = reverse("task-detail", kwargs={"pk": self.task.id})
+
+        with self.settings(TASKS_DETAIL_COMMENTS_LIMIT=2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["comment_count"], 5)
+        self.assertEqual(
+            [c["content"] for c in response.data["comments"]],
+            ["Comment 4", "Comment 3"],
+        )
+
+    def test_list_tasks_comment_count(self):
+        """Тест числа комментариев и последних комментариев в списке задач."""
+        for i in range(3):
+            TaskCommentModel.objects.create(
+                task=self.task, content=f"Comment {i}", author=self.user1
+            )
+        call_command("recount_task_comments", stdout=StringIO())
+        url = reverse("task-list")
+
+        response = self.client.get(url, {"page_size": 10})
+        task = response.data["results"][0]
+        self.assertEqual(task["comment_count"], 3)
+        self.assertEqual(task["comments"], [])
+
+        response = self.client.get(url, {"page_size": 10, "comments": 1})
+        task = response.data["results"][0]
+        self.assertEqual(task["comment_count"], 3)
+        self.assertEqual([c["content"] for c in task["comments"]], ["Comment 2"])
+
+    def test_get_task_comments_cursor_pagination(self):
+        """Тест обхода комментариев задачи по курсору."""
+        for i in range(5):
+            TaskCommentModel.objects.create(
+                task=self.task, content=f"Comment {i}", author=self.user1
+            )
+        url = reverse("task-comments", kwargs={"pk": self.task.id})
+
+        response = self.client.get(url, {"page_size": 2})
+        seen = [c["content"] for c in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [c["content"] for c in response.data["results"]]
+
+        self.assertEqual(seen, [f"Comment {i}" for i in range(4, -1, -1)])
+
     def test_retrieve_task_not_found(self):
         """Тест получения несуществующей задачи."""
         url = reverse("task-detail", kwargs={"pk": 9999})
@@ -177,6 +577,34 @@ class TaskViewSetE2ETest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["assigned_to"]["id"], self.user2.id)
 
+    def test_assign_task_query_count_independent_of_comments(self):
+        """Тест, что число запросов при назначении не зависит от комментариев."""
+        url = reverse("task-assign", kwargs={"pk": self.task.id})
+        data = {"assigned_to": self.user2.id}
+        TaskCommentModel.objects.create(
+            task=self.task, content="First Comment", author=self.user1
+        )
+        # Прогрев кэша пользователей, если он включен
+        self.client.patch(url, data, format="json")
+
+        with CaptureQueriesContext(connection) as one_comment:
+            self.client.patch(url, data, format="json")
+
+        for i in range(5):
+            TaskCommentModel.objects.create(
+                task=self.task, content=f"Comment {i}", author=self.user2
+            )
+        # Комментарии созданы в обход репозитория
+        DjangoCommentRepository().recount([self.task.id])
+        with CaptureQueriesContext(connection) as many_comments:
+            response = self.client.patch(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Ответ строится из строки UPDATE: число комментариев без списка
+        self.assertEqual(response.data["comment_count"], 6)
+        self.assertEqual(response.data["comments"], [])
+        self.assertEqual(len(many_comments), len(one_comment))
+
     def test_assign_task_invalid_user(self):
         """Тест назначения задачи несуществующему пользователю."""
         url = reverse("task-assign", kwargs={"pk": self.task.id})
@@ -195,6 +623,40 @@ class TaskViewSetE2ETest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], "completed")
 
+    def test_complete_task_single_update(self):
+        """Тест завершения задачи одним запросом к таблице задач."""
+        url = reverse("task-complete", kwargs={"pk": self.task.id})
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.patch(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        queries = [q["sql"] for q in captured if "tasks_task" in q["sql"]]
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0].startswith("UPDATE"))
+
+    def test_complete_task_keeps_concurrent_changes(self):
+        """Тест, что завершение не перезаписывает одновременные изменения."""
+        repository_update = DjangoTaskRepository.update_status
+
+        def concurrent_update(repository, task_id, *args, **kwargs):
+            # Другой запрос успевает переименовать задачу
+            TaskModel.objects.filter(id=task_id).update(
+                title="Renamed", updated_at=timezone.now()
+            )
+            return repository_update(repository, task_id, *args, **kwargs)
+
+        url = reverse("task-complete", kwargs={"pk": self.task.id})
+        with patch.object(
+            DjangoTaskRepository, "update_status", autospec=True
+        ) as update_status:
+            update_status.side_effect = concurrent_update
+            response = self.client.patch(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Renamed")
+        task = TaskModel.objects.get(id=self.task.id)
+        self.assertEqual((task.title, task.status), ("Renamed", "completed"))
+
     def test_complete_task_not_found(self):
         """Тест завершения несуществующей задачи."""
         url = reverse("task-complete", kwargs={"pk": 9999})
@@ -203,6 +665,23 @@ class TaskViewSetE2ETest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertIn("error", response.data)
 
+    def test_get_task_comments_normalized(self):
+        """Тест нормализованной страницы комментариев."""
+        for user in (self.user1, self.user2, self.user1):
+            TaskCommentModel.objects.create(
+                task=self.task, content="Comment", author=user
+            )
+        url = reverse("task-comments", kwargs={"pk": self.task.id})
+
+        response = self.client.get(url, {"normalize": "1"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [comment["author"] for comment in response.data["results"]],
+            [self.user1.id, self.user2.id, self.user1.id],
+        )
+        self.assertEqual(len(response.data["included"]["users"]), 2)
+
     def test_get_task_comments_success(self):
         """Тест получения комментариев задачи."""
         # Создаем комментарий
@@ -214,9 +693,9 @@ class TaskViewSetE2ETest(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["content"], "Test Comment")
-        self.assertEqual(response.data[0]["author"]["id"], self.user1.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["content"], "Test Comment")
+        self.assertEqual(response.data["results"][0]["author"]["id"], self.user1.id)
 
     def test_create_task_comment_success(self):
         """Тест успешного создания комментария к задаче."""
@@ -291,6 +770,100 @@ class TaskViewSetE2ETest(APITestCase):
             # Если пагинация не настроена, проверяем общее количество
             self.assertGreaterEqual(len(response.data), 15)
 
+    def test_pagination_page_size(self):
+        """Тест пагинации с явным размером страницы."""
+        for i in range(4):
+            TaskModel.objects.create(
+                title=f"Task {i}",
+                description=f"Description {i}",
+                status="pending",
+                created_by=self.user1,
+            )
+
+        url = reverse("task-list")
+        response = self.client.get(url, {"page_size": 2, "page": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+        self.assertIsNotNone(response.data["previous"])
+
+        response = self.client.get(url, {"page_size": 2, "page": 3})
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], self.task.id)
+        self.assertIsNone(response.data["next"])
+
+    def test_pagination_last_page(self):
+        """Тест запроса последней страницы по page=last."""
+        for i in range(4):
+            TaskModel.objects.create(
+                title=f"Task {i}",
+                description=f"Description {i}",
+                status="pending",
+                created_by=self.user1,
+            )
+
+        url = reverse("task-list")
+        response = self.client.get(url, {"page_size": 2, "page": "last"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(
+            [task["id"] for task in response.data["results"]], [self.task.id]
+        )
+        self.assertIsNone(response.data["next"])
+        self.assertIn("page=2", response.data["previous"])
+
+    def test_pagination_invalid_page(self):
+        """Тест запроса несуществующей страницы."""
+        url = reverse("task-list")
+
+        response = self.client.get(url, {"page_size": 2, "page": 5})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(url, {"page_size": 2, "page": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_pagination(self):
+        """Тест обхода списка задач по курсору."""
+        for i in range(4):
+            TaskModel.objects.create(
+                title=f"Task {i}",
+                description=f"Description {i}",
+                status="pending",
+                created_by=self.user1,
+            )
+
+        url = reverse("task-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"cursor": "", "page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertFalse(
+            any(
+                "COUNT(*)" in query["sql"].upper() for query in queries.captured_queries
+            )
+        )
+
+        seen = [task["id"] for task in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(task["id"] for task in response.data["results"])
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_cursor_pagination_invalid_cursor(self):
+        """Тест запроса с поврежденным курсором."""
+        url = reverse("task-list")
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 
 class TaskIntegrationTest(TestCase):
     """Интеграционные тесты для полного цикла работы с задачами."""
@@ -350,7 +923,7 @@ class TaskIntegrationTest(TestCase):
         # 5. Получаем комментарии
         get_comments_response = self.client.get(comments_url)
         self.assertEqual(get_comments_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(get_comments_response.data), 1)
+        self.assertEqual(len(get_comments_response.data["results"]), 1)
 
         # 6. Завершаем задачу
         complete_url = reverse("task-complete", kwargs={"pk": task_id})
@@ -371,3 +944,111 @@ class TaskIntegrationTest(TestCase):
         # 9. Проверяем, что задача удалена
         final_check_response = self.client.get(retrieve_url)
         self.assertEqual(final_check_response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tasks-endpoints-tests",
+        }
+    },
+    TASKS_CACHE_ENABLED=True,
+)
+class TaskReadCacheE2ETest(APITestCase):
+    """E2E тесты кэша чтения задач."""
+
+    def setUp(self):
+        """Настройка для каждого теста."""
+        caches["default"].clear()
+        self.user = User.objects.create_user(username="cacheuser", password="pass")
+        self.task = TaskModel.objects.create(title="Cached", created_by=self.user)
+        self.client.force_authenticate(user=self.user)
+        self.detail_url = reverse("task-detail", kwargs={"pk": self.task.id})
+
+    def tearDown(self):
+        caches["default"].clear()
+
+    def _task_queries(self, url, params=None):
+        """Ответ и запросы к таблицам задач и комментариев."""
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, params)
+        return response, [q["sql"] for q in captured if "tasks_task" in q["sql"]]
+
+    def test_detail_served_from_cache(self):
+        """Тест повторного чтения задачи из кэша."""
+        first, _ = self._task_queries(self.detail_url)
+
+        response, queries = self._task_queries(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), first.json())
+        # Только запрос версии для ETag
+        self.assertEqual(len(queries), 1)
+
+    def test_detail_invalidated_by_write(self):
+        """Тест сброса задачи при изменении и новом комментарии."""
+        self.client.get(self.detail_url)
+
+        self.client.patch(self.detail_url, {"title": "Renamed"}, format="json")
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["title"], "Renamed")
+
+        self.client.post(
+            reverse("task-comments", kwargs={"pk": self.task.id}),
+            {"content": "Comment"},
+            format="json",
+        )
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["comment_count"], 1)
+        self.assertEqual(response.data["comments"][0]["content"], "Comment")
+
+    def test_list_invalidated_by_create(self):
+        """Тест сброса страниц списка при создании задачи."""
+        list_url = reverse("task-list")
+        self.client.get(list_url, {"page_size": 10})
+        response, queries = self._task_queries(list_url, {"page_size": 10})
+        # Версия списка сохранена в кэше, агрегат повторяется только после записи
+        self.assertEqual(queries, [])
+
+        self.client.post(list_url, {"title": "New"}, format="json")
+        response = self.client.get(list_url, {"page_size": 10})
+
+        self.assertEqual(response.data["count"], 2)
+
+    def test_list_conditional_get_from_cached_version(self):
+        """Тест 304 для списка без запросов к задачам и нового ETag после записи."""
+        list_url = reverse("task-list")
+        first = self.client.get(list_url)
+        etag = first["ETag"]
+        self.assertIn("Last-Modified", first)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual([q["sql"] for q in captured if "tasks_task" in q["sql"]], [])
+
+        self.client.patch(self.detail_url, {"title": "Renamed"}, format="json")
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_user_change_invalidates_tasks(self):
+        """Тест сброса задач при изменении встроенного пользователя."""
+        self.client.get(self.detail_url)
+
+        self.user.first_name = "Новое"
+        self.user.save()
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.data["created_by"]["first_name"], "Новое")
+
+    def test_repository_update_invalidates_tasks(self):
+        """Тест сброса задач при изменении пользователя через репозиторий."""
+        self.client.get(self.detail_url)
+
+        get_user_repository().update_user(self.user.id, first_name="Профиль")
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.data["created_by"]["first_name"], "Профиль")
@@ -0,0 +1,145 @@
+"""
+Тесты для рендереров и парсеров API.
+"""
+
+import datetime
+import decimal
+import io
+import json
+import uuid
+from unittest.mock import patch
+
+import msgpack
+import pytest
+from config import renderers
+from config.parsers import MessagePackParser
+from config.renderers import FastJSONRenderer, MessagePackRenderer
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+
+class TestFastJSONRenderer:
+    """Тесты совпадения FastJSONRenderer с JSONRenderer."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"id": 1, "title": "Задача", "comments": [], "assigned_to": None},
+            [{"ok": True, "ratio": 0.5}, {"ok": False, "ratio": 12.75}],
+            {
+                "utc": datetime.datetime(
+                    2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+                ),
+                "msk": datetime.datetime(
+                    2024,
+                    1,
+                    2,
+                    3,
+                    4,
+                    5,
+                    123456,
+                    tzinfo=datetime.timezone(datetime.timedelta(hours=3)),
+                ),
+                "naive": datetime.datetime(2024, 1, 2, 3, 4, 5),
+                "date": datetime.date(2024, 1, 2),
+                "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            },
+            {"decimal": decimal.Decimal("1.50"), "lazy": gettext_lazy("Задачи")},
+            {"separator": "строка\u2028с\u2029разделителями"},
+            {0: "int key", "nested": {"a": [1, 2, {"b": None}]}},
+        ],
+    )
+    def test_matches_json_renderer(self, data):
+        """Тест побайтового совпадения с JSONRenderer."""
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_float_exponent(self):
+        """Тест чисел в экспоненциальной записи (различается только запись)."""
+        data = {"small": 1e-7, "large": 1.5e300}
+
+        assert json.loads(FastJSONRenderer().render(data)) == json.loads(
+            JSONRenderer().render(data)
+        )
+
+    def test_indent_uses_json_renderer(self):
+        """Тест запроса с отступами."""
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=4"
+
+        assert FastJSONRenderer().render(data, media_type) == JSONRenderer().render(
+            data, media_type
+        )
+
+    def test_none(self):
+        """Тест пустого ответа."""
+        assert FastJSONRenderer().render(None) == b""
+
+    @pytest.mark.parametrize(
+        "value", [float("nan"), float("inf"), -float("inf"), decimal.Decimal("NaN")]
+    )
+    def test_non_finite_float_rejected(self, value):
+        """Тест NaN и бесконечности: как JSONRenderer, а не null от orjson."""
+        data = {"ratio": value, "assigned_to": None}
+
+        with pytest.raises(ValueError, match="Out of range float values"):
+            FastJSONRenderer().render(data)
+
+    def test_non_finite_float_not_strict(self):
+        """Тест NaN при отключенном STRICT_JSON."""
+        data = {"ratio": float("nan")}
+        with patch.object(FastJSONRenderer, "strict", False):
+            rendered = FastJSONRenderer().render(data)
+
+        assert rendered == b'{"ratio":NaN}'
+
+    def test_big_integer(self):
+        """Тест целых больше 64 бит, которые orjson не кодирует."""
+        data = {"id": 2**64, "negative": -(2**70)}
+
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_fallback_without_orjson(self):
+        """Тест работы без установленного orjson."""
+        data = {"id": 1, "title": "Задача"}
+        with patch.object(renderers, "orjson", None):
+            assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class TestMessagePack:
+    """Тесты рендерера и парсера MessagePack."""
+
+    def test_matches_json_structure(self):
+        """Тест совпадения структуры ответа с JSON."""
+        data = {
+            "id": 1,
+            "title": "Задача",
+            "created_at": datetime.datetime(
+                2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+            ),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "lazy": gettext_lazy("Задачи"),
+            "comments": [{"id": 2, "author": None}],
+        }
+
+        body = MessagePackRenderer().render(data)
+
+        assert msgpack.unpackb(body, raw=False) == json.loads(
+            JSONRenderer().render(data)
+        )
+
+    def test_none(self):
+        """Тест пустого ответа."""
+        assert MessagePackRenderer().render(None) == b""
+
+    def test_parse(self):
+        """Тест разбора тела запроса."""
+        data = {"title": "Задача", "assigned_to": None, "ids": [1, 2]}
+
+        assert MessagePackParser().parse(io.BytesIO(msgpack.packb(data))) == data
+
+    @pytest.mark.parametrize("body", [b"\xc1", b"\x93\x01", b"\x01\x02"])
+    def test_parse_error(self, body):
+        """Тест некорректного тела запроса."""
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(body))
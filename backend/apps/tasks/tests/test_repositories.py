@@ -3,18 +3,39 @@
 """
 
 import datetime
+import re
+from io import StringIO
+from unittest.mock import patch
 
 import pytest
-from apps.tasks.domain.entities import Task, TaskComment, TaskStatus
+from apps.tasks.domain.entities import (
+    CursorPageRequest,
+    PageRequest,
+    Task,
+    TaskComment,
+    TaskFilter,
+    TaskStatus,
+)
+from apps.tasks.infrastructure.admin import TaskAdmin, TaskCommentAdmin
 from apps.tasks.infrastructure.models import TaskCommentModel, TaskModel
 from apps.tasks.infrastructure.repositories import (
     DjangoCommentRepository,
     DjangoTaskRepository,
 )
 from apps.users.domain.entities import User as DomainUser
+from config.cache import NegativeCache, get_negative_cache
+from django.contrib import admin
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.utils import timezone
 
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tasks-negative-cache-tests",
+    }
+}
+
 
 @pytest.mark.django_db
 class TestDjangoTaskRepository:
@@ -74,6 +95,194 @@ class TestDjangoTaskRepository:
         assert len(result) == 2
         assert all(isinstance(task, Task) for task in result)
 
+    def test_get_page(self):
+        """Тест получения страницы задач."""
+        for i in range(4):
+            TaskModel.objects.create(
+                title=f"Task {i}",
+                description=f"Description {i}",
+                status="pending",
+                created_by=self.user,
+            )
+
+        first_page = self.repository.get_page(PageRequest(limit=2))
+        last_page = self.repository.get_page(PageRequest(limit=2, offset=4))
+
+        assert first_page.total == 5
+        assert len(first_page.items) == 2
+        assert len(last_page.items) == 1
+        assert last_page.items[0].id == self.task_model.id
+
+    def test_get_page_query_count(self, django_assert_num_queries):
+        """Тест, что стоимость страницы не зависит от размера таблицы."""
+        for i in range(10):
+            TaskModel.objects.create(
+                title=f"Task {i}",
+                description=f"Description {i}",
+                status="pending",
+                created_by=self.user,
+            )
+
+        # COUNT и страница задач с числом комментариев, без их загрузки
+        with django_assert_num_queries(2):
+            page = self.repository.get_page(PageRequest(limit=3))
+
+        assert len(page.items) == 3
+        assert all(task.comments == [] for task in page.items)
+
+    def test_latest_comments_limit(self, django_assert_num_queries):
+        """Тест загрузки только последних комментариев для каждой задачи."""
+        other = TaskModel.objects.create(title="Other", created_by=self.user)
+        for task_model in (self.task_model, other):
+            for i in range(4):
+                TaskCommentModel.objects.create(
+                    task=task_model, content=f"Comment {i}", author=self.user
+                )
+        call_command("recount_task_comments", stdout=StringIO())
+
+        # COUNT, страница задач и один запрос последних комментариев всех задач
+        with django_assert_num_queries(3):
+            page = self.repository.get_page(PageRequest(limit=10, comments_limit=2))
+
+        for task in page.items:
+            assert task.comment_count == 4
+            assert [comment.content for comment in task.comments] == [
+                "Comment 3",
+                "Comment 2",
+            ]
+
+    def test_repository_comments_limit_for_detail(self):
+        """Тест ограничения комментариев задачи, заданного в репозитории."""
+        for i in range(3):
+            TaskCommentModel.objects.create(
+                task=self.task_model, content=f"Comment {i}", author=self.user
+            )
+        call_command("recount_task_comments", stdout=StringIO())
+
+        task = DjangoTaskRepository(comments_limit=1).get_by_id(self.task_model.id)
+
+        assert task.comment_count == 3
+        assert [comment.content for comment in task.comments] == ["Comment 2"]
+
+    def test_get_page_sparse_fields(self, django_assert_max_num_queries):
+        """Тест загрузки только запрошенных полей без JOIN и комментариев."""
+        TaskCommentModel.objects.create(
+            task=self.task_model, content="Comment", author=self.user
+        )
+        fields = frozenset({"id", "title", "status"})
+
+        with django_assert_max_num_queries(2) as captured:
+            page = self.repository.get_page(
+                PageRequest(limit=10, comments_limit=5, fields=fields)
+            )
+            task = page.items[0]
+            assert task.title == "Test Task"
+            assert task.status == TaskStatus.PENDING
+
+        sql = captured.captured_queries[-1]["sql"]
+        assert "JOIN" not in sql
+        assert '"description"' not in sql
+        assert task.description is None
+        assert task.created_by is None
+        assert task.comments == []
+
+    def test_get_by_id_sparse_fields_with_users(self, django_assert_num_queries):
+        """Тест JOIN только запрошенного пользователя."""
+        fields = frozenset({"id", "created_by", "assigned_to"})
+
+        with django_assert_num_queries(1) as captured:
+            task = self.repository.get_by_id(self.task_model.id, fields=fields)
+            assert task.created_by.username == "testuser"
+            assert task.assigned_to is None
+
+        assert captured.captured_queries[0]["sql"].count("JOIN") == 2
+
+        task = self.repository.get_by_id(
+            self.task_model.id, fields=frozenset({"id", "created_by"})
+        )
+        assert task.created_by.email == "test@example.com"
+        assert task.title is None
+
+    def test_get_by_id_sparse_fields_with_comments(self):
+        """Тест загрузки комментариев, только если они запрошены."""
+        TaskCommentModel.objects.create(
+            task=self.task_model, content="Comment", author=self.user
+        )
+
+        task = self.repository.get_by_id(
+            self.task_model.id, fields=frozenset({"id", "comments"})
+        )
+
+        assert [comment.content for comment in task.comments] == ["Comment"]
+        assert task.comment_count is None
+
+    def test_get_cursor_page_walks_all_tasks(self):
+        """Тест обхода всех задач по курсору."""
+        for i in range(4):
+            TaskModel.objects.create(
+                title=f"Task {i}",
+                description=f"Description {i}",
+                status="pending",
+                created_by=self.user,
+            )
+
+        seen = []
+        page = self.repository.get_cursor_page(CursorPageRequest(limit=2))
+        seen.extend(task.id for task in page.items)
+        while page.next_cursor is not None:
+            page = self.repository.get_cursor_page(
+                CursorPageRequest(limit=2, after=page.next_cursor)
+            )
+            seen.extend(task.id for task in page.items)
+
+        expected = list(
+            TaskModel.objects.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        assert seen == expected
+        assert page.total is None
+
+    def test_get_cursor_page_same_created_at(self):
+        """Тест курсора для задач с одинаковым временем создания."""
+        other = TaskModel.objects.create(
+            title="Task 2", description="", status="pending", created_by=self.user
+        )
+        TaskModel.objects.filter(id=other.id).update(
+            created_at=self.task_model.created_at
+        )
+
+        first = self.repository.get_cursor_page(CursorPageRequest(limit=1))
+        second = self.repository.get_cursor_page(
+            CursorPageRequest(limit=1, after=first.next_cursor)
+        )
+
+        assert first.items[0].id == other.id
+        assert second.items[0].id == self.task_model.id
+        assert second.next_cursor is None
+
+    def test_users_shared_within_result_set(self):
+        """Тест, что один пользователь - один доменный объект в выборке."""
+        TaskModel.objects.create(
+            title="Task 2",
+            description="Description 2",
+            status="pending",
+            created_by=self.user,
+            assigned_to=self.user,
+        )
+        for i in range(3):
+            TaskCommentModel.objects.create(
+                task=self.task_model, content=f"Comment {i}", author=self.user
+            )
+
+        tasks = self.repository.get_all()
+        users = [task.created_by for task in tasks]
+        users += [task.assigned_to for task in tasks if task.assigned_to]
+        users += [comment.author for task in tasks for comment in task.comments]
+
+        assert len(users) == 6
+        assert all(user is users[0] for user in users)
+
     def test_save_new_task(self):
         """Тест сохранения новой задачи."""
         domain_user = DomainUser(
@@ -129,6 +338,304 @@ class TestDjangoTaskRepository:
         assert updated_model.description == "Updated Description"
         assert updated_model.status == "in_progress"
 
+    def test_save_existing_task_single_query(self, django_assert_num_queries):
+        """Тест, что обновление задачи - один UPDATE без повторной загрузки."""
+        for i in range(3):
+            TaskCommentModel.objects.create(
+                task=self.task_model, content=f"Comment {i}", author=self.user
+            )
+        domain_task = self.repository.get_by_id(self.task_model.id)
+        domain_task.status = TaskStatus.COMPLETED
+
+        with django_assert_num_queries(1):
+            result = self.repository.save(domain_task, fields=["status"])
+
+        assert result.status == TaskStatus.COMPLETED
+        assert len(result.comments) == 3
+        assert TaskModel.objects.get(id=self.task_model.id).status == "completed"
+
+    def test_save_only_given_fields(self):
+        """Тест обновления только переданных полей."""
+        domain_task = self.repository.get_by_id(self.task_model.id)
+        TaskModel.objects.filter(id=self.task_model.id).update(title="Concurrent")
+
+        domain_task.status = TaskStatus.IN_PROGRESS
+        self.repository.save(domain_task, fields=["status"])
+
+        updated_model = TaskModel.objects.get(id=self.task_model.id)
+        assert updated_model.title == "Concurrent"
+        assert updated_model.status == "in_progress"
+        assert updated_model.updated_at > self.task_model.updated_at
+
+    def test_save_new_task_single_query(self, django_assert_num_queries):
+        """Тест, что создание задачи - один INSERT."""
+        domain_task = self.repository.get_by_id(self.task_model.id)
+        domain_task.id = None
+
+        with django_assert_num_queries(1):
+            result = self.repository.save(domain_task)
+
+        assert result.id != self.task_model.id
+        assert result.created_by.id == self.user.id
+
+    def test_bulk_create(self, django_assert_num_queries):
+        """Тест пакетного создания задач."""
+        domain_user = DomainUser(
+            id=self.user.id,
+            username=self.user.username,
+            first_name=self.user.first_name,
+            last_name=self.user.last_name,
+            email=self.user.email,
+        )
+        tasks = [
+            Task(
+                id=None,
+                title=f"Bulk Task {i}",
+                description="",
+                status=TaskStatus.PENDING,
+                created_at=timezone.now(),
+                updated_at=timezone.now(),
+                assigned_to=domain_user if i % 2 else None,
+                created_by=domain_user,
+                comments=[],
+            )
+            for i in range(5)
+        ]
+
+        # Два пакета INSERT плюс SAVEPOINT/RELEASE транзакции
+        with django_assert_num_queries(4):
+            result = self.repository.bulk_create(tasks, batch_size=3)
+
+        assert all(task.id is not None for task in result)
+        assert TaskModel.objects.filter(title__startswith="Bulk Task").count() == 5
+        assert TaskModel.objects.get(id=result[1].id).assigned_to_id == self.user.id
+
+    def test_bulk_update_by_filter(self, django_assert_num_queries):
+        """Тест пакетного изменения задач по фильтру порциями."""
+        TaskModel.objects.bulk_create(
+            [
+                TaskModel(title=f"Bulk {i}", status="in_progress", created_by=self.user)
+                for i in range(5)
+            ]
+        )
+        expected_ids = list(
+            TaskModel.objects.filter(status="in_progress")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        # Три выборки ID (последняя пустая) и два UPDATE в SAVEPOINT
+        with django_assert_num_queries(9):
+            result = self.repository.bulk_update(
+                TaskFilter(status=TaskStatus.IN_PROGRESS),
+                batch_size=3,
+                status=TaskStatus.COMPLETED,
+                assigned_to_id=self.user.id,
+                return_ids=True,
+            )
+
+        assert result.updated == 5
+        assert result.ids == expected_ids
+        assert (
+            TaskModel.objects.filter(status="completed", assigned_to=self.user).count()
+            == 5
+        )
+        self.task_model.refresh_from_db()
+        assert self.task_model.status == "pending"
+
+    def test_bulk_update_by_ids_chunks(self, django_assert_num_queries):
+        """Тест порций по списку ID: каждый UPDATE получает только свои ID."""
+        TaskModel.objects.bulk_create(
+            [TaskModel(title=f"Bulk {i}", created_by=self.user) for i in range(4)]
+        )
+        ids = list(TaskModel.objects.order_by("id").values_list("id", flat=True))
+        other = TaskModel.objects.create(
+            title="Other", status="in_progress", created_by=self.user
+        )
+
+        # Без выборок ID: два UPDATE в SAVEPOINT, повторы ID отбрасываются
+        with django_assert_num_queries(6) as captured:
+            result = self.repository.bulk_update(
+                TaskFilter(
+                    ids=list(reversed(ids)) + ids + [other.id],
+                    status=TaskStatus.PENDING,
+                ),
+                batch_size=3,
+                status=TaskStatus.COMPLETED,
+            )
+
+        in_lists = [
+            re.search(r"IN \(([^)]*)\)", query["sql"]).group(1).split(",")
+            for query in captured.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        assert [len(in_list) for in_list in in_lists] == [3, 3]
+        assert result.updated == 5
+        other.refresh_from_db()
+        assert other.status == "in_progress"
+
+    def test_bulk_update_by_ids_return_ids_sorted(self):
+        """Тест возврата ID по возрастанию, когда часть порции не обновлена."""
+        TaskModel.objects.bulk_create(
+            [TaskModel(title=f"Bulk {i}", created_by=self.user) for i in range(5)]
+        )
+        ids = list(TaskModel.objects.order_by("id").values_list("id", flat=True))
+        TaskModel.objects.filter(id=ids[1]).update(status="completed")
+
+        result = self.repository.bulk_update(
+            TaskFilter(ids=list(reversed(ids)), status=TaskStatus.PENDING),
+            batch_size=4,
+            status=TaskStatus.IN_PROGRESS,
+            return_ids=True,
+        )
+
+        assert result.updated == len(ids) - 1
+        assert result.ids == [task_id for task_id in ids if task_id != ids[1]]
+
+    def test_bulk_update_by_ids_unassign(self):
+        """Тест пакетного снятия назначения по списку ID."""
+        TaskModel.objects.filter(id=self.task_model.id).update(assigned_to=self.user)
+
+        result = self.repository.bulk_update(
+            TaskFilter(ids=[self.task_model.id, 999999]),
+            batch_size=100,
+            assigned_to_id=0,
+        )
+
+        assert result.updated == 1
+        assert result.ids is None
+        self.task_model.refresh_from_db()
+        assert self.task_model.assigned_to_id is None
+        assert self.task_model.status == "pending"
+
+    def test_update_status_single_query(self, django_assert_num_queries):
+        """Тест изменения статуса одним UPDATE ... RETURNING."""
+        with django_assert_num_queries(1):
+            row = self.repository.update_status(
+                self.task_model.id, TaskStatus.COMPLETED
+            )
+
+        updated_model = TaskModel.objects.get(id=self.task_model.id)
+        assert updated_model.status == "completed"
+        assert row.status == TaskStatus.COMPLETED
+        assert row.updated_at == updated_model.updated_at
+        assert row.created_at == updated_model.created_at
+        assert row.title == "Test Task"
+        assert row.created_by_id == self.user.id
+        assert row.assigned_to_id is None
+
+    def test_update_status_keeps_concurrent_changes(self):
+        """Тест, что UPDATE статуса не перезаписывает другие колонки."""
+        TaskModel.objects.filter(id=self.task_model.id).update(title="Renamed")
+
+        row = self.repository.update_status(self.task_model.id, TaskStatus.COMPLETED)
+
+        assert row.title == "Renamed"
+        assert TaskModel.objects.get(id=self.task_model.id).title == "Renamed"
+
+    def test_update_status_missing_task(self):
+        """Тест изменения статуса несуществующей задачи."""
+        assert self.repository.update_status(999999, TaskStatus.COMPLETED) is None
+
+    def test_update_assignee_single_query(self, django_assert_num_queries):
+        """Тест назначения одним UPDATE ... RETURNING."""
+        with django_assert_num_queries(1):
+            row = self.repository.update_assignee(self.task_model.id, self.user.id)
+
+        assert row.assigned_to_id == self.user.id
+        assert TaskModel.objects.get(id=self.task_model.id).assigned_to_id == (
+            self.user.id
+        )
+
+    def test_update_without_returning(self, django_assert_num_queries):
+        """Тест чтения строки отдельным запросом, если RETURNING недоступен."""
+        with patch(
+            "apps.tasks.infrastructure.repositories._can_return_from_update",
+            return_value=False,
+        ):
+            # UPDATE и SELECT в SAVEPOINT
+            with django_assert_num_queries(4):
+                row = self.repository.update_assignee(self.task_model.id, self.user.id)
+            assert self.repository.update_assignee(999999, None) is None
+
+        updated_model = TaskModel.objects.get(id=self.task_model.id)
+        assert row.assigned_to_id == self.user.id
+        assert row.updated_at == updated_model.updated_at
+
+    def test_missing_task_cached(self, settings, django_assert_num_queries):
+        """Тест, что повторный запрос отсутствующей задачи не доходит до БД."""
+        settings.CACHES = LOCMEM_CACHES
+        repository = DjangoTaskRepository(missing=NegativeCache("tasks:", ttl=60))
+        missing_id = self.task_model.id + 100
+
+        assert repository.get_by_id(missing_id) is None
+
+        with django_assert_num_queries(0):
+            assert repository.get_by_id(missing_id) is None
+            assert repository.get_version(missing_id) is None
+
+    def test_created_task_forgets_missing(self, settings):
+        """Тест сброса отсутствия при создании задачи любым способом."""
+        settings.CACHES = LOCMEM_CACHES
+        repository = DjangoTaskRepository(missing=get_negative_cache("tasks:"))
+        next_ids = range(self.task_model.id + 1, self.task_model.id + 10)
+        repository.missing.add(next_ids)
+
+        # post_save модели
+        created = TaskModel.objects.create(title="Created", created_by=self.user)
+        assert repository.get_by_id(created.id) is not None
+
+        # bulk_create репозитория без post_save
+        task = repository.get_by_id(created.id)
+        task.id = None
+        (bulk,) = repository.bulk_create([task], batch_size=10)
+        assert repository.get_by_id(bulk.id) is not None
+
+    def test_get_version(self):
+        """Тест версии задачи: меняется при изменении задачи и комментариев."""
+        comments = DjangoCommentRepository()
+        version = self.repository.get_version(self.task_model.id)
+        assert version.last_modified == self.task_model.updated_at
+
+        comment = comments.save(
+            TaskComment(
+                id=None,
+                content="Comment",
+                author=DomainUser(
+                    id=self.user.id,
+                    username=self.user.username,
+                    first_name=None,
+                    last_name=None,
+                    email=None,
+                ),
+                task_id=self.task_model.id,
+                created_at=None,
+            )
+        )
+        with_comment = self.repository.get_version(self.task_model.id)
+        assert with_comment.key != version.key
+        assert with_comment.last_modified == comment.created_at
+
+        # После удаления представление задачи снова совпадает с исходным
+        comments.delete(comment.id)
+        assert self.repository.get_version(self.task_model.id).key == version.key
+        assert self.repository.get_version(9999) is None
+
+    def test_get_list_version(self, django_assert_num_queries):
+        """Тест версии списка одним запросом, в том числе после удаления."""
+        other = TaskModel.objects.create(title="Other", created_by=self.user)
+
+        with django_assert_num_queries(1):
+            version = self.repository.get_list_version()
+
+        assert version.last_modified == other.updated_at
+        self.repository.delete(other.id)
+        assert self.repository.get_list_version().key != version.key
+
+        TaskModel.objects.all().delete()
+        empty = self.repository.get_list_version()
+        assert empty.last_modified is None
+
     def test_delete_existing_task(self):
         """Тест удаления существующей задачи."""
         task_id = self.task_model.id
@@ -223,6 +730,29 @@ class TestDjangoCommentRepository:
 
         assert len(result) == 0
 
+    def test_get_page_by_task_id_walks_all_comments(self):
+        """Тест обхода комментариев задачи по курсору, начиная с новых."""
+        for i in range(4):
+            TaskCommentModel.objects.create(
+                task=self.task, content=f"Comment {i}", author=self.user
+            )
+
+        page = self.repository.get_page_by_task_id(
+            self.task.id, CursorPageRequest(limit=3)
+        )
+        assert [c.content for c in page.items] == [
+            "Comment 3",
+            "Comment 2",
+            "Comment 1",
+        ]
+        assert page.next_cursor is not None
+
+        page = self.repository.get_page_by_task_id(
+            self.task.id, CursorPageRequest(limit=3, after=page.next_cursor)
+        )
+        assert [c.content for c in page.items] == ["Comment 0", "Test Comment"]
+        assert page.next_cursor is None
+
     def test_get_by_task_id_nonexistent_task(self):
         """Тест получения комментариев для несуществующей задачи."""
         result = self.repository.get_by_task_id(9999)
@@ -261,6 +791,126 @@ class TestDjangoCommentRepository:
         assert saved_comment.author.id == self.user.id
         assert saved_comment.task.id == self.task.id
 
+    def test_save_and_delete_maintain_task_counters(self):
+        """Тест обновления comment_count и last_comment_at задачи."""
+        domain_user = DomainUser(
+            id=self.user.id,
+            username=self.user.username,
+            first_name=self.user.first_name,
+            last_name=self.user.last_name,
+            email=self.user.email,
+        )
+        TaskModel.objects.filter(id=self.task.id).update(
+            comment_count=1, last_comment_at=self.comment.created_at
+        )
+
+        result = self.repository.save(
+            TaskComment(
+                id=None,
+                content="New Comment",
+                author=domain_user,
+                task_id=self.task.id,
+                created_at=timezone.now(),
+            )
+        )
+
+        self.task.refresh_from_db()
+        assert self.task.comment_count == 2
+        assert self.task.last_comment_at == result.created_at
+
+        assert self.repository.delete(result.id) is True
+        self.task.refresh_from_db()
+        assert self.task.comment_count == 1
+        assert self.task.last_comment_at == self.comment.created_at
+
+        assert self.repository.delete(9999) is False
+        self.task.refresh_from_db()
+        assert self.task.comment_count == 1
+
+    def test_counters_monotonic_and_non_negative(self):
+        """Тест: last_comment_at не уходит назад, comment_count - ниже нуля."""
+        later = timezone.now() + datetime.timedelta(hours=1)
+        TaskModel.objects.filter(id=self.task.id).update(
+            comment_count=0, last_comment_at=later
+        )
+
+        result = self.repository.save(
+            TaskComment(
+                id=None,
+                content="Committed late",
+                author=DomainUser(
+                    id=self.user.id,
+                    username=self.user.username,
+                    first_name=None,
+                    last_name=None,
+                    email=None,
+                ),
+                task_id=self.task.id,
+                created_at=None,
+            )
+        )
+        self.task.refresh_from_db()
+        assert self.task.last_comment_at == later
+
+        TaskModel.objects.filter(id=self.task.id).update(comment_count=0)
+        assert self.repository.delete(result.id) is True
+        self.task.refresh_from_db()
+        assert self.task.comment_count == 0
+
+    def test_admin_keeps_counters(self):
+        """Тест пересчета счетчиков при изменениях комментариев в админке."""
+        comment_admin = TaskCommentAdmin(TaskCommentModel, admin.site)
+        other_task = TaskModel.objects.create(title="Other", created_by=self.user)
+
+        comment = TaskCommentModel(task=self.task, content="Admin", author=self.user)
+        comment_admin.save_model(None, comment, None, change=False)
+        self.task.refresh_from_db()
+        assert self.task.comment_count == 2
+        assert self.task.last_comment_at == comment.created_at
+
+        comment.task = other_task
+        comment_admin.save_model(None, comment, None, change=True)
+        self.task.refresh_from_db()
+        other_task.refresh_from_db()
+        assert self.task.comment_count == 1
+        assert self.task.last_comment_at == self.comment.created_at
+        assert other_task.comment_count == 1
+
+        comment_admin.delete_queryset(None, TaskCommentModel.objects.all())
+        self.task.refresh_from_db()
+        other_task.refresh_from_db()
+        assert (self.task.comment_count, self.task.last_comment_at) == (0, None)
+        assert other_task.comment_count == 0
+
+    def test_admin_task_save_keeps_counters(self):
+        """Тест, что сохранение задачи в админке не затирает счетчики."""
+        task_admin = TaskAdmin(TaskModel, admin.site)
+        TaskModel.objects.filter(id=self.task.id).update(comment_count=1)
+        stale = TaskModel.objects.get(id=self.task.id)
+        TaskModel.objects.filter(id=self.task.id).update(comment_count=5)
+
+        stale.title = "Admin"
+        task_admin.save_model(None, stale, None, change=True)
+
+        self.task.refresh_from_db()
+        assert self.task.title == "Admin"
+        assert self.task.comment_count == 5
+
+    def test_user_delete_recounts_tasks(self):
+        """Тест пересчета счетчиков при каскадном удалении комментариев автора."""
+        author = User.objects.create_user(username="author", password="pass")
+        for content in ("First", "Second"):
+            TaskCommentModel.objects.create(
+                task=self.task, content=content, author=author
+            )
+        self.repository.recount([self.task.id])
+
+        author.delete()
+
+        self.task.refresh_from_db()
+        assert self.task.comment_count == 1
+        assert self.task.last_comment_at == self.comment.created_at
+
     def test_to_domain_conversion(self):
         """Тест преобразования Django модели комментария в доменную сущность."""
         result = self.repository.get_by_task_id(self.task.id)
@@ -0,0 +1,133 @@
+"""
+Тесты для сериализации доменных объектов.
+"""
+
+import datetime
+import json
+
+import pytest
+from apps.tasks.domain.entities import Task, TaskComment, TaskStatus
+from apps.tasks.endpoints.fast_serializers import (
+    DomainPayloadSerializer,
+    serialize_comments,
+    serialize_task,
+    serialize_tasks,
+)
+from apps.tasks.endpoints.serializers import (
+    DomainCommentSerializer,
+    DomainTaskSerializer,
+)
+from apps.users.domain.entities import User
+from django.utils import timezone
+
+
+def dumps(data):
+    """JSON с сохранением порядка ключей для точного сравнения."""
+    return json.dumps(data, ensure_ascii=False)
+
+
+class TestFastTaskSerializer:
+    """Тесты совпадения быстрой сериализации с DomainTaskSerializer."""
+
+    def setup_method(self):
+        """Настройка для каждого теста."""
+        self.author = User(
+            id=1, username="author", first_name="Автор", last_name="", email="a@a.ru"
+        )
+        self.assignee = User(
+            id=2, username="assignee", first_name=None, last_name=None, email=None
+        )
+        created_at = datetime.datetime(
+            2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc
+        )
+        self.comments = [
+            TaskComment(
+                id=10 + i,
+                content=f"Комментарий {i}",
+                author=self.assignee if i % 2 else self.author,
+                task_id=1,
+                created_at=created_at + datetime.timedelta(minutes=i),
+            )
+            for i in range(3)
+        ]
+        self.task = Task(
+            id=1,
+            title="Задача",
+            description="",
+            status=TaskStatus.IN_PROGRESS,
+            created_at=created_at,
+            updated_at=created_at.replace(microsecond=0),
+            assigned_to=self.assignee,
+            created_by=self.author,
+            comments=self.comments,
+            comment_count=7,
+            last_comment_at=created_at + datetime.timedelta(hours=1),
+        )
+        self.bare_task = Task(
+            id=2,
+            title="Без исполнителя",
+            description="Описание",
+            status=TaskStatus.PENDING,
+            created_at=created_at,
+            updated_at=created_at,
+            assigned_to=None,
+            created_by=self.author,
+            comments=[],
+        )
+
+    @pytest.mark.parametrize("tz", ["UTC", "Europe/Moscow", "America/New_York"])
+    def test_task_matches_drf(self, tz):
+        """Тест совпадения JSON задачи в разных часовых поясах."""
+        with timezone.override(tz):
+            for task in (self.task, self.bare_task):
+                assert dumps(serialize_task(task)) == dumps(
+                    DomainTaskSerializer(task).data
+                )
+
+    def test_task_list_matches_drf(self):
+        """Тест совпадения JSON списка задач."""
+        tasks = [self.task, self.bare_task, self.task]
+
+        assert dumps(serialize_tasks(tasks)) == dumps(
+            DomainTaskSerializer(tasks, many=True).data
+        )
+
+    def test_comments_match_drf(self):
+        """Тест совпадения JSON списка комментариев."""
+        assert dumps(serialize_comments(self.comments)) == dumps(
+            DomainCommentSerializer(self.comments, many=True).data
+        )
+
+    def test_utc_suffix(self):
+        """Тест формата дат в UTC."""
+        with timezone.override("UTC"):
+            data = serialize_task(self.bare_task)
+
+        assert data["created_at"] == "2024-01-02T03:04:05.123456Z"
+        assert data["last_comment_at"] is None
+        assert data["comment_count"] == 0
+
+    def test_sparse_fields(self):
+        """Тест выборочных полей в порядке представления."""
+        data = serialize_task(self.task, {"status", "id", "comment_count"})
+
+        assert list(data) == ["id", "status", "comment_count"]
+        assert data == {"id": 1, "status": "in_progress", "comment_count": 7}
+
+    def test_normalized_users(self):
+        """Тест ссылок на пользователей по ID и included.users."""
+        payload = DomainPayloadSerializer(normalize=True)
+
+        data = payload.tasks([self.task, self.bare_task])
+
+        assert data[0]["created_by"] == 1
+        assert data[0]["assigned_to"] == 2
+        assert [c["author"] for c in data[0]["comments"]] == [1, 2, 1]
+        assert data[1]["assigned_to"] is None
+        assert payload.included() == {
+            "users": {
+                "1": serialize_task(self.task)["created_by"],
+                "2": serialize_task(self.task)["assigned_to"],
+            }
+        }
+        assert DomainPayloadSerializer().included() is None
@@ -5,9 +5,21 @@
 from unittest.mock import Mock
 
 import pytest
-from apps.tasks.domain.entities import Task, TaskComment, TaskStatus, User
+from apps.tasks.domain.entities import (
+    BulkUpdateResult,
+    CursorPageRequest,
+    Page,
+    PageRequest,
+    Task,
+    TaskComment,
+    TaskFilter,
+    TaskRow,
+    TaskStatus,
+    User,
+)
 from apps.tasks.domain.interfaces import (
     CommentRepositoryInterface,
+    TaskCacheInterface,
     TaskRepositoryInterface,
     UserRepositoryInterface,
 )
@@ -51,7 +63,7 @@ class TestTaskService:
     def test_create_task_success(self):
         """Тест успешного создания задачи."""
         # Arrange
-        self.user_repo.get_by_id.return_value = self.test_user
+        self.user_repo.get_many.return_value = {1: self.test_user}
 
         # Создаем новую задачу для возврата из save
         new_task = Task(
@@ -78,13 +90,48 @@ class TestTaskService:
         assert result.description == "New Description"
         assert result.created_by == self.test_user
         assert result.status == TaskStatus.PENDING
-        self.user_repo.get_by_id.assert_called_once_with(1)
+        self.user_repo.get_many.assert_called_once_with({1})
         self.task_repo.save.assert_called_once()
 
+    def test_create_task_with_assignee_single_lookup(self):
+        """Тест, что создатель и исполнитель загружаются одним вызовом."""
+        # Arrange
+        assigned_user = User(
+            id=2,
+            username="assigned",
+            first_name="Assigned",
+            last_name="User",
+            email="assigned@example.com",
+        )
+        self.user_repo.get_many.return_value = {1: self.test_user, 2: assigned_user}
+        self.task_repo.save.side_effect = lambda task: task
+
+        # Act
+        result = self.service.create_task(
+            title="New Task", description="", created_by_id=1, assigned_to_id=2
+        )
+
+        # Assert
+        assert result.assigned_to == assigned_user
+        self.user_repo.get_many.assert_called_once_with({1, 2})
+        self.user_repo.get_by_id.assert_not_called()
+
+    def test_create_task_assignee_not_found(self):
+        """Тест создания задачи с несуществующим исполнителем."""
+        # Arrange
+        self.user_repo.get_many.return_value = {1: self.test_user}
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Назначенный пользователь с ID 999"):
+            self.service.create_task(
+                title="New Task", description="", created_by_id=1, assigned_to_id=999
+            )
+        self.task_repo.save.assert_not_called()
+
     def test_create_task_user_not_found(self):
         """Тест создания задачи с несуществующим пользователем."""
         # Arrange
-        self.user_repo.get_by_id.return_value = None
+        self.user_repo.get_many.return_value = {}
 
         # Act & Assert
         with pytest.raises(ValueError, match="Пользователь с ID 999 не найден"):
@@ -92,6 +139,100 @@ class TestTaskService:
                 title="New Task", description="New Description", created_by_id=999
             )
 
+    def test_create_tasks_success(self):
+        """Тест пакетного создания задач."""
+        # Arrange
+        assigned_user = User(
+            id=2,
+            username="assigned",
+            first_name="Assigned",
+            last_name="User",
+            email="assigned@example.com",
+        )
+        self.user_repo.get_many.return_value = {1: self.test_user, 2: assigned_user}
+        self.task_repo.bulk_create.side_effect = lambda tasks, batch_size: tasks
+        items = [
+            {"title": "Task 1", "description": "Description 1"},
+            {"title": "Task 2", "assigned_to": 2},
+        ]
+
+        # Act
+        results = self.service.create_tasks(items, created_by_id=1, batch_size=100)
+
+        # Assert
+        assert [result.index for result in results] == [0, 1]
+        assert all(result.error is None for result in results)
+        assert results[0].item.created_by == self.test_user
+        assert results[1].item.assigned_to == assigned_user
+        assert results[1].item.description == ""
+        self.user_repo.get_many.assert_called_once_with({1, 2})
+        self.task_repo.bulk_create.assert_called_once()
+        assert self.task_repo.bulk_create.call_args.kwargs["batch_size"] == 100
+
+    def test_create_tasks_unknown_assignee(self):
+        """Тест пакетного создания с несуществующим исполнителем."""
+        # Arrange
+        self.user_repo.get_many.return_value = {1: self.test_user}
+        items = [{"title": "Task 1"}, {"title": "Task 2", "assigned_to": 999}]
+
+        # Act
+        results = self.service.create_tasks(items, created_by_id=1)
+
+        # Assert
+        assert results[0].item is not None
+        assert results[1].item is None
+        assert "999" in results[1].error
+        created = self.task_repo.bulk_create.call_args.args[0]
+        assert [task.title for task in created] == ["Task 1"]
+
+    def test_create_tasks_creator_not_found(self):
+        """Тест пакетного создания несуществующим пользователем."""
+        # Arrange
+        self.user_repo.get_many.return_value = {}
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Пользователь с ID 999 не найден"):
+            self.service.create_tasks([{"title": "Task"}], created_by_id=999)
+        self.task_repo.bulk_create.assert_not_called()
+
+    def test_bulk_update_tasks_success(self):
+        """Тест пакетного изменения задач."""
+        # Arrange
+        self.user_repo.get_by_id.return_value = self.test_user
+        self.task_repo.bulk_update.return_value = BulkUpdateResult(updated=3)
+        task_filter = TaskFilter(status=TaskStatus.IN_PROGRESS)
+
+        # Act
+        result = self.service.bulk_update_tasks(
+            task_filter, status=TaskStatus.COMPLETED, assigned_to_id=1, batch_size=50
+        )
+
+        # Assert
+        assert result.updated == 3
+        self.task_repo.bulk_update.assert_called_once_with(
+            task_filter,
+            batch_size=50,
+            status=TaskStatus.COMPLETED,
+            assigned_to_id=1,
+            return_ids=False,
+        )
+
+    def test_bulk_update_tasks_unknown_assignee(self):
+        """Тест пакетного назначения несуществующему пользователю."""
+        # Arrange
+        self.user_repo.get_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="999"):
+            self.service.bulk_update_tasks(TaskFilter(ids=[1]), assigned_to_id=999)
+        self.task_repo.bulk_update.assert_not_called()
+
+    def test_bulk_update_tasks_empty_filter(self):
+        """Тест, что пакетное изменение без условий отбора запрещено."""
+        with pytest.raises(ValueError, match="условия отбора"):
+            self.service.bulk_update_tasks(TaskFilter(), status=TaskStatus.COMPLETED)
+        self.task_repo.bulk_update.assert_not_called()
+
     def test_get_task_by_id_success(self):
         """Тест успешного получения задачи по ID."""
         # Arrange
@@ -159,6 +300,23 @@ class TestTaskService:
         self.task_repo.get_by_id.assert_called_once_with(999)
         self.task_repo.save.assert_not_called()
 
+    def make_row(self, **changes):
+        """Строка тестовой задачи, возвращаемая UPDATE."""
+        values = dict(
+            id=1,
+            title="Test Task",
+            description="Test Description",
+            status=TaskStatus.PENDING,
+            created_at=self.test_task.created_at,
+            updated_at=timezone.now(),
+            created_by_id=1,
+            assigned_to_id=None,
+            comment_count=3,
+            last_comment_at=None,
+        )
+        values.update(changes)
+        return TaskRow(**values)
+
     def test_assign_task_success(self):
         """Тест успешного назначения задачи пользователю."""
         # Arrange
@@ -170,44 +328,89 @@ class TestTaskService:
             email="assigned@example.com",
         )
 
-        self.task_repo.get_by_id.return_value = self.test_task
+        row = self.make_row(assigned_to_id=2)
         self.user_repo.get_by_id.return_value = assigned_user
-        self.task_repo.save.return_value = self.test_task
+        self.user_repo.get_many.return_value = {1: self.test_user, 2: assigned_user}
+        self.task_repo.update_assignee.return_value = row
 
         # Act
         result = self.service.assign_task(task_id=1, user_id=2)
 
         # Assert
-        assert result is not None
         assert result.assigned_to == assigned_user
-        self.task_repo.get_by_id.assert_called_once_with(1)
+        assert result.created_by == self.test_user
+        assert result.updated_at == row.updated_at
+        assert result.comment_count == 3
+        assert result.comments == []
         self.user_repo.get_by_id.assert_called_once_with(2)
-        self.task_repo.save.assert_called_once()
+        self.user_repo.get_many.assert_called_once_with({1, 2})
+        self.task_repo.update_assignee.assert_called_once_with(1, 2)
+        self.task_repo.get_by_id.assert_not_called()
+        self.task_repo.save.assert_not_called()
+
+    def test_unassign_task(self):
+        """Тест снятия назначения без проверки пользователя."""
+        # Arrange
+        self.user_repo.get_many.return_value = {1: self.test_user}
+        self.task_repo.update_assignee.return_value = self.make_row()
+
+        # Act
+        result = self.service.assign_task(task_id=1, user_id=0)
+
+        # Assert
+        assert result.assigned_to is None
+        self.user_repo.get_by_id.assert_not_called()
+        self.task_repo.update_assignee.assert_called_once_with(1, None)
+
+    def test_assign_task_not_found(self):
+        """Тест назначения несуществующей задачи."""
+        # Arrange
+        self.user_repo.get_by_id.return_value = self.test_user
+        self.task_repo.update_assignee.return_value = None
+
+        # Act & Assert
+        assert self.service.assign_task(task_id=999, user_id=1) is None
 
     def test_assign_task_user_not_found(self):
         """Тест назначения задачи несуществующему пользователю."""
         # Arrange
-        self.task_repo.get_by_id.return_value = self.test_task
         self.user_repo.get_by_id.return_value = None
 
         # Act & Assert
         with pytest.raises(ValueError, match="Пользователь с ID 999 не найден"):
             self.service.assign_task(task_id=1, user_id=999)
+        self.task_repo.update_assignee.assert_not_called()
 
     def test_update_task_status_success(self):
         """Тест успешного обновления статуса задачи."""
         # Arrange
-        self.task_repo.get_by_id.return_value = self.test_task
-        self.task_repo.save.return_value = self.test_task
+        row = self.make_row(status=TaskStatus.COMPLETED)
+        self.user_repo.get_many.return_value = {1: self.test_user}
+        self.task_repo.update_status.return_value = row
 
         # Act
         result = self.service.update_task_status(1, TaskStatus.COMPLETED)
 
         # Assert
-        assert result is not None
         assert result.status == TaskStatus.COMPLETED
-        self.task_repo.get_by_id.assert_called_once_with(1)
-        self.task_repo.save.assert_called_once()
+        assert result.updated_at == row.updated_at
+        assert result.created_by == self.test_user
+        assert result.assigned_to is None
+        self.task_repo.update_status.assert_called_once_with(1, TaskStatus.COMPLETED)
+        self.task_repo.get_by_id.assert_not_called()
+        self.task_repo.save.assert_not_called()
+
+    def test_update_task_status_not_found(self):
+        """Тест обновления статуса несуществующей задачи."""
+        # Arrange
+        self.task_repo.update_status.return_value = None
+
+        # Act
+        result = self.service.update_task_status(999, TaskStatus.COMPLETED)
+
+        # Assert
+        assert result is None
+        self.user_repo.get_many.assert_not_called()
 
     def test_delete_task_success(self):
         """Тест успешного удаления задачи."""
@@ -234,6 +437,20 @@ class TestTaskService:
         assert result == tasks
         self.task_repo.get_all.assert_called_once()
 
+    def test_get_tasks_page(self):
+        """Тест получения страницы задач."""
+        # Arrange
+        page = Page(items=[self.test_task], total=1)
+        self.task_repo.get_page.return_value = page
+        page_request = PageRequest(limit=20)
+
+        # Act
+        result = self.service.get_tasks_page(page_request)
+
+        # Assert
+        assert result == page
+        self.task_repo.get_page.assert_called_once_with(page_request)
+
 
 class TestCommentService:
     """Тесты для CommentService."""
@@ -335,3 +552,117 @@ class TestCommentService:
         # Assert
         assert result == comments
         self.comment_repo.get_by_task_id.assert_called_once_with(1)
+
+    def test_get_task_comments_page(self):
+        """Тест получения страницы комментариев задачи."""
+        # Arrange
+        page_request = CursorPageRequest(limit=10)
+        page = Page(items=[self.test_comment])
+        self.comment_repo.get_page_by_task_id.return_value = page
+
+        # Act
+        result = self.service.get_task_comments_page(1, page_request)
+
+        # Assert
+        assert result is page
+        self.comment_repo.get_page_by_task_id.assert_called_once_with(1, page_request)
+
+
+class TestTaskCacheInvalidation:
+    """Тесты сброса кэша чтения задач сервисами."""
+
+    def setup_method(self):
+        """Настройка для каждого теста."""
+        self.task_repo = Mock(spec=TaskRepositoryInterface)
+        self.user_repo = Mock(spec=UserRepositoryInterface)
+        self.comment_repo = Mock(spec=CommentRepositoryInterface)
+        self.cache = Mock(spec=TaskCacheInterface)
+        self.service = TaskService(self.task_repo, self.user_repo, self.cache)
+        self.comment_service = CommentService(
+            self.comment_repo, self.task_repo, self.user_repo, self.cache
+        )
+
+        self.test_user = User(
+            id=1,
+            username="testuser",
+            first_name="Test",
+            last_name="User",
+            email="test@example.com",
+        )
+        self.test_task = Task(
+            id=1,
+            title="Test Task",
+            description="Test Description",
+            status=TaskStatus.PENDING,
+            created_at=timezone.now(),
+            updated_at=timezone.now(),
+            assigned_to=None,
+            created_by=self.test_user,
+            comments=[],
+        )
+
+    def test_create_task_invalidates_list(self):
+        """Тест сброса страниц списка при создании задачи."""
+        self.user_repo.get_many.return_value = {1: self.test_user}
+        self.task_repo.save.return_value = self.test_task
+
+        self.service.create_task(title="New", description="", created_by_id=1)
+
+        self.cache.invalidate_list.assert_called_once_with()
+        self.cache.invalidate_task.assert_not_called()
+
+    def test_update_status_invalidates_task(self):
+        """Тест сброса задачи при изменении статуса."""
+        self.user_repo.get_many.return_value = {1: self.test_user}
+        self.task_repo.update_status.return_value = TaskRow(
+            id=1,
+            title="Test Task",
+            description="",
+            status=TaskStatus.COMPLETED,
+            created_at=timezone.now(),
+            updated_at=timezone.now(),
+            created_by_id=1,
+            assigned_to_id=None,
+            comment_count=0,
+            last_comment_at=None,
+        )
+
+        self.service.update_task_status(1, TaskStatus.COMPLETED)
+
+        self.cache.invalidate_task.assert_called_once_with(1)
+
+    def test_missing_task_does_not_invalidate(self):
+        """Тест, что изменение несуществующей задачи не сбрасывает кэш."""
+        self.task_repo.update_assignee.return_value = None
+
+        assert self.service.assign_task(1, None) is None
+
+        self.cache.invalidate_task.assert_not_called()
+
+    def test_bulk_update_invalidates_all(self):
+        """Тест сброса всех представлений при пакетном изменении."""
+        self.task_repo.bulk_update.return_value = BulkUpdateResult(updated=2)
+
+        self.service.bulk_update_tasks(
+            TaskFilter(ids=[1, 2]), status=TaskStatus.COMPLETED
+        )
+
+        self.cache.invalidate_all.assert_called_once_with()
+
+    def test_delete_task_invalidates_task(self):
+        """Тест сброса задачи при удалении."""
+        self.task_repo.delete.return_value = True
+
+        self.service.delete_task(1)
+
+        self.cache.invalidate_task.assert_called_once_with(1)
+
+    def test_create_comment_invalidates_task(self):
+        """Тест сброса задачи при добавлении комментария."""
+        self.task_repo.get_by_id.return_value = self.test_task
+        self.user_repo.get_by_id.return_value = self.test_user
+        self.comment_repo.save.side_effect = lambda comment: comment
+
+        self.comment_service.create_comment(task_id=1, content="Text", author_id=1)
+
+        self.cache.invalidate_task.assert_called_once_with(1)
@@ -11,3 +11,34 @@ class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
     verbose_name = "Пользователи"
+
+    def ready(self):
+        from django.conf import settings
+        from django.db.models.signals import post_delete, post_save
+
+        from .infrastructure.authentication import track_deleted_user, track_saved_user
+        from .infrastructure.cache import invalidate_cached_user
+
+        # Изменения пользователей в обход UserService (админка, manage.py)
+        # также сбрасывают кэш
+        post_save.connect(
+            invalidate_cached_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="users_cache_post_save",
+        )
+        post_delete.connect(
+            invalidate_cached_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="users_cache_post_delete",
+        )
+        # Деактивация и удаление сразу учитываются JWT аутентификацией
+        post_save.connect(
+            track_saved_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="users_jwt_post_save",
+        )
+        post_delete.connect(
+            track_deleted_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="users_jwt_post_delete",
+        )
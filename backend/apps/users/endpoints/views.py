@@ -1,16 +1,21 @@
+from dataclasses import asdict
+from types import SimpleNamespace
+
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from ..domain.exceptions import EmailAlreadyExists, UsernameAlreadyExists
+from ..domain.exceptions import EmailAlreadyExists, UsernameAlreadyExists, UserNotFound
+from ..infrastructure.cache import get_user_repository
+from ..infrastructure.hashing import PasswordHashingBusy
 from ..infrastructure.jwt import (
     authenticate_user,
     blacklist_token,
     generate_tokens_for_user,
     refresh_access_token,
 )
-from ..infrastructure.repositories import DjangoUserRepository
+from ..infrastructure.last_login import last_login_buffer
 from ..services.user import UserService
 from .serializers import (
     LogoutSerializer,
@@ -21,6 +26,15 @@ from .serializers import (
 )
 
 
+def hashing_busy_response():
+    """Ответ при перегрузке пула хеширования паролей."""
+    return Response(
+        {"error": "Сервис аутентификации перегружен, повторите запрос позже"},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
 class UserRegistrationAPIView(APIView):
     """
     Представление для регистрации пользователя.
@@ -61,11 +75,12 @@ class UserRegistrationAPIView(APIView):
             400: OpenApiResponse(
                 description="Неверные данные или пользователь уже существует"
             ),
+            503: OpenApiResponse(description="Пул хеширования паролей перегружен"),
         },
     )
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.user_repo = DjangoUserRepository()
+        self.user_repo = get_user_repository()
         self.user_service = UserService(self.user_repo)
 
     def post(self, request):
@@ -98,6 +113,8 @@ class UserRegistrationAPIView(APIView):
 
         except (EmailAlreadyExists, UsernameAlreadyExists) as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except PasswordHashingBusy:
+            return hashing_busy_response()
 
 
 class UserLoginAPIView(APIView):
@@ -137,6 +154,7 @@ class UserLoginAPIView(APIView):
                 },
             },
             401: OpenApiResponse(description="Неверные учетные данные"),
+            503: OpenApiResponse(description="Пул хеширования паролей перегружен"),
         },
     )
     def post(self, request):
@@ -146,7 +164,10 @@ class UserLoginAPIView(APIView):
         username = serializer.validated_data["username"]
         password = serializer.validated_data["password"]
 
-        user = authenticate_user(username, password)
+        try:
+            user = authenticate_user(username, password)
+        except PasswordHashingBusy:
+            return hashing_busy_response()
         if not user:
             return Response(
                 {"error": "Неверные учетные данные"},
@@ -154,6 +175,7 @@ class UserLoginAPIView(APIView):
             )
 
         tokens = generate_tokens_for_user(user)
+        last_login_buffer.record(user.id)
 
         return Response(
             {"user": UserDetailSerializer(user).data, "tokens": tokens},
@@ -253,6 +275,10 @@ class UserProfileAPIView(APIView):
 
     permission_classes = [permissions.IsAuthenticated]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_service = UserService(get_user_repository())
+
     @extend_schema(
         summary="Получить профиль пользователя",
         description="Возвращает информацию о текущем аутентифицированном пользователе.",
@@ -260,8 +286,27 @@ class UserProfileAPIView(APIView):
         responses={
             200: UserDetailSerializer,
             401: OpenApiResponse(description="Не авторизован"),
+            404: OpenApiResponse(description="Пользователь не найден"),
         },
     )
     def get(self, request):
-        user = request.user
-        return Response(UserDetailSerializer(user).data, status=status.HTTP_200_OK)
+        try:
+            user = self.user_service.get_user_by_id(request.user.id)
+        except UserNotFound:
+            return Response(
+                {"error": "Пользователь не найден"}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(self.profile_data(request, user), status=status.HTTP_200_OK)
+
+    @staticmethod
+    def profile_data(request, user):
+        """
+        Профиль из доменного пользователя.
+
+        request.user может быть построен из claims токена, которые не
+        меняются до перевыпуска, поэтому изменяемые поля читаются через
+        репозиторий (с кэшем), а неизменная дата регистрации - из request.user.
+        """
+        return UserDetailSerializer(
+            SimpleNamespace(**asdict(user), date_joined=request.user.date_joined)
+        ).data
@@ -2,8 +2,14 @@
 Инфраструктурный слой аутентификации.
 """
 
+from .cache import CachedUserRepository, UserCache, get_user_repository
+from .identity_map import UserIdentityMap
 from .repositories import DjangoUserRepository
 
 __all__ = [
+    "CachedUserRepository",
     "DjangoUserRepository",
+    "UserCache",
+    "get_user_repository",
+    "UserIdentityMap",
 ]
@@ -0,0 +1,148 @@
+"""
+JWT аутентификация без запроса пользователя.
+
+Токены из generate_tokens_for_user содержат данные пользователя, поэтому
+пользователь запроса строится из проверенных claims. Вместо SELECT
+auth_user проверяется небольшое множество неактивных и удаленных
+пользователей в памяти процесса, которое периодически перечитывается
+из БД.
+"""
+
+import threading
+import time
+from typing import FrozenSet, Optional, Set
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+# Claims, которые generate_tokens_for_user добавляет в токен
+USER_CLAIMS = ("username", "email", "first_name", "last_name", "date_joined")
+
+
+class ClaimsUser(TokenUser):
+    """Пользователь запроса, построенный из claims токена."""
+
+    @cached_property
+    def email(self) -> str:
+        return self.token.get("email", "")
+
+    @cached_property
+    def first_name(self) -> str:
+        return self.token.get("first_name", "")
+
+    @cached_property
+    def last_name(self) -> str:
+        return self.token.get("last_name", "")
+
+    @cached_property
+    def date_joined(self):
+        return parse_datetime(self.token.get("date_joined", ""))
+
+
+class InactiveUsers:
+    """
+    Множество ID неактивных и удаленных пользователей.
+
+    Неактивные пользователи перечитываются из БД не чаще раза в
+    refresh_interval секунд. Тем же запросом проверяется, что
+    пользователи, встреченные с прошлого перечитывания, не удалены.
+    Изменения в текущем процессе учитываются сразу через сигналы модели,
+    в остальных процессах - после перечитывания.
+    """
+
+    def __init__(self, refresh_interval: float = 60):
+        self.refresh_interval = refresh_interval
+        self._inactive: FrozenSet[int] = frozenset()
+        self._deleted: Set[int] = set()
+        # Пользователи, принятые с прошлого перечитывания
+        self._seen: Set[int] = set()
+        self._expires_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, user_id: int) -> bool:
+        expires_at = self._expires_at
+        if expires_at is None or expires_at <= time.monotonic():
+            self.refresh()
+        if user_id in self._inactive or user_id in self._deleted:
+            return True
+        self._seen.add(user_id)
+        return False
+
+    def refresh(self) -> None:
+        """Перечитать неактивных и проверить встреченных пользователей."""
+        with self._lock:
+            seen, self._seen = self._seen, set()
+        rows = (
+            get_user_model()
+            .objects.filter(Q(is_active=False) | Q(id__in=seen))
+            .values_list("id", "is_active")
+        )
+        found = set()
+        inactive = set()
+        for user_id, is_active in rows:
+            found.add(user_id)
+            if not is_active:
+                inactive.add(user_id)
+        with self._lock:
+            self._inactive = frozenset(inactive)
+            # Удалены в другом процессе
+            self._deleted.update(seen - found)
+            self._expires_at = time.monotonic() + self.refresh_interval
+
+    def user_saved(self, user_id: int, is_active: bool) -> None:
+        """Учесть сохранение пользователя в текущем процессе."""
+        with self._lock:
+            self._deleted.discard(user_id)
+            if is_active and user_id in self._inactive:
+                self._inactive = self._inactive - {user_id}
+            elif not is_active and user_id not in self._inactive:
+                self._inactive = self._inactive | {user_id}
+
+    def user_deleted(self, user_id: int) -> None:
+        """Учесть удаление пользователя в текущем процессе."""
+        with self._lock:
+            self._deleted.add(user_id)
+
+
+inactive_users = InactiveUsers(refresh_interval=settings.JWT_INACTIVE_USERS_REFRESH)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT аутентификация без обращения к таблице пользователей.
+
+    Для токенов со всеми USER_CLAIMS возвращает ClaimsUser, если
+    пользователь не деактивирован и не удален. Токены, выпущенные до
+    появления claims, проверяются стандартным запросом к БД.
+    """
+
+    inactive_users = inactive_users
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token or not all(
+            claim in validated_token for claim in USER_CLAIMS
+        ):
+            return super().get_user(validated_token)
+
+        user = ClaimsUser(validated_token)
+        if user.id in self.inactive_users:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+def track_saved_user(sender, instance, **kwargs) -> None:
+    """Обработчик post_save модели пользователя."""
+    inactive_users.user_saved(instance.pk, instance.is_active)
+
+
+def track_deleted_user(sender, instance, **kwargs) -> None:
+    """Обработчик post_delete модели пользователя."""
+    inactive_users.user_deleted(instance.pk)
@@ -0,0 +1,156 @@
+"""
+Проверка черного списка refresh токенов через фильтр Блума.
+
+Стандартная проверка simplejwt выполняет запрос к BlacklistedToken при
+каждом обновлении токена, и ее стоимость растет вместе с таблицей. Здесь
+jti отозванных токенов хранятся в фильтре Блума в памяти процесса:
+отрицательный ответ фильтра окончателен, а положительный (включая ложные
+срабатывания) проверяется в БД.
+
+Фильтр дополняется новыми записями черного списка не чаще раза в
+sync_interval секунд и периодически перестраивается целиком, отбрасывая
+истекшие токены.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BloomFilter:
+    """Фильтр Блума для строк с заданной вероятностью ложного срабатывания."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1)
+        self.size = max(
+            int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self.hash_count = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        # Двойное хеширование: k позиций из двух половин одного дайджеста
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    @property
+    def full(self) -> bool:
+        """Превышена ли емкость (растет доля ложных срабатываний)."""
+        return self.count > self.capacity
+
+
+class BlacklistFilter:
+    """
+    Фильтр jti из черного списка, синхронизируемый с БД.
+
+    Токены, отозванные в текущем процессе, добавляются сразу, отозванные
+    в других процессах - при ближайшей синхронизации, то есть не позже
+    чем через sync_interval секунд.
+    """
+
+    # Полная перестройка: удаляет истекшие jti и подбирает записи,
+    # пропущенные инкрементальной синхронизацией (транзакции,
+    # зафиксированные не в порядке ID)
+    rebuild_interval = 300
+    # Запас емкости при перестройке
+    headroom = 2
+
+    def __init__(self, sync_interval: float = 5, error_rate: float = 0.01):
+        self.sync_interval = sync_interval
+        self.error_rate = error_rate
+        self._filter: Optional[BloomFilter] = None
+        self._last_id = 0
+        self._synced_at = 0.0
+        self._rebuilt_at = 0.0
+        self._lock = threading.Lock()
+
+    def might_contain(self, jti: str) -> bool:
+        """False, если токен точно не в черном списке."""
+        self.sync()
+        return jti in self._filter
+
+    def add(self, jti: str) -> None:
+        """Добавить отозванный в этом процессе токен."""
+        self.sync()
+        with self._lock:
+            self._filter.add(jti)
+
+    def sync(self, force: bool = False) -> None:
+        """Дополнить или перестроить фильтр, если подошел срок."""
+        now = time.monotonic()
+        if not force and now < self._synced_at + self.sync_interval:
+            return
+        with self._lock:
+            if not force and now < self._synced_at + self.sync_interval:
+                return
+            if (
+                force
+                or self._filter is None
+                or self._filter.full
+                or now >= self._rebuilt_at + self.rebuild_interval
+            ):
+                self._rebuild()
+            else:
+                self._extend(
+                    BlacklistedToken.objects.filter(id__gt=self._last_id).values_list(
+                        "id", "token__jti"
+                    )
+                )
+            self._synced_at = time.monotonic()
+
+    def _rebuild(self) -> None:
+        rows = list(
+            BlacklistedToken.objects.filter(
+                token__expires_at__gt=timezone.now()
+            ).values_list("id", "token__jti")
+        )
+        self._filter = BloomFilter(
+            max(len(rows) * self.headroom, 1024), self.error_rate
+        )
+        self._last_id = 0
+        self._extend(rows)
+        self._rebuilt_at = time.monotonic()
+
+    def _extend(self, rows: Iterable) -> None:
+        for row_id, jti in rows:
+            self._filter.add(jti)
+            self._last_id = max(self._last_id, row_id)
+
+
+blacklist_filter = BlacklistFilter(sync_interval=settings.JWT_BLACKLIST_SYNC_INTERVAL)
+
+
+class FilteredRefreshToken(RefreshToken):
+    """Refresh токен, проверяющий черный список через фильтр Блума."""
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if blacklist_filter.might_contain(jti):
+            super().check_blacklist()
+
+    def blacklist(self):
+        result = super().blacklist()
+        blacklist_filter.add(self.payload[api_settings.JTI_CLAIM])
+        return result
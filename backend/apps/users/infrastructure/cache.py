@@ -0,0 +1,196 @@
+"""
+Кэширование пользователей.
+
+Пользователи меняются редко, а читаются при каждой записи задачи
+и комментария, поэтому доменные User кэшируются в процессе
+(ограниченный LRU с TTL) и, при необходимости, в кэше Django.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from apps.users.domain.entities import User as DomainUser
+from config.cache import NegativeCache, get_negative_cache
+from django.conf import settings
+from django.core.cache import caches
+
+from .repositories import DjangoUserRepository
+
+
+class UserCache:
+    """
+    Ограниченный LRU кэш доменных пользователей с TTL.
+
+    Если указан cache_alias, промахи локального кэша проверяются
+    в кэше Django, общем для всех процессов.
+    """
+
+    key_prefix = "users:user:"
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300, cache_alias: str = ""):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+        self._users: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    @property
+    def shared(self):
+        """Общий кэш Django или None."""
+        if not self.cache_alias:
+            return None
+        return caches[self.cache_alias]
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    def _get_local(self, user_id: int) -> Optional[DomainUser]:
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._users[user_id]
+            return None
+        self._users.move_to_end(user_id)
+        return user
+
+    def _set_local(self, user: DomainUser) -> None:
+        self._users[user.id] = (user, time.monotonic() + self.ttl)
+        self._users.move_to_end(user.id)
+        while len(self._users) > self.max_size:
+            self._users.popitem(last=False)
+
+    def get(self, user_id: int) -> Optional[DomainUser]:
+        """Получить пользователя из кэша или None при промахе."""
+        return self.get_many([user_id]).get(user_id)
+
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, DomainUser]:
+        """Получить найденных в кэше пользователей."""
+        found = {}
+        missing = []
+        with self._lock:
+            for user_id in user_ids:
+                user = self._get_local(user_id)
+                if user is None:
+                    missing.append(user_id)
+                else:
+                    found[user_id] = user
+
+        shared = self.shared
+        if missing and shared is not None:
+            cached = shared.get_many([self._key(user_id) for user_id in missing])
+            with self._lock:
+                for user in cached.values():
+                    self._set_local(user)
+                    found[user.id] = user
+        return found
+
+    def set_many(self, users: Iterable[DomainUser]) -> None:
+        """Положить пользователей в кэш."""
+        users = list(users)
+        with self._lock:
+            for user in users:
+                self._set_local(user)
+
+        shared = self.shared
+        if users and shared is not None:
+            shared.set_many(
+                {self._key(user.id): user for user in users}, timeout=self.ttl
+            )
+
+    def invalidate(self, user_id: int) -> None:
+        """Удалить пользователя из кэша."""
+        with self._lock:
+            self._users.pop(user_id, None)
+
+        shared = self.shared
+        if shared is not None:
+            shared.delete(self._key(user_id))
+
+    def clear(self) -> None:
+        """Очистить локальный кэш."""
+        with self._lock:
+            self._users.clear()
+
+
+user_cache = UserCache(
+    max_size=settings.USERS_CACHE_MAX_SIZE,
+    ttl=settings.USERS_CACHE_TTL,
+    cache_alias=settings.USERS_CACHE_ALIAS,
+)
+
+
+class CachedUserRepository(DjangoUserRepository):
+    """Репозиторий пользователей с чтением через кэш."""
+
+    def __init__(
+        self, cache: UserCache = user_cache, missing: Optional[NegativeCache] = None
+    ):
+        self.cache = cache
+        # Недавно не найденные ID пользователей
+        self.missing = missing or get_negative_cache("users:")
+
+    def get_by_id(self, user_id: int):
+        user = self.cache.get(user_id)
+        if user is not None:
+            return user
+        if self.missing.contains(user_id):
+            return None
+
+        user = super().get_by_id(user_id)
+        if user is not None:
+            self.cache.set_many([user])
+        else:
+            self.missing.add([user_id])
+        return user
+
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, DomainUser]:
+        """Получить пользователей, загружая из БД только промахи кэша."""
+        user_ids = set(user_ids)
+        users = self.cache.get_many(user_ids)
+
+        missing = user_ids - users.keys()
+        if missing:
+            missing -= self.missing.missing(missing)
+        if missing:
+            loaded = super().get_many(missing)
+            self.cache.set_many(loaded.values())
+            self.missing.add(missing - loaded.keys())
+            users.update(loaded)
+        return users
+
+    def create_user(self, *args, **kwargs):
+        user = super().create_user(*args, **kwargs)
+        self.cache.invalidate(user.id)
+        self.missing.discard([user.id])
+        return user
+
+    def update_user(self, user_id: int, **fields):
+        user = super().update_user(user_id, **fields)
+        # Запись заменяется после UPDATE: параллельное чтение могло
+        # положить в кэш строку, прочитанную до изменения
+        if user is not None:
+            self.cache.set_many([user])
+        else:
+            self.cache.invalidate(user_id)
+        return user
+
+
+def get_user_repository() -> DjangoUserRepository:
+    """Репозиторий пользователей с кэшем, если он включен в настройках."""
+    if settings.USERS_CACHE_ENABLED:
+        return CachedUserRepository()
+    return DjangoUserRepository()
+
+
+def invalidate_cached_user(sender, instance, **kwargs) -> None:
+    """Обработчик post_save/post_delete модели пользователя."""
+    user_cache.invalidate(instance.pk)
+    if kwargs.get("created"):
+        get_negative_cache("users:").discard([instance.pk])
@@ -0,0 +1,75 @@
+"""
+Ограниченный пул для хеширования паролей.
+
+PBKDF2 при входе и регистрации занимает процессор на десятки миллисекунд.
+Хеширование выполняется в отдельном пуле потоков фиксированного размера
+с ограниченной очередью: при всплеске входов лишние запросы сразу получают
+отказ, а не занимают все воркеры и не останавливают остальной API.
+hashlib освобождает GIL на время PBKDF2, поэтому потоки пула работают
+параллельно с потоками запросов.
+
+В пуле выполняется только вычисление хеша: запросы к БД остаются
+в потоке запроса и его транзакции.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """Пул хеширования и его очередь заняты."""
+
+
+class HashingPool:
+    """Пул потоков с ограничением числа выполняемых и ожидающих задач."""
+
+    def __init__(self, workers: int = 2, queue_size: int = 16):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # Потоки создаются при первом использовании, а не при импорте
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-hashing"
+                    )
+        return self._executor
+
+    def run(self, func: Callable[..., T], *args) -> T:
+        """
+        Выполнить func в пуле и дождаться результата.
+
+        Если заняты все потоки и очередь, сразу выбрасывает
+        PasswordHashingBusy.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusy()
+        try:
+            future = self.executor.submit(self._call, func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        return future.result()
+
+    def _call(self, func: Callable[..., T], *args) -> T:
+        # Место освобождается до того, как ожидающий поток получит результат
+        try:
+            return func(*args)
+        finally:
+            self._slots.release()
+
+
+hashing_pool = HashingPool(
+    workers=settings.AUTH_HASHING_WORKERS, queue_size=settings.AUTH_HASHING_QUEUE_SIZE
+)
@@ -0,0 +1,32 @@
+from typing import Dict
+
+from apps.users.domain.entities import User as DomainUser
+
+
+class UserIdentityMap:
+    """
+    Карта идентичности доменных пользователей.
+
+    Возвращает один и тот же неизменяемый User для каждого ID
+    в пределах преобразования одной выборки.
+    """
+
+    def __init__(self):
+        self._users: Dict[int, DomainUser] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def get(self, django_user) -> DomainUser:
+        """Получить доменного пользователя для Django User."""
+        user = self._users.get(django_user.id)
+        if user is None:
+            user = DomainUser(
+                id=django_user.id,
+                username=django_user.username,
+                first_name=django_user.first_name,
+                last_name=django_user.last_name,
+                email=django_user.email,
+            )
+            self._users[django_user.id] = user
+        return user
@@ -1,33 +1,64 @@
-from django.contrib.auth import authenticate
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+
+from .blacklist import FilteredRefreshToken
+from .hashing import hashing_pool
 
 
 def generate_tokens_for_user(user):
     """Генерирует JWT токены для пользователя."""
-    refresh = RefreshToken.for_user(user)
+    refresh = FilteredRefreshToken.for_user(user)
 
     # Добавляем дополнительные данные в токен
     refresh["username"] = user.username
     refresh["email"] = user.email
     refresh["first_name"] = user.first_name
     refresh["last_name"] = user.last_name
+    # Позволяет отдавать профиль и аутентифицировать запросы без SELECT
+    refresh["date_joined"] = user.date_joined.isoformat()
 
     return {"access": str(refresh.access_token), "refresh": str(refresh)}
 
 
+def _check_password(password, encoded):
+    """Проверка пароля и, если устарели параметры хешера, новый хеш."""
+    rehashed = []
+    valid = check_password(
+        password, encoded, setter=lambda raw: rehashed.append(make_password(raw))
+    )
+    return valid, rehashed[0] if rehashed else None
+
+
 def authenticate_user(username, password):
-    """Аутентифицирует пользователя по логину и паролю."""
-    user = authenticate(username=username, password=password)
-    if user and user.is_active:
-        return user
-    return None
+    """
+    Аутентифицирует пользователя по логину и паролю.
+
+    Повторяет ModelBackend, но пароль проверяется в hashing_pool. Если пул
+    перегружен, выбрасывает PasswordHashingBusy.
+    """
+    user_model = get_user_model()
+    try:
+        user = user_model._default_manager.get_by_natural_key(username)
+    except user_model.DoesNotExist:
+        # Как и ModelBackend, хешируем пароль и для несуществующего
+        # пользователя, чтобы время ответа не выдавало наличие логина
+        hashing_pool.run(make_password, password)
+        return None
+
+    valid, rehashed = hashing_pool.run(_check_password, password, user.password)
+    if not valid or not user.is_active:
+        return None
+    if rehashed is not None:
+        user.password = rehashed
+        user.save(update_fields=["password"])
+    return user
 
 
 def refresh_access_token(refresh_token):
     """Обновляет access токен используя refresh токен."""
     try:
-        refresh = RefreshToken(refresh_token)
+        refresh = FilteredRefreshToken(refresh_token)
         return str(refresh.access_token)
     except TokenError:
         return None
@@ -36,7 +67,7 @@ def refresh_access_token(refresh_token):
 def blacklist_token(refresh_token):
     """Добавляет refresh токен в черный список."""
     try:
-        token = RefreshToken(refresh_token)
+        token = FilteredRefreshToken(refresh_token)
         token.blacklist()
         return True
     except TokenError:
@@ -46,7 +77,7 @@ def blacklist_token(refresh_token):
 def validate_token(token):
     """Проверяет валидность токена."""
     try:
-        RefreshToken(token)
+        FilteredRefreshToken(token)
         return True
     except TokenError:
         return False
@@ -0,0 +1,134 @@
+"""
+Отложенная запись last_login.
+
+Вход не обновляет строку auth_user сразу: время входа запоминается
+в памяти процесса и записывается одним UPDATE для всех накопленных
+пользователей не чаще раза в flush_interval секунд, при заполнении
+буфера и при завершении процесса.
+
+Кроме проверки срока при входе, буфер раз в flush_interval секунд
+записывает фоновый поток: в процессе без новых входов время входа
+не копится до завершения и не теряется при его аварийной остановке.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """Буфер времени последнего входа пользователей."""
+
+    def __init__(self, flush_interval: float = 30, max_size: int = 1000):
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self._pending: Dict[int, datetime] = {}
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, user_id: int, logged_in_at: Optional[datetime] = None) -> None:
+        """Запомнить вход; записать буфер, если подошел срок или он заполнен."""
+        with self._lock:
+            self._pending[user_id] = logged_in_at or timezone.now()
+            due = (
+                len(self._pending) >= self.max_size
+                or time.monotonic() >= self._flushed_at + self.flush_interval
+            )
+        self._start_flusher()
+        if due:
+            # Ошибка записи не должна превращать успешный вход в ошибку
+            # запроса: записи возвращаются в буфер до следующей попытки
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Не удалось записать last_login")
+
+    def _start_flusher(self) -> None:
+        # Поток создается при первом входе, а не при импорте
+        # (в воркере, а не в мастер-процессе до fork)
+        if self._flusher is not None or self.flush_interval <= 0:
+            return
+        with self._lock:
+            if self._flusher is None and not self._stopped.is_set():
+                self._flusher = threading.Thread(
+                    target=self._run, name="last-login-flush", daemon=True
+                )
+                self._flusher.start()
+
+    def _run(self) -> None:
+        """Записывать буфер раз в flush_interval секунд до остановки."""
+        while not self._stopped.wait(self.flush_interval):
+            if not self._pending:
+                continue
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Не удалось записать last_login")
+            finally:
+                # Соединения потока не переживают паузу до следующей записи
+                connections.close_all()
+
+    def stop(self) -> None:
+        """Остановить фоновую запись."""
+        self._stopped.set()
+
+    def flush(self) -> int:
+        """Записать накопленные входы одним UPDATE, вернуть число строк."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return 0
+
+        try:
+            return (
+                get_user_model()
+                .objects.filter(id__in=pending)
+                .update(
+                    last_login=Case(
+                        *(
+                            When(id=user_id, then=Value(logged_in_at))
+                            for user_id, logged_in_at in pending.items()
+                        ),
+                        output_field=DateTimeField(),
+                    )
+                )
+            )
+        except Exception:
+            # Возвращаем записи в буфер, более поздние входы важнее
+            with self._lock:
+                for user_id, logged_in_at in pending.items():
+                    self._pending.setdefault(user_id, logged_in_at)
+            raise
+
+
+last_login_buffer = LastLoginBuffer(
+    flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL,
+    max_size=settings.LAST_LOGIN_BUFFER_SIZE,
+)
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    # Последняя попытка: фоновый поток может не успеть до завершения
+    last_login_buffer.stop()
+    try:
+        last_login_buffer.flush()
+    except Exception:
+        logger.exception("Не удалось записать last_login при завершении процесса")
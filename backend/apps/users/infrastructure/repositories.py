@@ -1,8 +1,30 @@
+import re
+from typing import Dict, Iterable, Optional
+
 from apps.users.domain.entities import User as DomainUser
+from apps.users.domain.exceptions import EmailAlreadyExists, UsernameAlreadyExists
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+
+from .hashing import hashing_pool
+from .signals import user_updated
 
 DjangoUser = get_user_model()
 
+# Ограничения уникальности auth_user: индексы миграции users.0001,
+# ограничение колонки в PostgreSQL и колонка в ошибке SQLite
+EMAIL_CONSTRAINTS = frozenset({"users_auth_user_email_ci_uniq", "auth_user.email"})
+USERNAME_CONSTRAINTS = frozenset(
+    {"users_auth_user_username_ci_uniq", "auth_user_username_key", "auth_user.username"}
+)
+
+# SQLite: "UNIQUE constraint failed: auth_user.email"
+# или "UNIQUE constraint failed: index 'имя'"
+SQLITE_UNIQUE_ERROR = re.compile(
+    r"UNIQUE constraint failed: (?:index '([^']+)'|(\S+))$"
+)
+
 
 class DjangoUserRepository:
     def _to_domain(self, django_user: DjangoUser) -> DomainUser:
@@ -24,19 +46,89 @@ class DjangoUserRepository:
     def create_user(
         self, username: str, email: str, password: str, first_name=None, last_name=None
     ):
-        # Обеспечиваем, что first_name и last_name не None для избежания NULL constraint
-        django_user = DjangoUser.objects.create_user(
-            username=username,
-            email=email,
-            password=password,
+        # Хеш вычисляется в ограниченном пуле (PasswordHashingBusy при
+        # перегрузке), INSERT - в потоке запроса
+        django_user = DjangoUser(
+            username=DjangoUser.normalize_username(username),
+            email=DjangoUser.objects.normalize_email(email),
+            password=hashing_pool.run(make_password, password),
+            # Обеспечиваем, что first_name и last_name не None для избежания NULL constraint
             first_name=first_name or "",
             last_name=last_name or "",
         )
+        try:
+            with transaction.atomic():
+                django_user.save()
+        except IntegrityError as error:
+            raise self._duplicate_error(error, username=username, email=email)
         return self._to_domain(django_user)
 
+    @staticmethod
+    def _constraint_name(error: IntegrityError) -> Optional[str]:
+        """Имя нарушенного ограничения из ошибки драйвера БД."""
+        # psycopg сообщает имя в диагностике ошибки
+        diag = getattr(error.__cause__, "diag", None)
+        name = getattr(diag, "constraint_name", None)
+        if name:
+            return name
+        match = SQLITE_UNIQUE_ERROR.match(str(error))
+        if match:
+            return match.group(1) or match.group(2)
+        return None
+
+    @classmethod
+    def _duplicate_error(cls, error: IntegrityError, username=None, email=None):
+        """
+        Доменная ошибка для нарушения уникальности username или email.
+
+        Поле определяется по имени нарушенного ограничения, а не по тексту
+        ошибки: текст может содержать само значение. Прочие нарушения
+        пробрасываются как есть.
+        """
+        name = cls._constraint_name(error)
+        if name in EMAIL_CONSTRAINTS:
+            return EmailAlreadyExists(f"Пользователь с email {email} уже существует")
+        if name in USERNAME_CONSTRAINTS:
+            return UsernameAlreadyExists(
+                f"Пользователь с username {username} уже существует"
+            )
+        return error
+
+    def update_user(self, user_id: int, **fields):
+        """Обновить поля пользователя одним UPDATE."""
+        try:
+            with transaction.atomic():
+                updated = DjangoUser.objects.filter(id=user_id).update(**fields)
+        except IntegrityError as error:
+            raise self._duplicate_error(error, email=fields.get("email"))
+        if not updated:
+            return None
+        user = self._load(user_id)
+        user_updated.send(
+            sender=DjangoUser, instance=user, update_fields=frozenset(fields)
+        )
+        return user
+
     def get_by_id(self, user_id: int):
+        return self._load(user_id)
+
+    def _load(self, user_id: int):
+        """
+        Прочитать пользователя из БД.
+
+        Наследники с кэшем переопределяют get_by_id, а этот метод всегда
+        обращается к БД: после записи в кэше может быть старая строка.
+        """
         try:
             django_user = DjangoUser.objects.get(id=user_id)
             return self._to_domain(django_user)
         except DjangoUser.DoesNotExist:
             return None
+
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, DomainUser]:
+        """Получить пользователей по списку ID одним запросом."""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return {}
+        django_users = DjangoUser.objects.filter(id__in=user_ids)
+        return {user.id: self._to_domain(user) for user in django_users}
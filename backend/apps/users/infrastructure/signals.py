@@ -0,0 +1,11 @@
+"""
+Сигналы изменения пользователей.
+
+QuerySet.update() не отправляет post_save, поэтому репозиторий сообщает
+об изменении полей пользователя отдельным сигналом.
+"""
+
+from django.dispatch import Signal
+
+# Аргументы: instance (доменный пользователь), update_fields
+user_updated = Signal()
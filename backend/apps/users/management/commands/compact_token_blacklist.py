@@ -0,0 +1,63 @@
+"""
+Удаление истекших записей черного списка JWT.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаляет истекшие OutstandingToken и их записи BlacklistedToken. "
+        "Таблица обходится порциями по ID, каждая порция удаляется в своей "
+        "транзакции, поэтому команду можно запускать по расписанию."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Количество токенов, просматриваемых за одну транзакцию",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+
+        outstanding = 0
+        blacklisted = 0
+        last_id = 0
+        while True:
+            # expires_at без индекса, поэтому идем по первичному ключу
+            chunk = list(
+                OutstandingToken.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "expires_at")[:batch_size]
+            )
+            if not chunk:
+                break
+
+            expired = [token_id for token_id, expires_at in chunk if expires_at <= now]
+            if expired:
+                with transaction.atomic():
+                    # Черный список удаляется первым, чтобы каскад из
+                    # OutstandingToken не выбирал его записи по одной
+                    blacklisted += BlacklistedToken.objects.filter(
+                        token_id__in=expired
+                    ).delete()[0]
+                    outstanding += OutstandingToken.objects.filter(
+                        id__in=expired
+                    ).delete()[0]
+            last_id = chunk[-1][0]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Удалено токенов: {outstanding}, из черного списка: {blacklisted}"
+            )
+        )
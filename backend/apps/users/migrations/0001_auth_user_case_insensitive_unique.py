@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 10:12
+
+from django.conf import settings
+from django.db import migrations
+
+# auth.User не принадлежит проекту, поэтому индексы создаются SQL.
+# UPPER совпадает с выражением iexact в PostgreSQL. Пустой email
+# (createsuperuser без email) не уникален.
+EMAIL_INDEX = "users_auth_user_email_ci_uniq"
+USERNAME_INDEX = "users_auth_user_username_ci_uniq"
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                f"CREATE UNIQUE INDEX {EMAIL_INDEX} "
+                "ON auth_user (UPPER(email)) WHERE email <> ''"
+            ),
+            reverse_sql=f"DROP INDEX {EMAIL_INDEX}",
+        ),
+        migrations.RunSQL(
+            sql=f"CREATE UNIQUE INDEX {USERNAME_INDEX} ON auth_user (UPPER(username))",
+            reverse_sql=f"DROP INDEX {USERNAME_INDEX}",
+        ),
+    ]
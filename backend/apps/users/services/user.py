@@ -1,9 +1,5 @@
 from apps.users.domain.entities import UserId
-from apps.users.domain.exceptions import (
-    EmailAlreadyExists,
-    UsernameAlreadyExists,
-    UserNotFound,
-)
+from apps.users.domain.exceptions import UserNotFound
 
 
 class UserService:
@@ -13,14 +9,9 @@ class UserService:
     def register_user(
         self, username: str, email: str, password: str, first_name=None, last_name=None
     ):
-        if self.user_repo.exists_by_email(email):
-            raise EmailAlreadyExists(f"Пользователь с email {email} уже существует")
-
-        if self.user_repo.exists_by_username(username):
-            raise UsernameAlreadyExists(
-                f"Пользователь с username {username} уже существует"
-            )
-
+        # Уникальность email и username (без учета регистра) проверяют
+        # индексы БД: репозиторий выполняет один INSERT и выбрасывает
+        # EmailAlreadyExists/UsernameAlreadyExists
         user = self.user_repo.create_user(
             username=username,
             email=email,
@@ -2,11 +2,25 @@
 Тесты для JWT аутентификации.
 """
 
+from unittest.mock import patch
+
+import msgpack
+from apps.users.infrastructure.authentication import (
+    ClaimsUser,
+    InactiveUsers,
+    StatelessJWTAuthentication,
+    inactive_users,
+)
+from apps.users.infrastructure.cache import get_user_repository
+from apps.users.infrastructure.hashing import PasswordHashingBusy, hashing_pool
+from apps.users.infrastructure.jwt import generate_tokens_for_user
+from apps.users.infrastructure.last_login import last_login_buffer
 from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient, APITestCase
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
 
 class AuthenticationTestCase(APITestCase):
@@ -91,6 +105,21 @@ class AuthenticationTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("error", response.data)
 
+    def test_user_registration_duplicate_email(self):
+        """Тест регистрации с существующим email в другом регистре."""
+        url = reverse("user-register")
+        data = {
+            "username": "another",
+            "email": "TEST@example.com",
+            "password": "newpass123",
+            "password_confirm": "newpass123",
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", response.data["error"])
+
     def test_user_login_success(self):
         """Тест успешного входа пользователя."""
         url = reverse("user-login")
@@ -105,6 +134,64 @@ class AuthenticationTestCase(APITestCase):
         self.assertIn("user", response.data)
         self.assertEqual(response.data["user"]["username"], "testuser")
 
+    def test_user_login_updates_last_login(self):
+        """Тест записи last_login при входе."""
+        url = reverse("user-login")
+        data = {"username": "testuser", "password": "testpass123"}
+
+        response = self.client.post(url, data, format="json")
+        last_login_buffer.flush()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+
+    def test_user_login_msgpack(self):
+        """Тест входа пользователя в формате MessagePack."""
+        url = reverse("user-login")
+        data = {"username": "testuser", "password": "testpass123"}
+
+        response = self.client.post(
+            url,
+            msgpack.packb(data),
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        body = msgpack.unpackb(response.content, raw=False)
+        self.assertIn("access", body["tokens"])
+        self.assertEqual(body["user"]["username"], "testuser")
+
+    def test_user_login_hashing_busy(self):
+        """Тест быстрого отказа при перегрузке пула хеширования."""
+        url = reverse("user-login")
+        data = {"username": "testuser", "password": "testpass123"}
+
+        with patch.object(hashing_pool, "run", side_effect=PasswordHashingBusy) as run:
+            response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "1")
+        run.assert_called_once()
+
+    def test_user_registration_hashing_busy(self):
+        """Тест отказа в регистрации при перегрузке пула хеширования."""
+        url = reverse("user-register")
+        data = {
+            "username": "newuser",
+            "email": "new@example.com",
+            "password": "newpass12345",
+            "password_confirm": "newpass12345",
+        }
+
+        with patch.object(hashing_pool, "run", side_effect=PasswordHashingBusy):
+            response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(User.objects.filter(username="newuser").exists())
+
     def test_user_login_invalid_credentials(self):
         """Тест входа с неверными учетными данными."""
         url = reverse("user-login")
@@ -208,3 +295,94 @@ class JWTAuthenticationIntegrationTest(APITestCase):
         response = self.client.get(tasks_url)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class StatelessJWTAuthenticationTest(APITestCase):
+    """Тесты JWT аутентификации по claims токена."""
+
+    def setUp(self):
+        """Настройка для каждого теста."""
+        self.user = User.objects.create_user(
+            username="claimsuser",
+            email="claims@example.com",
+            password="claimspass123",
+            first_name="Claims",
+            last_name="User",
+        )
+        self.access = generate_tokens_for_user(self.user)["access"]
+        self.authentication = StatelessJWTAuthentication()
+        inactive_users.refresh()
+
+    def authenticate(self, token):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.authentication.authenticate(request)
+
+    def test_authenticate_without_queries(self):
+        """Тест аутентификации без запросов к БД."""
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate(self.access)
+
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(user.username, "claimsuser")
+        self.assertEqual(user.email, "claims@example.com")
+        self.assertEqual(user.first_name, "Claims")
+        self.assertEqual(user.date_joined, self.user.date_joined)
+
+    def test_deactivated_user(self):
+        """Тест отказа деактивированному пользователю."""
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+
+    def test_deleted_user(self):
+        """Тест отказа удаленному пользователю."""
+        self.user.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+
+    def test_token_without_claims(self):
+        """Тест проверки по БД токена, выпущенного без данных пользователя."""
+        token = AccessToken.for_user(self.user)
+
+        with self.assertNumQueries(1):
+            user, _ = self.authenticate(token)
+
+        self.assertIsInstance(user, User)
+
+    def test_inactive_users_refresh(self):
+        """Тест перечитывания деактивации в обход сигналов (другой процесс)."""
+        users = InactiveUsers(refresh_interval=60)
+        self.assertNotIn(self.user.id, users)
+
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        self.assertNotIn(self.user.id, users)
+
+        users.refresh()
+        self.assertIn(self.user.id, users)
+
+    def test_deleted_in_other_process(self):
+        """Тест отказа пользователю, удаленному в обход сигналов процесса."""
+        users = InactiveUsers(refresh_interval=60)
+        self.assertNotIn(self.user.id, users)
+
+        User.objects.filter(id=self.user.id).delete()
+        users.refresh()
+
+        self.assertIn(self.user.id, users)
+
+    def test_profile_is_fresh_after_update(self):
+        """Тест, что профиль не берется из устаревших claims."""
+        self.client.force_authenticate(user=ClaimsUser(AccessToken(self.access)))
+        url = reverse("user-profile")
+
+        get_user_repository().update_user(self.user.id, first_name="Changed")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["first_name"], "Changed")
+        self.assertEqual(response.data["username"], "claimsuser")
+        self.assertIsNotNone(response.data["date_joined"])
@@ -0,0 +1,125 @@
+"""
+Тесты для черного списка refresh токенов.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from apps.users.infrastructure.blacklist import (
+    BlacklistFilter,
+    BloomFilter,
+    FilteredRefreshToken,
+    blacklist_filter,
+)
+from apps.users.infrastructure.jwt import (
+    blacklist_token,
+    generate_tokens_for_user,
+    refresh_access_token,
+)
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class BloomFilterTest(TestCase):
+    """Тесты для BloomFilter."""
+
+    def test_added_values_are_found(self):
+        """Тест отсутствия ложноотрицательных ответов."""
+        bloom = BloomFilter(capacity=1000)
+        values = [f"jti-{i}" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+
+        self.assertTrue(all(value in bloom for value in values))
+        self.assertFalse(bloom.full)
+
+    def test_false_positive_rate(self):
+        """Тест доли ложных срабатываний при заполненной емкости."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        self.assertLess(false_positives, 300)
+
+
+class BlacklistFilterTest(TestCase):
+    """Тесты проверки черного списка через фильтр."""
+
+    def setUp(self):
+        """Настройка для каждого теста."""
+        self.user = User.objects.create_user(username="tokenuser", password="pass")
+        self.refresh = generate_tokens_for_user(self.user)["refresh"]
+        blacklist_filter.sync(force=True)
+
+    def test_refresh_without_blacklist_query(self):
+        """Тест обновления токена без запроса к черному списку."""
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(refresh_access_token(self.refresh))
+
+    def test_blacklisted_token_rejected(self):
+        """Тест отказа в обновлении после выхода."""
+        self.assertTrue(blacklist_token(self.refresh))
+
+        self.assertIsNone(refresh_access_token(self.refresh))
+
+    def test_blacklisted_in_other_process(self):
+        """Тест подгрузки токенов, отозванных в обход фильтра процесса."""
+        token = FilteredRefreshToken(self.refresh)
+        BlacklistedToken.objects.create(
+            token=OutstandingToken.objects.get(jti=token["jti"])
+        )
+        self.assertIsNotNone(refresh_access_token(self.refresh))
+
+        blacklist_filter.sync(force=True)
+
+        self.assertIsNone(refresh_access_token(self.refresh))
+
+    def test_incremental_sync(self):
+        """Тест дополнения фильтра новыми записями без перестройки."""
+        bloom = BlacklistFilter(sync_interval=0)
+        bloom.sync()
+        token = FilteredRefreshToken(self.refresh)
+        BlacklistedToken.objects.create(
+            token=OutstandingToken.objects.get(jti=token["jti"])
+        )
+
+        self.assertTrue(bloom.might_contain(token["jti"]))
+
+
+class CompactTokenBlacklistCommandTest(TestCase):
+    """Тесты команды compact_token_blacklist."""
+
+    def create_token(self, jti, expires_at, blacklisted=False):
+        token = OutstandingToken.objects.create(
+            jti=jti, token=jti, expires_at=expires_at
+        )
+        if blacklisted:
+            BlacklistedToken.objects.create(token=token)
+        return token
+
+    def test_deletes_only_expired(self):
+        """Тест удаления истекших токенов порциями."""
+        now = timezone.now()
+        self.create_token("expired-1", now - timedelta(days=1), blacklisted=True)
+        self.create_token("expired-2", now - timedelta(days=1))
+        self.create_token("active-1", now + timedelta(days=1), blacklisted=True)
+        self.create_token("active-2", now + timedelta(days=1))
+        self.create_token("expired-3", now - timedelta(hours=1), blacklisted=True)
+
+        out = StringIO()
+        call_command("compact_token_blacklist", batch_size=2, stdout=out)
+
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("jti", flat=True)),
+            {"active-1", "active-2"},
+        )
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        self.assertIn("Удалено токенов: 3, из черного списка: 2", out.getvalue())
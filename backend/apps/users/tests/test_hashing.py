@@ -0,0 +1,50 @@
+"""
+Тесты для пула хеширования паролей.
+"""
+
+import threading
+
+from apps.users.infrastructure.hashing import HashingPool, PasswordHashingBusy
+from django.test import SimpleTestCase
+
+
+class HashingPoolTest(SimpleTestCase):
+    """Тесты для HashingPool."""
+
+    def test_run_returns_result(self):
+        """Тест выполнения функции в потоке пула."""
+        pool = HashingPool(workers=1, queue_size=0)
+
+        name = pool.run(lambda: threading.current_thread().name)
+
+        self.assertTrue(name.startswith("password-hashing"))
+
+    def test_run_propagates_error(self):
+        """Тест проброса исключения и освобождения места в пуле."""
+        pool = HashingPool(workers=1, queue_size=0)
+
+        with self.assertRaises(ZeroDivisionError):
+            pool.run(lambda: 1 / 0)
+        self.assertEqual(pool.run(lambda: 42), 42)
+
+    def test_rejects_when_full(self):
+        """Тест немедленного отказа, когда заняты потоки и очередь."""
+        pool = HashingPool(workers=1, queue_size=0)
+        running = threading.Event()
+        release = threading.Event()
+
+        def hash_slowly():
+            running.set()
+            release.wait()
+
+        thread = threading.Thread(target=pool.run, args=(hash_slowly,))
+        thread.start()
+        running.wait()
+        try:
+            with self.assertRaises(PasswordHashingBusy):
+                pool.run(lambda: None)
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertIsNone(pool.run(lambda: None))
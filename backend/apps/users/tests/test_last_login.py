@@ -0,0 +1,112 @@
+"""
+Тесты для отложенной записи last_login.
+"""
+
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+from apps.users.infrastructure.last_login import LastLoginBuffer
+from django.contrib.auth.models import User
+from django.db import DatabaseError
+from django.test import TestCase
+from django.utils import timezone
+
+
+class LastLoginBufferTest(TestCase):
+    """Тесты для LastLoginBuffer."""
+
+    def setUp(self):
+        """Настройка для каждого теста."""
+        self.users = [
+            User.objects.create_user(username=f"user{i}", password="pass")
+            for i in range(3)
+        ]
+        self.now = timezone.now()
+
+    def test_record_is_deferred(self):
+        """Тест, что вход до истечения интервала не пишет в БД."""
+        buffer = LastLoginBuffer(flush_interval=60)
+
+        with self.assertNumQueries(0):
+            buffer.record(self.users[0].id, self.now)
+
+        self.assertEqual(len(buffer), 1)
+        self.users[0].refresh_from_db()
+        self.assertIsNone(self.users[0].last_login)
+
+    def test_flush_single_update(self):
+        """Тест записи всех накопленных входов одним UPDATE."""
+        buffer = LastLoginBuffer(flush_interval=60)
+        for i, user in enumerate(self.users):
+            buffer.record(user.id, self.now - timedelta(minutes=i))
+        # Повторный вход заменяет время в буфере
+        buffer.record(self.users[0].id, self.now + timedelta(minutes=1))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(buffer.flush(), 3)
+
+        self.assertEqual(len(buffer), 0)
+        last_logins = dict(User.objects.values_list("id", "last_login"))
+        self.assertEqual(last_logins[self.users[0].id], self.now + timedelta(minutes=1))
+        self.assertEqual(last_logins[self.users[2].id], self.now - timedelta(minutes=2))
+
+    def test_flush_when_full(self):
+        """Тест досрочной записи заполненного буфера."""
+        buffer = LastLoginBuffer(flush_interval=60, max_size=2)
+        buffer.record(self.users[0].id, self.now)
+
+        with self.assertNumQueries(1):
+            buffer.record(self.users[1].id, self.now)
+
+        self.assertEqual(len(buffer), 0)
+
+    def test_zero_interval_writes_immediately(self):
+        """Тест немедленной записи при нулевом интервале."""
+        buffer = LastLoginBuffer(flush_interval=0)
+
+        buffer.record(self.users[0].id, self.now)
+
+        self.users[0].refresh_from_db()
+        self.assertEqual(self.users[0].last_login, self.now)
+
+    def test_failed_flush_keeps_entries(self):
+        """Тест возврата записей в буфер при ошибке БД."""
+        buffer = LastLoginBuffer(flush_interval=60)
+        buffer.record(self.users[0].id, self.now)
+
+        with patch(
+            "apps.users.infrastructure.last_login.get_user_model",
+            side_effect=DatabaseError,
+        ):
+            with self.assertRaises(DatabaseError):
+                buffer.flush()
+
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual(buffer.flush(), 1)
+
+    def test_failed_flush_on_record_is_logged(self):
+        """Тест, что ошибка записи при входе не выбрасывается."""
+        buffer = LastLoginBuffer(flush_interval=0)
+
+        with patch(
+            "apps.users.infrastructure.last_login.get_user_model",
+            side_effect=DatabaseError,
+        ), self.assertLogs("apps.users.infrastructure.last_login", "ERROR"):
+            buffer.record(self.users[0].id, self.now)
+
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual(buffer.flush(), 1)
+
+    def test_background_flush_without_logins(self):
+        """Тест записи буфера фоновым потоком без новых входов."""
+        buffer = LastLoginBuffer(flush_interval=0.05)
+        flushed = threading.Event()
+        try:
+            with patch.object(buffer, "flush", side_effect=flushed.set):
+                with self.assertNumQueries(0):
+                    buffer.record(self.users[0].id, self.now)
+
+                self.assertTrue(flushed.wait(timeout=5))
+        finally:
+            buffer.stop()
@@ -2,8 +2,13 @@
 Тесты для пользовательских репозиториев.
 """
 
+from unittest.mock import patch
+
 from apps.users.domain.entities import User
+from apps.users.infrastructure.cache import CachedUserRepository, UserCache
+from apps.users.infrastructure.identity_map import UserIdentityMap
 from apps.users.infrastructure.repositories import DjangoUserRepository
+from config.cache import NegativeCache
 from django.contrib.auth.models import User as DjangoUser
 from django.test import TestCase
 
@@ -42,6 +47,25 @@ class DjangoUserRepositoryTest(TestCase):
 
         self.assertIsNone(user)
 
+    def test_get_many(self):
+        """Тест получения нескольких пользователей одним запросом."""
+        other = DjangoUser.objects.create_user(
+            username="otheruser", email="other@example.com", password="testpass123"
+        )
+
+        with self.assertNumQueries(1):
+            users = self.repository.get_many([self.django_user.id, other.id, 99999])
+
+        self.assertEqual(set(users), {self.django_user.id, other.id})
+        self.assertEqual(users[other.id].username, "otheruser")
+
+    def test_get_many_empty(self):
+        """Тест получения пустого списка пользователей без запроса."""
+        with self.assertNumQueries(0):
+            users = self.repository.get_many([])
+
+        self.assertEqual(users, {})
+
     def test_exists_by_email_existing(self):
         """Тест проверки существования пользователя по email."""
         exists = self.repository.exists_by_email("test@example.com")
@@ -127,3 +151,201 @@ class DjangoUserRepositoryTest(TestCase):
 
         self.assertEqual(domain_user.first_name, "")
         self.assertEqual(domain_user.last_name, "")
+
+
+class UserIdentityMapTest(TestCase):
+    """Тесты для UserIdentityMap."""
+
+    def setUp(self):
+        """Настройка для каждого теста."""
+        self.django_user = DjangoUser.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            first_name="Test",
+            last_name="User",
+        )
+
+    def test_same_user_returns_same_instance(self):
+        """Тест получения одного экземпляра для одного пользователя."""
+        users = UserIdentityMap()
+
+        first = users.get(self.django_user)
+        second = users.get(DjangoUser.objects.get(id=self.django_user.id))
+
+        self.assertIs(first, second)
+        self.assertIsInstance(first, User)
+        self.assertEqual(first.username, "testuser")
+        self.assertEqual(len(users), 1)
+
+    def test_different_maps_are_independent(self):
+        """Тест независимости разных карт идентичности."""
+        first = UserIdentityMap().get(self.django_user)
+        second = UserIdentityMap().get(self.django_user)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+
+
+class UserCacheTest(TestCase):
+    """Тесты для UserCache."""
+
+    def make_user(self, user_id):
+        return User(
+            id=user_id,
+            username=f"user{user_id}",
+            first_name="",
+            last_name="",
+            email="",
+        )
+
+    def test_get_after_set(self):
+        """Тест получения пользователя из кэша."""
+        cache = UserCache()
+        user = self.make_user(1)
+
+        cache.set_many([user])
+
+        self.assertIs(cache.get(1), user)
+        self.assertIsNone(cache.get(2))
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованных пользователей."""
+        cache = UserCache(max_size=2)
+        cache.set_many([self.make_user(1), self.make_user(2)])
+
+        cache.get(1)
+        cache.set_many([self.make_user(3)])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(1))
+        self.assertIsNone(cache.get(2))
+
+    def test_ttl_expiration(self):
+        """Тест устаревания записей по TTL."""
+        cache = UserCache(ttl=10)
+        with patch("apps.users.infrastructure.cache.time.monotonic", return_value=0):
+            cache.set_many([self.make_user(1)])
+        with patch("apps.users.infrastructure.cache.time.monotonic", return_value=11):
+            self.assertIsNone(cache.get(1))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        """Тест удаления пользователя из кэша."""
+        cache = UserCache()
+        cache.set_many([self.make_user(1)])
+
+        cache.invalidate(1)
+
+        self.assertIsNone(cache.get(1))
+
+    def test_shared_cache(self):
+        """Тест чтения из кэша Django при промахе локального кэша."""
+        writer = UserCache(cache_alias="default")
+        reader = UserCache(cache_alias="default")
+        with self.settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "users-cache-test",
+                }
+            }
+        ):
+            writer.set_many([self.make_user(1)])
+            self.assertEqual(reader.get(1), self.make_user(1))
+
+            writer.invalidate(1)
+            reader.clear()
+            self.assertIsNone(reader.get(1))
+
+
+class CachedUserRepositoryTest(TestCase):
+    """Тесты для CachedUserRepository."""
+
+    def setUp(self):
+        """Настройка для каждого теста."""
+        self.cache = UserCache()
+        self.repository = CachedUserRepository(self.cache)
+        self.django_user = DjangoUser.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+
+    def test_get_by_id_hits_cache(self):
+        """Тест, что повторное чтение не обращается к БД."""
+        self.repository.get_by_id(self.django_user.id)
+
+        with self.assertNumQueries(0):
+            user = self.repository.get_by_id(self.django_user.id)
+
+        self.assertEqual(user.username, "testuser")
+
+    def test_get_many_loads_only_misses(self):
+        """Тест загрузки из БД только отсутствующих в кэше пользователей."""
+        other = DjangoUser.objects.create_user(username="other", password="pass")
+        self.repository.get_by_id(self.django_user.id)
+
+        with self.assertNumQueries(1):
+            users = self.repository.get_many([self.django_user.id, other.id])
+        with self.assertNumQueries(0):
+            self.repository.get_many([self.django_user.id, other.id])
+
+        self.assertEqual(set(users), {self.django_user.id, other.id})
+
+    def test_update_user_invalidates(self):
+        """Тест сброса кэша при изменении пользователя через репозиторий."""
+        self.repository.get_by_id(self.django_user.id)
+
+        user = self.repository.update_user(self.django_user.id, first_name="Changed")
+
+        self.assertEqual(user.first_name, "Changed")
+        self.assertEqual(
+            self.repository.get_by_id(self.django_user.id).first_name, "Changed"
+        )
+
+    def test_update_user_replaces_stale_entry(self):
+        """Тест замены строки, закэшированной параллельным чтением до UPDATE."""
+        stale = self.repository.get_by_id(self.django_user.id)
+        invalidate = self.cache.invalidate
+
+        def invalidate_and_reload(user_id):
+            invalidate(user_id)
+            self.cache.set_many([stale])
+
+        with patch.object(self.cache, "invalidate", invalidate_and_reload):
+            self.repository.update_user(self.django_user.id, first_name="Changed")
+
+        with self.assertNumQueries(0):
+            user = self.repository.get_by_id(self.django_user.id)
+        self.assertEqual(user.first_name, "Changed")
+
+    def test_model_save_invalidates(self):
+        """Тест сброса кэша при сохранении модели в обход репозитория."""
+        with patch("apps.users.infrastructure.cache.user_cache", self.cache):
+            self.repository.get_by_id(self.django_user.id)
+            self.django_user.first_name = "Admin"
+            self.django_user.save()
+
+        self.assertIsNone(self.cache.get(self.django_user.id))
+
+    def test_missing_user_cached(self):
+        """Тест, что отсутствующий пользователь не запрашивается повторно."""
+        repository = CachedUserRepository(
+            self.cache, missing=NegativeCache("users:", ttl=60)
+        )
+        missing_id = self.django_user.id + 100
+        with self.settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "users-negative-cache-test",
+                }
+            }
+        ):
+            self.assertIsNone(repository.get_by_id(missing_id))
+            with self.assertNumQueries(0):
+                self.assertIsNone(repository.get_by_id(missing_id))
+                self.assertEqual(repository.get_many([missing_id]), {})
+
+            # Созданный пользователь сразу доступен
+            DjangoUser.objects.create_user(id=missing_id, username="late")
+            self.assertEqual(repository.get_by_id(missing_id).username, "late")
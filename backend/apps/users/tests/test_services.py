@@ -2,8 +2,13 @@
 Тесты для пользовательских сервисов.
 """
 
+from types import SimpleNamespace
+
+from apps.users.domain.exceptions import EmailAlreadyExists, UsernameAlreadyExists
 from apps.users.infrastructure.repositories import DjangoUserRepository
+from apps.users.services.user import UserService
 from django.contrib.auth.models import User as DjangoUser
+from django.db import IntegrityError
 from django.test import TestCase
 
 
@@ -53,7 +58,7 @@ class UserServiceIntegrationTest(TestCase):
         self.assertTrue(self.repository.exists_by_username("existinguser"))
 
         # Попытка создать пользователя с тем же username должна вызвать ошибку
-        with self.assertRaises(Exception):
+        with self.assertRaises(UsernameAlreadyExists):
             self.repository.create_user(
                 username="existinguser",
                 email="different@example.com",
@@ -70,13 +75,83 @@ class UserServiceIntegrationTest(TestCase):
         # Проверяем, что email существует
         self.assertTrue(self.repository.exists_by_email("existing@example.com"))
 
-        # В текущей реализации дубликаты email не вызывают ошибку
-        # Создаем второго пользователя с тем же email
-        user2 = self.repository.create_user(
-            username="user2", email="existing@example.com", password="pass123"
+        # Email уникален без учета регистра (индекс БД)
+        with self.assertRaises(EmailAlreadyExists):
+            self.repository.create_user(
+                username="user2", email="Existing@example.com", password="pass123"
+            )
+        self.assertFalse(DjangoUser.objects.filter(username="user2").exists())
+
+    def test_duplicate_username_containing_email(self):
+        """Тест, что поле определяется по ограничению, а не по тексту ошибки."""
+        self.repository.create_user(
+            username="my_email", email="first@example.com", password="pass123"
+        )
+
+        with self.assertRaises(UsernameAlreadyExists):
+            self.repository.create_user(
+                username="my_email", email="second@example.com", password="pass123"
+            )
+
+    def test_duplicate_error_uses_constraint_name(self):
+        """Тест имени ограничения из диагностики psycopg."""
+        error = IntegrityError(
+            'duplicate key value violates unique constraint "auth_user_username_key"\n'
+            "DETAIL:  Key (username)=(my_email) already exists."
+        )
+        error.__cause__ = Exception()
+        error.__cause__.diag = SimpleNamespace(constraint_name="auth_user_username_key")
+
+        self.assertIsInstance(
+            self.repository._duplicate_error(error, username="my_email"),
+            UsernameAlreadyExists,
+        )
+
+    def test_username_unique_ignoring_case(self):
+        """Тест уникальности username без учета регистра."""
+        self.repository.create_user(
+            username="CaseUser", email="first@example.com", password="pass123"
         )
-        # Проверяем, что пользователь создался
-        self.assertIsNotNone(user2)
+
+        with self.assertRaises(UsernameAlreadyExists):
+            self.repository.create_user(
+                username="caseuser", email="second@example.com", password="pass123"
+            )
+
+    def test_empty_email_not_unique(self):
+        """Тест, что пустой email может быть у нескольких пользователей."""
+        DjangoUser.objects.create_user(username="first", password="pass123")
+        DjangoUser.objects.create_user(username="second", password="pass123")
+
+        self.assertEqual(DjangoUser.objects.filter(email="").count(), 2)
+
+    def test_register_user_single_insert(self):
+        """Тест регистрации одним INSERT без предварительных проверок."""
+        service = UserService(self.repository)
+
+        # INSERT плюс SAVEPOINT/RELEASE транзакции
+        with self.assertNumQueries(3):
+            user_id = service.register_user(
+                username="newuser", email="new@example.com", password="pass123"
+            )
+
+        self.assertTrue(DjangoUser.objects.filter(id=user_id.value).exists())
+        with self.assertRaises(EmailAlreadyExists):
+            service.register_user(
+                username="other", email="NEW@example.com", password="pass123"
+            )
+
+    def test_update_user_duplicate_email_ignoring_case(self):
+        """Тест смены email на занятый в другом регистре."""
+        DjangoUser.objects.create_user(
+            username="owner", email="taken@example.com", password="pass123"
+        )
+        user = self.repository.create_user(
+            username="changer", email="changer@example.com", password="pass123"
+        )
+
+        with self.assertRaises(EmailAlreadyExists):
+            self.repository.update_user(user.id, email="Taken@example.com")
 
     def test_user_retrieval_after_creation(self):
         """Тест получения пользователя после создания."""
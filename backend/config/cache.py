@@ -0,0 +1,67 @@
+"""
+Общие механизмы кэширования.
+"""
+
+from typing import Iterable, Set
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class NegativeCache:
+    """
+    Кэш отсутствующих объектов с коротким TTL.
+
+    Повторные запросы несуществующих ID не доходят до БД, пока запись
+    не истечет или не будет удалена при создании объекта. TTL 0
+    отключает кэш.
+    """
+
+    def __init__(self, prefix: str, ttl: int, cache_alias: str = "default"):
+        self.prefix = prefix
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _key(self, object_id: int) -> str:
+        return f"{self.prefix}missing:{object_id}"
+
+    def contains(self, object_id: int) -> bool:
+        """Известно ли, что объекта нет."""
+        return self.enabled and self.cache.get(self._key(object_id)) is not None
+
+    def missing(self, object_ids: Iterable[int]) -> Set[int]:
+        """ID из списка, отсутствие которых уже известно."""
+        if not self.enabled:
+            return set()
+        keys = {self._key(object_id): object_id for object_id in object_ids}
+        return {keys[key] for key in self.cache.get_many(list(keys))}
+
+    def add(self, object_ids: Iterable[int]) -> None:
+        """Запомнить отсутствующие объекты."""
+        if self.enabled:
+            self.cache.set_many(
+                {self._key(object_id): 1 for object_id in object_ids},
+                timeout=self.ttl,
+            )
+
+    def discard(self, object_ids: Iterable[int]) -> None:
+        """Забыть об отсутствии объектов (объекты созданы)."""
+        if self.enabled:
+            self.cache.delete_many([self._key(object_id) for object_id in object_ids])
+
+
+def get_negative_cache(prefix: str) -> NegativeCache:
+    """Кэш отсутствующих объектов с настройками проекта."""
+    return NegativeCache(
+        prefix,
+        ttl=settings.NEGATIVE_CACHE_TTL,
+        cache_alias=settings.NEGATIVE_CACHE_ALIAS,
+    )
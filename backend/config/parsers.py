@@ -0,0 +1,28 @@
+"""
+Парсеры API.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - зависит от окружения
+    msgpack = None
+
+
+class MessagePackParser(BaseParser):
+    """
+    Парсер тела запроса в формате MessagePack (application/msgpack).
+
+    Возвращает те же dict/list, что и JSONParser, поэтому сериализаторы
+    и представления работают с ним без изменений.
+    """
+
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
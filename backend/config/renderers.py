@@ -0,0 +1,104 @@
+"""
+Рендереры API.
+"""
+
+import decimal
+import math
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - зависит от окружения
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - зависит от окружения
+    msgpack = None
+
+
+def _has_non_finite(data) -> bool:
+    """Есть ли в данных NaN или бесконечность."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(map(_has_non_finite, data.values()))
+    if isinstance(data, (list, tuple)):
+        return any(map(_has_non_finite, data))
+    if isinstance(data, decimal.Decimal):
+        return not data.is_finite()
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON рендерер на orjson.
+
+    Сериализует сразу в bytes, datetime/date/time/UUID кодирует сам,
+    остальные типы передает кодировщику DRF. Вывод совпадает с JSONRenderer
+    при настройках по умолчанию (UNICODE_JSON, COMPACT_JSON, STRICT_JSON).
+    Отступы, ensure_ascii, отсутствие orjson и данные, которые orjson
+    не кодирует (целые больше 64 бит), обрабатываются стандартным
+    JSONRenderer. orjson записывает NaN и бесконечность как null, поэтому
+    такие данные тоже передаются ему: в строгом режиме он выбрасывает
+    ValueError.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.encoder = self.encoder_class()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder.default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Данные без null не проверяются
+        if b"null" in ret and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Как и JSONRenderer, экранируем U+2028/U+2029 для совместимости с JS
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Рендерер MessagePack (application/msgpack).
+
+    Структура ответа совпадает с JSON: даты, UUID, Decimal и прочие типы,
+    которые msgpack не знает, приводятся кодировщиком DRF так же, как для
+    JSON. Регистрируется в настройках, только если установлен msgpack.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=self.encoder.default, use_bin_type=True)
@@ -3,6 +3,7 @@
 """
 
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 
 from decouple import config
@@ -123,10 +124,21 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Тип первичного ключа по умолчанию
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# JSON рендерер API: orjson с откатом на stdlib, либо стандартный рендерер DRF
+API_JSON_RENDERER = config(
+    "API_JSON_RENDERER", default="config.renderers.FastJSONRenderer"
+)
+
+# Бинарный формат MessagePack (Accept/Content-Type: application/msgpack),
+# доступен, если установлен msgpack. JSON остается форматом по умолчанию.
+API_MSGPACK_ENABLED = config(
+    "API_MSGPACK_ENABLED", default=find_spec("msgpack") is not None, cast=bool
+)
+
 # Настройки Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.infrastructure.authentication.StatelessJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -135,7 +147,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        API_JSON_RENDERER,
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -148,6 +160,61 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+if API_MSGPACK_ENABLED:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "config.renderers.MessagePackRenderer"
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append("config.parsers.MessagePackParser")
+
+# Пакетные операции с задачами
+TASKS_BULK_BATCH_SIZE = config("TASKS_BULK_BATCH_SIZE", default=500, cast=int)
+TASKS_BULK_MAX_ITEMS = config("TASKS_BULK_MAX_ITEMS", default=10000, cast=int)
+
+# Сколько последних комментариев встраивается в ответ с задачей
+TASKS_DETAIL_COMMENTS_LIMIT = config(
+    "TASKS_DETAIL_COMMENTS_LIMIT", default=20, cast=int
+)
+
+# Кэш Django. По умолчанию - память процесса; при нескольких процессах
+# нужен общий бэкенд, например CACHE_BACKEND=django.core.cache.backends.redis.
+# RedisCache и CACHE_LOCATION=redis://redis:6379/0 (нужен пакет redis) или
+# FileBasedCache с каталогом в CACHE_LOCATION
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+# Кэш чтения задач (сериализованные задачи и страницы списка). Счетчики
+# версий должны быть общими для всех процессов, поэтому по умолчанию кэш
+# включен только с общим бэкендом, а с LocMemCache не проходит проверку
+# при запуске (tasks.E001)
+TASKS_CACHE_ALIAS = config("TASKS_CACHE_ALIAS", default="default")
+TASKS_CACHE_ENABLED = config(
+    "TASKS_CACHE_ENABLED",
+    default=CACHES.get(TASKS_CACHE_ALIAS, {}).get("BACKEND")
+    not in (
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    ),
+    cast=bool,
+)
+TASKS_CACHE_TIMEOUT = config("TASKS_CACHE_TIMEOUT", default=300, cast=int)
+
+# Кэш отсутствующих задач и пользователей: повторные запросы несуществующих
+# ID не доходят до БД в течение TTL (0 - отключен)
+NEGATIVE_CACHE_TTL = config("NEGATIVE_CACHE_TTL", default=10, cast=int)
+NEGATIVE_CACHE_ALIAS = config("NEGATIVE_CACHE_ALIAS", default="default")
+
+# Кэш пользователей (USERS_CACHE_ALIAS - алиас из CACHES для общего кэша)
+USERS_CACHE_ENABLED = config("USERS_CACHE_ENABLED", default=True, cast=bool)
+USERS_CACHE_MAX_SIZE = config("USERS_CACHE_MAX_SIZE", default=10000, cast=int)
+USERS_CACHE_TTL = config("USERS_CACHE_TTL", default=300, cast=int)
+USERS_CACHE_ALIAS = config("USERS_CACHE_ALIAS", default="")
+
 # Настройки CORS
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -170,12 +237,32 @@ SPECTACULAR_SETTINGS = {
 
 # Настройки JWT
 
+# Пул хеширования паролей при входе и регистрации: число потоков и очередь.
+# Запросы сверх потоков и очереди сразу получают 503
+AUTH_HASHING_WORKERS = config("AUTH_HASHING_WORKERS", default=2, cast=int)
+AUTH_HASHING_QUEUE_SIZE = config("AUTH_HASHING_QUEUE_SIZE", default=16, cast=int)
+
+# Отложенная запись last_login: интервал (в секундах, 0 - сразу) и размер
+# буфера, при заполнении которого запись выполняется досрочно. Без новых
+# входов буфер раз в интервал записывает фоновый поток процесса
+LAST_LOGIN_FLUSH_INTERVAL = config("LAST_LOGIN_FLUSH_INTERVAL", default=30, cast=int)
+LAST_LOGIN_BUFFER_SIZE = config("LAST_LOGIN_BUFFER_SIZE", default=1000, cast=int)
+
+# Как часто (в секундах) JWT аутентификация перечитывает неактивных
+# пользователей; пользователь запроса строится из claims токена без SELECT
+JWT_INACTIVE_USERS_REFRESH = config("JWT_INACTIVE_USERS_REFRESH", default=60, cast=int)
+
+# Как часто (в секундах) фильтр черного списка refresh токенов подгружает
+# токены, отозванные в других процессах
+JWT_BLACKLIST_SYNC_INTERVAL = config("JWT_BLACKLIST_SYNC_INTERVAL", default=5, cast=int)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
-    "UPDATE_LAST_LOGIN": True,
+    # last_login пишет UserLoginAPIView через буфер (LAST_LOGIN_*)
+    "UPDATE_LAST_LOGIN": False,
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "VERIFYING_KEY": None,
@@ -13,10 +13,13 @@ DATABASES = {
 }
 
 
-# Отключаем миграции для ускорения тестов
+# Отключаем миграции для ускорения тестов. Миграции users создают
+# уникальные индексы auth_user, на которые опирается регистрация
 class DisableMigrations:
+    migrated_apps = {"users"}
+
     def __contains__(self, item):
-        return True
+        return item not in self.migrated_apps
 
     def __getitem__(self, item):
         return None
@@ -45,6 +48,12 @@ CACHES = {
     }
 }
 
+# Кэш пользователей переживает откат транзакций между тестами
+USERS_CACHE_ENABLED = False
+
+# last_login записывается сразу: буфер процесса переживает откат транзакций
+LAST_LOGIN_FLUSH_INTERVAL = 0
+
 # Простой хешер паролей для ускорения тестов
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
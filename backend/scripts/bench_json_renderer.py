@@ -0,0 +1,87 @@
+"""
+Бенчмарк рендереров API.
+
+Сравнивает JSONRenderer (DRF, stdlib json), FastJSONRenderer (orjson)
+и MessagePackRenderer на списке задач и на задаче с комментариями.
+База данных не используется.
+
+Запуск из каталога backend:
+    python scripts/bench_json_renderer.py [--tasks 1000] [--comments 50]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+from apps.tasks.endpoints.fast_serializers import (  # noqa: E402
+    serialize_task,
+    serialize_tasks,
+)
+from bench_task_serializer import build_tasks, measure  # noqa: E402
+from config import renderers  # noqa: E402
+from config.renderers import FastJSONRenderer, MessagePackRenderer  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if renderers.orjson is None:
+        print("orjson не установлен, FastJSONRenderer использует stdlib json")
+
+    payloads = {
+        "список": {
+            "count": args.tasks,
+            "next": None,
+            "previous": None,
+            "results": serialize_tasks(build_tasks(args.tasks, 3)),
+        },
+        "задача": serialize_task(build_tasks(1, args.comments)[0]),
+    }
+
+    for name, data in payloads.items():
+        stdlib = JSONRenderer()
+        fast = FastJSONRenderer()
+        assert fast.render(data) == stdlib.render(data)
+
+        results = [
+            (
+                "JSONRenderer",
+                len(stdlib.render(data)),
+                measure(lambda: stdlib.render(data), args.repeat),
+            ),
+            (
+                "FastJSONRenderer",
+                len(fast.render(data)),
+                measure(lambda: fast.render(data), args.repeat),
+            ),
+        ]
+        if renderers.msgpack is not None:
+            binary = MessagePackRenderer()
+            results.append(
+                (
+                    "MessagePackRenderer",
+                    len(binary.render(data)),
+                    measure(lambda: binary.render(data), args.repeat),
+                )
+            )
+
+        print(f"{name}:")
+        baseline = results[0][2]
+        for renderer, size, seconds in results:
+            print(
+                f"  {renderer:20} {size / 1024:7.0f} КБ {seconds * 1000:9.3f} мс "
+                f"ускорение {baseline / seconds:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Бенчмарк сериализации страницы задач.
+
+Сравнивает DomainTaskSerializer (DRF), быструю сериализацию в dict
+и нормализованное представление (?normalize=true) на странице из 1000
+доменных задач. База данных не используется.
+
+Запуск из каталога backend:
+    python scripts/bench_task_serializer.py [--tasks 1000] [--comments 3]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from apps.tasks.domain.entities import Task, TaskComment, TaskStatus  # noqa: E402
+from apps.tasks.endpoints.fast_serializers import (  # noqa: E402
+    DomainPayloadSerializer,
+    serialize_tasks,
+)
+from apps.tasks.endpoints.serializers import DomainTaskSerializer  # noqa: E402
+from apps.users.domain.entities import User  # noqa: E402
+
+
+def build_tasks(count, comments_per_task, users_count=50):
+    """Построить страницу задач с общими пользователями."""
+    users = [
+        User(
+            id=i,
+            username=f"user{i}",
+            first_name="Имя",
+            last_name="Фамилия",
+            email=f"user{i}@example.com",
+        )
+        for i in range(1, users_count + 1)
+    ]
+    now = datetime.datetime.now(datetime.timezone.utc)
+    tasks = []
+    for i in range(count):
+        comments = [
+            TaskComment(
+                id=i * comments_per_task + j,
+                content=f"Комментарий {j} к задаче {i}",
+                author=users[(i + j) % users_count],
+                task_id=i,
+                created_at=now,
+            )
+            for j in range(comments_per_task)
+        ]
+        tasks.append(
+            Task(
+                id=i,
+                title=f"Задача {i}",
+                description="Описание задачи " * 5,
+                status=TaskStatus.IN_PROGRESS,
+                created_at=now,
+                updated_at=now,
+                assigned_to=users[i % users_count] if i % 3 else None,
+                created_by=users[(i * 7) % users_count],
+                comments=comments,
+                comment_count=comments_per_task,
+                last_comment_at=now if comments else None,
+            )
+        )
+    return tasks
+
+
+def measure(func, repeat):
+    """Лучшее время одного вызова из repeat запусков."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.tasks, args.comments)
+
+    # Результаты обоих путей должны совпадать
+    assert serialize_tasks(tasks) == DomainTaskSerializer(tasks, many=True).data
+
+    def normalized():
+        payload = DomainPayloadSerializer(normalize=True)
+        return {"results": payload.tasks(tasks), "included": payload.included()}
+
+    drf = measure(lambda: DomainTaskSerializer(tasks, many=True).data, args.repeat)
+    fast = measure(lambda: serialize_tasks(tasks), args.repeat)
+    normalize = measure(normalized, args.repeat)
+
+    print(f"Задач на странице: {args.tasks}, комментариев на задачу: {args.comments}")
+    for name, seconds, data in (
+        ("DomainTaskSerializer", drf, serialize_tasks(tasks)),
+        ("serialize_tasks", fast, serialize_tasks(tasks)),
+        ("normalize=true", normalize, normalized()),
+    ):
+        size = len(json.dumps(data, ensure_ascii=False).encode())
+        print(
+            f"{name:22} {seconds * 1000:9.2f} мс/страница "
+            f"{args.tasks / seconds:12.0f} задач/с {size / 1024:8.0f} КБ JSON"
+        )
+    print(f"Ускорение: {drf / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()